@@ -4,7 +4,7 @@
 작업 상태를 관리하는 API를 제공합니다.
 """
 
-from flask import Flask, jsonify, request, send_from_directory, send_file, Response
+from flask import Flask, jsonify, request, Response, g
 from flask_cors import CORS
 import json
 import os
@@ -12,32 +12,47 @@ import logging
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 from utils.api_client import BigkindsClient
-from utils.gpt_client import GPTClient
+from utils.content_store import ContentStore
+from utils.pregen_scheduler import PregenScheduler, PriorityRules, parse_weights
+from utils.warmup_scheduler import WarmupScheduler, parse_hours
+from utils.event_broker import EventBroker
+from utils.shared_state import SharedStateBus
+from utils.status_snapshot import SnapshotWriter, SnapshotError, read_snapshot
+from utils.status_archive import StatusArchive, estimate_status_bytes
+from utils.news_cache import NewsDayCache
+from utils.columnar import encode_columnar
+from utils.facets import hour_label
+from utils.revalidate import Revalidator, register_exit_hook
+from utils.status_store import StatusStore
+from utils.metrics import registry as metrics_registry, SIZE_BUCKETS
+from utils.log_config import configure_logging, get_logging_stats
+from utils.profiling import span, begin_spans, end_spans, server_timing, StackSampler, ProfileStore
 import mimetypes
 import subprocess
 from static_serve import StaticFileHandler
 import time
+import atexit
 import threading
+import hmac
+from concurrent.futures import TimeoutError as FutureTimeoutError
 
 # .env 파일 로드 (가장 먼저)
 load_dotenv()
 
-# 환경변수 로딩 확인
-print(f"현재 작업 디렉토리: {os.getcwd()}")
-print(f".env 파일 존재 여부: {os.path.exists('.env')}")
-openai_key = os.getenv('OPENAI_API_KEY')
-print(f"OpenAI API 키 로드됨: {'예' if openai_key else '아니오'}")
-if openai_key:
-    print(f"API 키 앞 20자: {openai_key[:20]}...")
+# 로깅 설정 - 요청 스레드는 큐에 넣기만 하고 출력은 별도 스레드에서 (LOG_LEVEL, LOG_LEVELS, LOG_FORMAT)
+configure_logging()
+logger = logging.getLogger(__name__)
+
+# 환경변수 로딩 확인 (키 값은 기록하지 않음)
+logger.info("현재 작업 디렉토리: %s", os.getcwd())
+logger.info(".env 파일 존재 여부: %s", os.path.exists('.env'))
+logger.info("OpenAI API 키 로드됨: %s", '예' if os.getenv('OPENAI_API_KEY') else '아니오')
 
 # Flask 애플리케이션 초기화
-app = Flask(__name__, static_folder='static', static_url_path='')
+# 정적 파일은 StaticFileHandler 인덱스로 서빙 (Flask 기본 정적 라우트가 SPA 라우트를 가리지 않도록 비활성화)
+app = Flask(__name__, static_folder=None)
 CORS(app)  # CORS 설정 - 모든 도메인에서의 요청 허용
 
-# 로깅 설정
-logging.basicConfig(level=logging.DEBUG)
-logger = logging.getLogger(__name__)
-
 # MIME 타입 초기화
 mimetypes.init()
 mimetypes.add_type('application/javascript', '.js')
@@ -46,51 +61,239 @@ mimetypes.add_type('text/css', '.css')
 # 빅카인즈 API 클라이언트 초기화
 api_client = BigkindsClient()
 
-# GPT API 클라이언트 초기화
-try:
-    logger.info("GPT 클라이언트 초기화 시작...")
-    
-    gpt_client = GPTClient()
-    logger.info("GPT 클라이언트 초기화 완료")
-except Exception as e:
-    logger.error(f"GPT 클라이언트 초기화 실패: {e}")
-    logger.error(f"오류 타입: {type(e).__name__}")
-    import traceback
-    logger.error(f"전체 스택 트레이스: {traceback.format_exc()}")
-    gpt_client = None
+# GPT API 클라이언트 (openai SDK 임포트가 시작 시간의 대부분을 차지하므로 처음 사용할 때 초기화)
+_gpt_client = None
+_gpt_client_initialized = False
+_gpt_client_lock = threading.Lock()
+
+def get_gpt_client():
+    """GPT 클라이언트 조회 (첫 호출 시 생성, 초기화 실패 시 None)"""
+    global _gpt_client, _gpt_client_initialized
+    if _gpt_client_initialized:
+        return _gpt_client
+    with _gpt_client_lock:
+        if not _gpt_client_initialized:
+            try:
+                logger.info("GPT 클라이언트 초기화 시작...")
+                from utils.gpt_client import GPTClient
+                _gpt_client = GPTClient()
+                logger.info("GPT 클라이언트 초기화 완료")
+            except Exception as e:
+                logger.error("GPT 클라이언트 초기화 실패: %s (%s)", e, type(e).__name__)
+                logger.debug("GPT 클라이언트 초기화 스택 트레이스", exc_info=True)
+                _gpt_client = None
+            _gpt_client_initialized = True
+    return _gpt_client
 
 # 정적 파일 핸들러 초기화
-static_handler = StaticFileHandler(os.getcwd())
+static_handler = StaticFileHandler(
+    os.getcwd(),
+    # 개발 환경에서는 빌드 파일 변경(mtime)을 감지하여 다시 읽음
+    reload=os.getenv('FLASK_ENV') != 'production',
+    max_file_size=int(os.getenv('STATIC_CACHE_MAX_FILE_SIZE', str(5 * 1024 * 1024)))
+)
 
 # 뉴스 상태 데이터 저장소 (실제 환경에서는 데이터베이스 사용 권장)
-# { news_id: { "status": "미진행" | "작업중" | "작업완료", "ai_content": "생성된 콘텐츠" } }
-news_status = {}
+# { news_id: { "status": "미진행" | "작업중" | "작업완료", "has_content": bool } }
+# 생성된 콘텐츠 본문은 content_store에 별도로 보관
+# 여러 요청 스레드가 동시에 쓰므로 조각별 잠금 저장소 사용 - 레코드는 제자리에서 고치지 않고
+# update_record()/setdefault()로 교체하며, 전체 순회는 snapshot()/count_by()로
+news_status = StatusStore(shards=int(os.getenv('STATUS_STORE_SHARDS', '16')))
+
+# 새로 본 뉴스의 기본 상태
+DEFAULT_STATUS = {'status': '미진행', 'has_content': False}
 
-# 상태 파일 경로
+# 상태 파일 경로 (JSON은 가져오기/내보내기용, 평소 저장은 바이너리 스냅샷)
 STATUS_FILE = "news_status.json"
+STATUS_SNAPSHOT_FILE = os.getenv('STATUS_SNAPSHOT_FILE', 'news_status.snapshot')
 
-# 상태 파일 로드
+# 생성 콘텐츠 저장 디렉토리
+CONTENT_DIR = "ai_contents"
+
+# 생성 콘텐츠 저장소 초기화
+content_store = ContentStore(CONTENT_DIR)
+
+# 워커 간 상태/이벤트 공유 (SHARED_STATE_DB 지정 시 - gunicorn 다중 워커용)
+# 지정하면 상태는 SQLite에 저장되고, JSON 상태 파일은 최초 가져오기에만 사용
+SHARED_STATE_DB = os.getenv('SHARED_STATE_DB', '')
+shared_state = SharedStateBus(
+    SHARED_STATE_DB,
+    poll_interval=float(os.getenv('SHARED_STATE_POLL_INTERVAL', '0.1'))
+) if SHARED_STATE_DB else None
+
+# 상태 레코드에 남아 있는 콘텐츠 본문을 콘텐츠 저장소로 이전
+def migrate_inline_content():
+    migrated = 0
+    for news_id, info in news_status.items():
+        if 'ai_content' not in info:
+            continue
+        info = dict(info)
+        ai_content = info.pop('ai_content')
+        if ai_content:
+            content_store.put(news_id, ai_content, info.get('ai_generated_at'))
+            migrated += 1
+        info['has_content'] = bool(ai_content) or info.get('has_content', False)
+        news_status[news_id] = info
+    return migrated
+
+# 상태 파일 로드 (스냅샷이 없으면 JSON 상태 파일을 가져와 스냅샷으로 전환)
 def load_status():
-    global news_status
     try:
-        if os.path.exists(STATUS_FILE):
+        snapshot = None
+        try:
+            snapshot = read_snapshot(STATUS_SNAPSHOT_FILE)
+        except SnapshotError as e:
+            logger.warning("상태 스냅샷을 읽을 수 없어 JSON 상태 파일을 사용합니다: %s", e)
+        
+        if snapshot is not None:
+            news_status.replace_all(snapshot)
+            logger.info("상태 스냅샷 로드 완료: %d 개의 뉴스", len(news_status))
+        elif os.path.exists(STATUS_FILE):
             with open(STATUS_FILE, 'r', encoding='utf-8') as f:
-                news_status = json.load(f)
-            print(f"상태 데이터 로드 완료: {len(news_status)} 개의 뉴스")
+                news_status.replace_all(json.load(f))
+            logger.info("상태 데이터 로드 완료: %d 개의 뉴스", len(news_status))
+            migrated = migrate_inline_content()
+            if migrated:
+                logger.info("생성 콘텐츠 %d개를 콘텐츠 저장소로 이전", migrated)
+            # 다음 시작부터는 스냅샷에서 로드
+            snapshot_writer.mark_dirty()
+        
+        if shared_state:
+            shared_state.import_status(news_status.snapshot())
+            news_status.replace_all(shared_state.load_status())
+            logger.info("공유 상태 로드 완료: %d 개의 뉴스", len(news_status))
     except Exception as e:
-        print(f"상태 데이터 로드 중 오류 발생: {e}")
+        logger.error("상태 데이터 로드 중 오류 발생: %s", e)
 
 # 상태 파일 저장
 def save_status():
-    try:
-        with open(STATUS_FILE, 'w', encoding='utf-8') as f:
-            json.dump(news_status, f, ensure_ascii=False, indent=2)
-        print("상태 데이터 저장 완료")
-    except Exception as e:
-        print(f"상태 데이터 저장 중 오류 발생: {e}")
+    # 공유 모드에서는 변경된 레코드만 add_update_event / insert_missing 에서 SQLite에 기록
+    if shared_state:
+        return
+    # 로드 전에 저장하면 기존 상태 파일을 빈 상태로 덮어쓰게 됨
+    if not _status_loaded.is_set():
+        return
+    # 변경 표시만 하고 스냅샷 저장은 주기적으로/종료 시 한 번에 수행
+    snapshot_writer.mark_dirty()
+
+# 상태 스냅샷 저장 (변경이 있을 때 주기적으로, 그리고 프로세스 종료 시)
+snapshot_writer = SnapshotWriter(
+    STATUS_SNAPSHOT_FILE,
+    news_status.snapshot,
+    interval=float(os.getenv('STATUS_SNAPSHOT_INTERVAL', '5'))
+)
+if not shared_state:
+    snapshot_writer.start()
+    atexit.register(snapshot_writer.stop)
+
+# 오래된 뉴스 상태 보관 (발행일 기준 STATUS_HOT_DAYS일이 지난 상태는 날짜별 파일로 옮기고, 조회 시 다시 불러옴)
+# 공유 모드에서는 상태가 SQLite에 있으므로 사용하지 않음 (0이면 비활성화)
+STATUS_HOT_DAYS = int(os.getenv('STATUS_HOT_DAYS', '14'))
+status_archive = StatusArchive(
+    os.getenv('STATUS_ARCHIVE_DIR', 'status_archive'),
+    hot_days=STATUS_HOT_DAYS
+) if STATUS_HOT_DAYS > 0 and not shared_state else None
+
+def fault_in_status(dates=None, news_id=None):
+    """보관된 날짜/뉴스의 상태를 메모리로 불러옴"""
+    if not status_archive:
+        return
+    if dates:
+        status_archive.fault_in(news_status, dates)
+    if news_id:
+        status_archive.fault_in_news(news_status, news_id)
+
+# 상태 데이터는 첫 API 요청 때 로드 (헬스 체크 등 시작 직후 응답을 늦추지 않도록)
+_status_loaded = threading.Event()
+_status_lock = threading.Lock()
+
+def ensure_status_loaded():
+    """상태 데이터가 아직 로드되지 않았으면 로드"""
+    if _status_loaded.is_set():
+        return
+    with _status_lock:
+        if not _status_loaded.is_set():
+            load_status()
+            _status_loaded.set()
+            if status_archive:
+                # 보관 기간이 지난 상태를 정리한 뒤 주기적으로 반복
+                if status_archive.archive(news_status):
+                    save_status()
+                status_archive.start(
+                    lambda: news_status, save_status,
+                    interval=float(os.getenv('STATUS_ARCHIVE_INTERVAL', '3600'))
+                )
 
-# 애플리케이션 시작 시 상태 데이터 로드
-load_status()
+# 공유 모드에서는 변경 로그 위치가 이벤트 ID 시작점이 되므로 시작 시 로드
+if shared_state:
+    ensure_status_loaded()
+
+@app.before_request
+def load_status_before_api_request():
+    """API 요청 전에 상태 데이터 로드 보장"""
+    if request.path.startswith('/api/'):
+        ensure_status_loaded()
+
+# 라우트별 요청 지표 (/metrics)
+http_requests = metrics_registry.counter(
+    'http_requests_total', '라우트별 요청 수', labels=('route', 'method', 'status'))
+http_latency = metrics_registry.histogram(
+    'http_request_duration_seconds', '라우트별 응답 시간(초)', labels=('route', 'method'))
+http_response_bytes = metrics_registry.histogram(
+    'http_response_bytes', '라우트별 응답 크기(바이트)', labels=('route',), buckets=SIZE_BUCKETS)
+generate_cache = metrics_registry.counter(
+    'generate_cache_total', '생성 콘텐츠 캐시 조회 결과 수', labels=('result',))
+
+@app.before_request
+def start_request_timer():
+    """요청 처리 시간 측정 시작"""
+    g.request_started = time.perf_counter()
+
+# 요청 단위 프로파일링 (PROFILE_SECRET을 설정했을 때만 동작)
+# 요청에 X-Profile: <비밀값> 헤더를 붙이면 해당 요청의 스택을 샘플링해 PROFILE_DIR에 folded 보고서로 저장하고
+# 응답에 Server-Timing(단계별 시간)과 X-Profile-Report(보고서 이름) 헤더를 붙임
+PROFILE_SECRET = os.getenv('PROFILE_SECRET', '')
+PROFILE_SAMPLE_INTERVAL = float(os.getenv('PROFILE_SAMPLE_INTERVAL', '0.005'))
+profile_store = ProfileStore(os.getenv('PROFILE_DIR', 'profiles'), keep=int(os.getenv('PROFILE_KEEP', '50')))
+
+def profile_secret_matches(value):
+    """프로파일링 비밀값 확인 (설정되지 않았으면 항상 거부)"""
+    return bool(PROFILE_SECRET) and bool(value) and hmac.compare_digest(value.encode(), PROFILE_SECRET.encode())
+
+@app.before_request
+def start_request_profile():
+    """X-Profile 헤더가 올바르면 이 요청의 구간 기록과 스택 샘플링 시작"""
+    if not PROFILE_SECRET or not profile_secret_matches(request.headers.get('X-Profile')):
+        return
+    g.profile_spans = begin_spans()
+    g.profile_sampler = StackSampler([threading.get_ident()], PROFILE_SAMPLE_INTERVAL).start()
+
+@app.after_request
+def finish_request_profile(response):
+    """프로파일링 중인 요청이면 보고서 저장 후 응답 헤더 추가"""
+    sampler = g.pop('profile_sampler', None)
+    if sampler is None:
+        return response
+    sampler.stop()
+    spans = end_spans(g.pop('profile_spans'))
+    label = f"{request.method}-{request.url_rule.rule if request.url_rule else request.path}"
+    name = profile_store.save(label, sampler.folded(), spans)
+    response.headers['Server-Timing'] = server_timing(spans + [('total', sampler.duration)])
+    response.headers['X-Profile-Report'] = name
+    response.headers['X-Profile-Samples'] = str(sampler.sample_count)
+    return response
+
+@app.after_request
+def record_request_metrics(response):
+    """라우트 패턴 단위로 요청 수/응답 시간/응답 크기 기록 (스트리밍 응답은 응답 시작까지의 시간)"""
+    started = g.pop('request_started', None)
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        http_latency.observe(time.perf_counter() - started, route, request.method)
+        http_requests.inc(route, request.method, str(response.status_code))
+        if not response.is_streamed and response.content_length is not None:
+            http_response_bytes.observe(response.content_length, route)
+    return response
 
 # 디버깅: 현재 디렉토리 구조 출력
 def debug_directory_structure():
@@ -126,10 +329,228 @@ def debug_directory_structure():
     
     logger.info("=" * 80)
 
-# 애플리케이션 시작 시 디버깅 함수 실행
+# 애플리케이션 시작 시 디버깅 함수 실행 (시작을 늦추지 않도록 백그라운드에서 출력)
 if os.getenv('FLASK_ENV') != 'production' or os.getenv('DEBUG_MODE') == 'true':
-    with app.app_context():
-        debug_directory_structure()
+    threading.Thread(target=debug_directory_structure, name='debug-structure', daemon=True).start()
+
+def lookup_status(news_id):
+    """집계용 상태 조회 (보관된 상태는 /api/news와 같이 다시 불러와서 셈)"""
+    record = news_status.get(news_id)
+    if record is None and status_archive:
+        fault_in_status(news_id=news_id)
+        record = news_status.get(news_id)
+    return (record or {}).get('status')
+
+# 빅카인즈 일자별 검색 결과 캐시 (기사는 압축 레코드로 보관하고 응답 시 dict로 변환)
+news_cache = NewsDayCache(
+    max_entries=int(os.getenv('NEWS_CACHE_MAX_ENTRIES', '16')),
+    today_ttl=float(os.getenv('NEWS_CACHE_TODAY_TTL', '60')),
+    past_ttl=float(os.getenv('NEWS_CACHE_PAST_TTL', '3600')),
+    status_lookup=lookup_status,
+    max_stale=float(os.getenv('NEWS_CACHE_MAX_STALE', '86400'))
+)
+
+def extract_documents(result):
+    """빅카인즈 응답에서 기사 목록 추출 (응답 구조 차이 호환)"""
+    if isinstance(result, dict):
+        if isinstance(result.get('result'), list):
+            # 기존 구조 호환
+            return result.get('result', [])
+        if 'return_object' in result and 'documents' in result['return_object']:
+            return result['return_object']['documents']
+    return []
+
+def fetch_from_upstream(selected_date, query, limit):
+    """빅카인즈에서 하루치 기사를 받아 캐시에 저장 (재조회 스레드에서 실행)"""
+    start_date = datetime.strptime(selected_date, '%Y-%m-%d')
+    until_date = (start_date + timedelta(days=1)).strftime('%Y-%m-%d')
+    result = api_client.get_news(
+        query=query,
+        from_date=selected_date,
+        until_date=until_date,
+        provider=[],
+        return_size=limit
+    )
+    return news_cache.put(selected_date, query, limit, extract_documents(result))
+
+# 같은 검색의 빅카인즈 조회는 하나로 묶어 백그라운드 스레드에서 실행
+news_revalidator = Revalidator(fetch_from_upstream, max_workers=int(os.getenv('NEWS_REFRESH_WORKERS', '2')))
+
+# 캐시가 없을 때 빅카인즈 응답을 기다리는 최대 시간(초) - 넘으면 일부 결과나 504로 응답하고 조회는 뒤에서 계속
+NEWS_DEADLINE_SECONDS = float(os.getenv('NEWS_DEADLINE_SECONDS', '10'))
+
+class NewsDeadlineExceeded(Exception):
+    """마감 시간 안에 기사 목록을 준비하지 못함"""
+
+def freshness_info(freshness, snapshot, refreshing=False, reason=None):
+    """응답에 붙일 신선도 정보 (fresh | stale | partial, 결과 경과 시간, 재조회 중 여부)"""
+    info = {'freshness': freshness, 'age_seconds': round(snapshot.age(), 1), 'refreshing': refreshing}
+    if reason:
+        info['reason'] = reason
+    return info
+
+def freshness_headers(info):
+    """신선도 정보 응답 헤더 (Age는 표준 헤더)"""
+    return {'X-News-Freshness': info['freshness'], 'Age': str(int(info['age_seconds']))}
+
+def deadline_response():
+    """마감 시간 초과 응답 (조회는 계속되므로 잠시 후 재시도하면 캐시에서 받음)"""
+    return jsonify({
+        'success': False,
+        'message': '빅카인즈 응답이 늦어지고 있습니다. 잠시 후 다시 시도해주세요.',
+        'freshness': 'pending'
+    }), 504, {'Retry-After': str(max(1, int(NEWS_DEADLINE_SECONDS / 2)))}
+
+def fetch_day_snapshot(query, selected_date, limit):
+    """
+    하루치 기사 조회 (stale-while-revalidate, 마감 시간)
+    - 유효한 캐시가 있으면 그대로 (fresh)
+    - 유효 시간이 지난 캐시가 있으면 바로 내주고 뒤에서 재조회 (stale)
+    - 캐시가 없으면 마감 시간까지 재조회를 기다림 (fresh)
+      넘거나 실패하면 같은 날짜의 더 적은 개수 결과로 (partial), 그것도 없으면 예외
+    
+    Returns:
+        tuple: (DaySnapshot, 신선도 정보 dict)
+    """
+    today = datetime.now().strftime('%Y-%m-%d')
+    snapshot, state = news_cache.lookup(selected_date, query, limit, today)
+    if state == 'fresh':
+        return snapshot, freshness_info('fresh', snapshot)
+    
+    future = news_revalidator.submit(selected_date, query, limit)
+    if snapshot is not None:
+        return snapshot, freshness_info('stale', snapshot, refreshing=True)
+    
+    try:
+        snapshot = future.result(timeout=NEWS_DEADLINE_SECONDS)
+        return snapshot, freshness_info('fresh', snapshot)
+    except FutureTimeoutError:
+        error, reason = NewsDeadlineExceeded(f"{NEWS_DEADLINE_SECONDS}초 안에 빅카인즈 응답 없음"), 'deadline'
+    except Exception as e:
+        error, reason = e, 'upstream_error'
+    
+    fallback = news_cache.closest(selected_date, query, limit)
+    if fallback is not None:
+        return fallback, freshness_info('partial', fallback, refreshing=not future.done(), reason=reason)
+    raise error
+
+def enrich_news(news, new_records):
+    """
+    기사 dict에 상태 정보를 붙이고 카테고리를 정리합니다.
+    처음 보는 뉴스는 '미진행' 상태로 등록하고 new_records에 모읍니다.
+    """
+    news_id = news.get('news_id')
+    record = news_status.get(news_id)
+    if record is None:
+        # 상태 정보가 없으면 '미진행' 상태로 초기화
+        record = news_status.setdefault(news_id, dict(DEFAULT_STATUS))
+        new_records[news_id] = record
+    news['status'] = record.get('status', '미진행')
+    news['has_content'] = record.get('has_content', False)
+
+    # 카테고리 정보 처리 (배열인 경우 첫 번째 값 사용)
+    if 'category' in news and isinstance(news['category'], list):
+        news['category'] = news['category'][0] if news['category'] else None
+    return news
+
+# 스트리밍 응답에서 한 번에 내보내는 기사 수
+NEWS_STREAM_BATCH = int(os.getenv('NEWS_STREAM_BATCH', '200'))
+
+def stream_news_ndjson(snapshot, freshness, selected_date, limit):
+    """
+    /api/news 스트리밍 응답 (NDJSON - 한 줄에 JSON 하나)
+    첫 줄은 메타 정보(신선도 포함), 이어서 기사 한 줄씩, 마지막 줄은 완료 정보입니다.
+    기사는 캐시의 압축 레코드에서 하나씩 만들어 바로 내보내므로 응답 전체를 메모리에 만들지 않습니다.
+
+        {"type": "meta", "total": 10000, "requested_limit": 10000, "freshness": "fresh", "age_seconds": 3.2, ...}
+        {"news_id": "...", "title": "...", "status": "미진행", ...}
+        {"type": "end", "actual_count": 10000}
+    """
+    def line(item):
+        return json.dumps(item, ensure_ascii=False) + '\n'
+
+    def generate():
+        try:
+            with span('fault_in'):
+                fault_in_status(dates=[selected_date])
+            yield line(dict(freshness, type='meta', total=len(snapshot.articles), requested_limit=limit))
+
+            new_records = {}
+            batch = []
+            lines = []
+            count = 0
+            for news in snapshot.iter_dicts():
+                enrich_news(news, new_records)
+                lines.append(line(news))
+                batch.append(news)
+                count += 1
+                if len(lines) >= NEWS_STREAM_BATCH:
+                    if pregen_scheduler:
+                        pregen_scheduler.submit(batch, selected_date)
+                    yield ''.join(lines)
+                    lines = []
+                    batch = []
+            if pregen_scheduler and batch:
+                pregen_scheduler.submit(batch, selected_date)
+            if lines:
+                yield ''.join(lines)
+
+            with span('save_status'):
+                save_status()
+                if shared_state:
+                    shared_state.insert_missing(new_records)
+            yield line({'type': 'end', 'actual_count': count})
+        except Exception as e:
+            # 상태 코드는 이미 보냈으므로 오류도 한 줄로 알림
+            logger.exception("뉴스 스트리밍 오류")
+            yield line({'type': 'error', 'message': str(e)})
+
+    return Response(generate(), mimetype='application/x-ndjson', headers=dict(freshness_headers(freshness), **{
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'
+    }))
+
+@app.route('/api/news/cache/stats', methods=['GET'])
+def get_news_cache_stats():
+    """일자별 기사 캐시 상태를 제공하는 API 엔드포인트"""
+    stats = news_cache.get_stats()
+    stats['revalidation'] = news_revalidator.get_stats()
+    stats['warmup'] = news_warmup.get_stats() if news_warmup else {'enabled': False}
+    return jsonify({
+        'success': True,
+        'data': stats
+    })
+
+@app.route('/api/news/facets', methods=['GET'])
+def get_news_facets():
+    """
+    날짜별 기사 집계(언론사/카테고리/시간대/상태별 수)를 제공하는 API 엔드포인트
+    /api/news 와 같은 검색 조건(date, query, limit)의 캐시된 결과마다 한 번 세어 두고 변경분만 반영합니다.
+    """
+    try:
+        query = request.args.get('query', '')
+        selected_date = request.args.get('date', '') or datetime.now().strftime('%Y-%m-%d')
+        limit = min(request.args.get('limit', 1000, type=int), 10000)
+        
+        with span('upstream'):
+            snapshot, freshness = fetch_day_snapshot(query, selected_date, limit)
+        # 보관된 날짜면 상태를 먼저 불러와야 상태별 수가 맞음
+        with span('fault_in'):
+            fault_in_status(dates=[selected_date])
+        with span('facets'):
+            facets = news_cache.facets_for(snapshot).to_dict()
+        
+        return jsonify({
+            'success': True,
+            'data': dict(facets, date=selected_date, query=query, limit=limit, **freshness)
+        }), 200, freshness_headers(freshness)
+    except NewsDeadlineExceeded:
+        return deadline_response()
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 500
 
 @app.route('/api/news', methods=['GET'])
 def get_news():
@@ -148,63 +569,55 @@ def get_news():
         if not selected_date:
             selected_date = datetime.now().strftime('%Y-%m-%d')
         
-        from_date = selected_date
-        start_date = datetime.strptime(selected_date, '%Y-%m-%d')
-        until_date = (start_date + timedelta(days=1)).strftime('%Y-%m-%d')
-        
-        # API로 뉴스 데이터 가져오기
-        result = api_client.get_news(
-            query=query, 
-            from_date=from_date, 
-            until_date=until_date,
-            provider=[],
-            return_size=limit  # 실제 limit 값 사용
-        )
+        # API로 뉴스 데이터 가져오기 (일자별 캐시 사용, 만료된 캐시는 바로 내주고 뒤에서 갱신)
+        with span('upstream'):
+            snapshot, freshness = fetch_day_snapshot(query, selected_date, limit)
         
-        # ----- 변경 시작: 응답 구조에 맞게 documents 추출 -----
-        if isinstance(result, dict):
-            if isinstance(result.get('result'), list):
-                # 기존 구조 호환
-                news_list = result.get('result', [])
-            elif 'return_object' in result and 'documents' in result['return_object']:
-                news_list = result['return_object']['documents']
-            else:
-                news_list = []
-        else:
-            news_list = []
-        # ----- 변경 끝 -----
-        
-        # 뉴스 상태 정보 추가
-        for news in news_list:
-            news_id = news.get('news_id')
-            if news_id in news_status:
-                news['status'] = news_status[news_id]['status']
-                news['ai_content'] = news_status[news_id].get('ai_content', '')
-            else:
-                # 상태 정보가 없으면 '미진행' 상태로 초기화
-                news['status'] = '미진행'
-                news['ai_content'] = ''
-                news_status[news_id] = {'status': '미진행', 'ai_content': ''}
-            
-            # 카테고리 정보 처리 (배열인 경우 첫 번째 값 사용)
-            if 'category' in news and isinstance(news['category'], list):
-                news['category'] = news['category'][0] if news['category'] else None
+        # 스트리밍 모드: 기사를 가공하는 대로 한 줄씩 전송
+        if request.args.get('format') == 'ndjson':
+            return stream_news_ndjson(snapshot, freshness, selected_date, limit)
+        
+        news_list = snapshot.to_dicts()
+        
+        # 보관된 날짜면 상태를 다시 불러온 뒤 뉴스 상태 정보 추가
+        with span('fault_in'):
+            fault_in_status(dates=[selected_date])
+        with span('enrich'):
+            new_records = {}
+            for news in news_list:
+                enrich_news(news, new_records)
             
             # 디버깅: 첫 번째 기사의 필드 정보 출력
-            if news_list.index(news) == 0:
-                logger.debug("첫 번째 기사 필드 정보: %s", list(news.keys()))
+            if news_list:
+                logger.debug("첫 번째 기사 필드 정보: %s", list(news_list[0].keys()))
         
         # 상태 정보 저장
-        save_status()
+        with span('save_status'):
+            save_status()
+            if shared_state:
+                shared_state.insert_missing(new_records)
         
-        return jsonify({
-            'success': True,
-            'data': news_list,
-            'total': len(news_list),
-            'requested_limit': limit,
-            'actual_count': len(news_list)
-        })
+        # 오늘 기사는 사전 생성 후보로 등록
+        if pregen_scheduler:
+            pregen_scheduler.submit(news_list, selected_date)
+        
+        with span('serialize'):
+            # 열 형식: 필드 이름을 기사마다 반복하지 않고 필드별 배열로 (프론트엔드 훅에서 되돌림)
+            columnar = request.args.get('format') == 'columnar'
+            response = jsonify({
+                'success': True,
+                'format': 'columnar' if columnar else 'rows',
+                'data': encode_columnar(news_list) if columnar else news_list,
+                'total': len(news_list),
+                'requested_limit': limit,
+                'actual_count': len(news_list),
+                **freshness
+            })
+        response.headers.update(freshness_headers(freshness))
+        return response
         
+    except NewsDeadlineExceeded:
+        return deadline_response()
     except Exception as e:
         return jsonify({
             'success': False,
@@ -231,12 +644,11 @@ def update_news_status():
                 'message': '상태는 미진행, 작업중, 작업완료 중 하나여야 합니다.'
             }), 400
             
-        # 상태 업데이트
-        if news_id not in news_status:
-            news_status[news_id] = {'status': '미진행', 'ai_content': ''}
-        
-        news_status[news_id]['status'] = status
-        news_status[news_id]['updated_at'] = datetime.now().isoformat()
+        # 상태 업데이트 (보관된 뉴스면 먼저 불러옴)
+        fault_in_status(news_id=news_id)
+        fields = {'status': status, 'updated_at': datetime.now().isoformat()}
+        news_status.update_record(news_id, DEFAULT_STATUS, **fields)
+        news_cache.status_changed(news_id, status)
         
         # 상태 저장
         save_status()
@@ -245,8 +657,8 @@ def update_news_status():
         add_update_event('status_change', {
             'news_id': news_id,
             'status': status,
-            'updated_at': datetime.now().isoformat()
-        })
+            'updated_at': fields['updated_at']
+        }, fields=fields)
         
         return jsonify({
             'success': True,
@@ -275,83 +687,57 @@ def get_news_by_hours():
         if not selected_date:
             selected_date = datetime.now().strftime('%Y-%m-%d')
         
-        from_date = selected_date
-        start_date = datetime.strptime(selected_date, '%Y-%m-%d')
-        until_date = (start_date + timedelta(days=1)).strftime('%Y-%m-%d')
-        
-        # API로 뉴스 데이터 가져오기
-        result = api_client.get_news(
-            query=query, 
-            from_date=from_date, 
-            until_date=until_date,
-            provider=[],
-            return_size=limit
-        )
+        # API로 뉴스 데이터 가져오기 (일자별 캐시 사용, 만료된 캐시는 바로 내주고 뒤에서 갱신)
+        with span('upstream'):
+            snapshot, freshness = fetch_day_snapshot(query, selected_date, limit)
+        news_list = snapshot.to_dicts()
         
-        # 응답 구조에 맞게 documents 추출
-        if isinstance(result, dict):
-            if isinstance(result.get('result'), list):
-                news_list = result.get('result', [])
-            elif 'return_object' in result and 'documents' in result['return_object']:
-                news_list = result['return_object']['documents']
-            else:
-                news_list = []
-        else:
-            news_list = []
+        # 보관된 날짜면 상태를 다시 불러옴
+        with span('fault_in'):
+            fault_in_status(dates=[selected_date])
         
         # 시간대별로 그룹화
-        hourly_articles = {}
-        for news in news_list:
-            # 뉴스 상태 정보 추가
-            news_id = news.get('news_id')
-            if news_id in news_status:
-                news['status'] = news_status[news_id]['status']
-                news['ai_content'] = news_status[news_id].get('ai_content', '')
-            else:
-                news['status'] = '미진행'
-                news['ai_content'] = ''
-                news_status[news_id] = {'status': '미진행', 'ai_content': ''}
+        with span('group'):
+            hourly_articles = {}
+            new_records = {}
+            for news in news_list:
+                # 뉴스 상태 정보 추가
+                enrich_news(news, new_records)
             
-            # 카테고리 정보 처리 (배열인 경우 첫 번째 값 사용)
-            if 'category' in news and isinstance(news['category'], list):
-                news['category'] = news['category'][0] if news['category'] else None
-            
-            # 시간 정보 추출
-            date_str = news.get('dateline') or news.get('published_at', '')
-            if date_str:
-                try:
-                    # 날짜 파싱
-                    news_date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-                    hour_key = f"{news_date.hour}시"
-                    
-                    if hour_key not in hourly_articles:
-                        hourly_articles[hour_key] = []
-                    
-                    hourly_articles[hour_key].append(news)
-                except Exception as e:
-                    print(f"날짜 파싱 오류: {date_str}, {e}")
-                    # 파싱 실패 시 기타 그룹에 추가
-                    if '기타' not in hourly_articles:
-                        hourly_articles['기타'] = []
-                    hourly_articles['기타'].append(news)
+                # 시간대 추출 (시간 정보가 없거나 형식이 다르면 기타 그룹 - /api/news/facets 집계와 같은 기준)
+                hour_key = hour_label(news.get('dateline') or news.get('published_at'))
+                hourly_articles.setdefault(hour_key, []).append(news)
         
         # 상태 정보 저장
-        save_status()
+        with span('save_status'):
+            save_status()
+            if shared_state:
+                shared_state.insert_missing(new_records)
+        
+        # 오늘 기사는 사전 생성 후보로 등록
+        if pregen_scheduler:
+            pregen_scheduler.submit(news_list, selected_date)
         
         # 시간대별 정렬
         sorted_hours = sorted(hourly_articles.keys(), key=lambda x: 
                             int(x.replace('시', '')) if x != '기타' else 999)
         
-        return jsonify({
-            'success': True,
-            'data': {
-                'search_date': from_date,
-                'total': len(news_list),
-                'hourly_articles': hourly_articles,
-                'hours_with_articles': sorted_hours
-            }
-        })
+        with span('serialize'):
+            response = jsonify({
+                'success': True,
+                'data': {
+                    'search_date': selected_date,
+                    'total': len(news_list),
+                    'hourly_articles': hourly_articles,
+                    'hours_with_articles': sorted_hours,
+                    **freshness
+                }
+            })
+        response.headers.update(freshness_headers(freshness))
+        return response
         
+    except NewsDeadlineExceeded:
+        return deadline_response()
     except Exception as e:
         return jsonify({
             'success': False,
@@ -366,15 +752,15 @@ def get_status_summary():
         summary = {
             '미진행': 0,
             '작업중': 0,
-            '작업완료': 0,
-            '전체': len(news_status)
+            '작업완료': 0
         }
         
-        # 각 상태별 카운트 계산
-        for news_id, info in news_status.items():
-            status = info.get('status', '미진행')
+        # 각 상태별 카운트 계산 (쓰기를 막지 않는 조각별 집계)
+        counts = news_status.count_by('status', '미진행')
+        for status, count in counts.items():
             if status in summary:
-                summary[status] += 1
+                summary[status] += count
+        summary['전체'] = sum(counts.values())
                 
         return jsonify({
             'success': True,
@@ -387,10 +773,113 @@ def get_status_summary():
             'message': str(e)
         }), 500
 
+@app.route('/api/news/status/memory', methods=['GET'])
+def get_status_memory():
+    """뉴스 상태의 메모리(핫)/보관 파일(콜드) 분포를 제공하는 API 엔드포인트"""
+    if status_archive:
+        stats = status_archive.get_stats(news_status)
+    else:
+        stats = {
+            'hot': {'entries': len(news_status), 'approx_bytes': estimate_status_bytes(news_status)},
+            'archive_enabled': False
+        }
+    stats['snapshot'] = snapshot_writer.get_stats()
+    return jsonify({
+        'success': True,
+        'data': stats
+    })
+
+@app.route('/api/news/status/export', methods=['GET'])
+def export_status():
+    """전체 뉴스 상태를 JSON 파일로 내보내는 API 엔드포인트 (STATUS_FILE 형식 - 다른 인스턴스에서 가져오기 가능)"""
+    exported = status_archive.export(news_status.snapshot()) if status_archive else news_status.snapshot()
+    body = json.dumps(exported, ensure_ascii=False, indent=2)
+    return Response(
+        body,
+        mimetype='application/json',
+        headers={'Content-Disposition': f'attachment; filename={STATUS_FILE}'}
+    )
+
+@app.route('/api/news/<news_id>/content', methods=['GET'])
+def get_news_content(news_id):
+    """저장된 AI 생성 콘텐츠를 조회하는 API 엔드포인트"""
+    try:
+        stored = content_store.get(news_id)
+        if not stored:
+            return jsonify({
+                'success': False,
+                'message': '생성된 콘텐츠가 없습니다.'
+            }), 404
+        
+        return jsonify({
+            'success': True,
+            'data': {
+                'news_id': news_id,
+                'content': stored['content'],
+                'generated_at': stored.get('generated_at')
+            }
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 500
+
+def store_generated_content(news_id, content, pregenerated=False):
+    """생성된 콘텐츠를 저장하고 상태 레코드 갱신 및 실시간 이벤트 발생 (상태는 변경하지 않음)"""
+    fault_in_status(news_id=news_id)
+    stored = content_store.put(news_id, content)
+    fields = {'has_content': True, 'ai_generated_at': stored['generated_at']}
+    news_status.update_record(news_id, DEFAULT_STATUS, **fields)
+    save_status()
+    
+    # 실시간 업데이트 이벤트 발생
+    add_update_event('ai_content_generated', {
+        'news_id': news_id,
+        'has_content': True,
+        'pregenerated': pregenerated,
+        'generated_at': stored['generated_at']
+    }, fields=fields)
+
+def pregenerate_article(article):
+    """사전 생성 스케줄러가 호출하는 콘텐츠 생성 함수"""
+    gpt_client = get_gpt_client()
+    if not gpt_client:
+        return {'success': False, 'error': 'GPT 클라이언트가 초기화되지 않았습니다.'}
+    result = gpt_client.generate_instagram_content(
+        title=article['title'],
+        content=article['content'],
+        category=article['category']
+    )
+    if result['success']:
+        store_generated_content(article['news_id'], result['content'], pregenerated=True)
+    return result
+
+# 해시태그 일괄 생성 요청 한 번에 받을 최대 제목 수 (내부에서 토큰 예산에 맞게 다시 나눔)
+HASHTAG_BATCH_MAX_ITEMS = int(os.getenv('HASHTAG_BATCH_MAX_ITEMS', '200'))
+
+def gpt_error_response(result, prefix):
+    """GPT 호출 실패 결과를 HTTP 응답으로 변환 (유량 제한/차단은 Retry-After 포함)"""
+    error_type = result.get('error_type', 'upstream_error')
+    status_code = {'rate_limited': 429, 'circuit_open': 503}.get(error_type, 500)
+    
+    response = jsonify({
+        'success': False,
+        'error_type': error_type,
+        'retry_after': result.get('retry_after'),
+        'message': f"{prefix}: {result.get('error', '알 수 없는 오류')}"
+    })
+    response.status_code = status_code
+    if status_code != 500 and result.get('retry_after'):
+        response.headers['Retry-After'] = str(max(1, int(result['retry_after'] + 0.999)))
+    return response
+
 @app.route('/api/generate/instagram', methods=['POST'])
 def generate_instagram_content():
     """뉴스 기사를 바탕으로 인스타그램 콘텐츠를 생성하는 API 엔드포인트"""
     try:
+        gpt_client = get_gpt_client()
         if not gpt_client:
             return jsonify({
                 'success': False,
@@ -410,16 +899,22 @@ def generate_instagram_content():
             }), 400
         
         # 이미 생성된 콘텐츠가 있는지 확인
-        if news_id and news_id in news_status and news_status[news_id].get('ai_content'):
-            return jsonify({
-                'success': True,
-                'data': {
-                    'content': news_status[news_id]['ai_content'],
-                    'cached': True
-                }
-            })
+        if news_id:
+            fault_in_status(news_id=news_id)
+        if news_id and news_status.get(news_id, {}).get('has_content'):
+            stored = content_store.get(news_id)
+            if stored:
+                generate_cache.inc('hit')
+                return jsonify({
+                    'success': True,
+                    'data': {
+                        'content': stored['content'],
+                        'cached': True
+                    }
+                })
         
         # GPT로 인스타그램 콘텐츠 생성
+        generate_cache.inc('miss')
         result = gpt_client.generate_instagram_content(
             title=title,
             content=content,
@@ -429,35 +924,22 @@ def generate_instagram_content():
         if result['success']:
             # 생성된 콘텐츠를 저장 (상태는 변경하지 않음)
             if news_id:
-                if news_id not in news_status:
-                    news_status[news_id] = {'status': '미진행', 'ai_content': ''}
-                news_status[news_id]['ai_content'] = result['content']
-                news_status[news_id]['ai_generated_at'] = datetime.now().isoformat()
-                save_status()
-                
-                # 실시간 업데이트 이벤트 발생
-                add_update_event('ai_content_generated', {
-                    'news_id': news_id,
-                    'has_content': True,
-                    'generated_at': datetime.now().isoformat()
-                })
+                store_generated_content(news_id, result['content'])
             
             return jsonify({
                 'success': True,
                 'data': {
                     'content': result['content'],
                     'raw_response': result.get('raw_response', ''),
+                    'usage': result.get('usage'),
                     'cached': False
                 }
             })
         else:
-            return jsonify({
-                'success': False,
-                'message': f"콘텐츠 생성 실패: {result.get('error', '알 수 없는 오류')}"
-            }), 500
+            return gpt_error_response(result, '콘텐츠 생성 실패')
         
     except Exception as e:
-        logger.error(f"인스타그램 콘텐츠 생성 중 오류: {e}")
+        logger.error("인스타그램 콘텐츠 생성 중 오류: %s", e)
         return jsonify({
             'success': False,
             'message': str(e)
@@ -467,6 +949,7 @@ def generate_instagram_content():
 def generate_hashtags():
     """제목만으로 빠르게 해시태그를 생성하는 API 엔드포인트"""
     try:
+        gpt_client = get_gpt_client()
         if not gpt_client:
             return jsonify({
                 'success': False,
@@ -497,24 +980,94 @@ def generate_hashtags():
                 }
             })
         else:
+            return gpt_error_response(result, '해시태그 생성 실패')
+        
+    except Exception as e:
+        logger.error("해시태그 생성 중 오류: %s", e)
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 500
+
+@app.route('/api/generate/hashtags/batch', methods=['POST'])
+def generate_hashtags_batch():
+    """여러 제목의 해시태그를 묶어서 한 번(토큰 예산을 넘으면 몇 번)의 GPT 호출로 생성하는 API 엔드포인트"""
+    try:
+        gpt_client = get_gpt_client()
+        if not gpt_client:
             return jsonify({
                 'success': False,
-                'message': f"해시태그 생성 실패: {result.get('error', '알 수 없는 오류')}"
+                'message': 'GPT 클라이언트가 초기화되지 않았습니다.'
             }), 500
         
+        data = request.get_json(silent=True) or {}
+        items = data.get('items')
+        if not isinstance(items, list) or not items:
+            return jsonify({
+                'success': False,
+                'message': 'items 목록이 필요합니다.'
+            }), 400
+        if len(items) > HASHTAG_BATCH_MAX_ITEMS:
+            return jsonify({
+                'success': False,
+                'message': f'한 번에 최대 {HASHTAG_BATCH_MAX_ITEMS}개까지 요청할 수 있습니다.'
+            }), 400
+        if not all(isinstance(item, dict) and item.get('title') for item in items):
+            return jsonify({
+                'success': False,
+                'message': '모든 항목에 제목이 필요합니다.'
+            }), 400
+        
+        result = gpt_client.generate_batch_hashtags([
+            {'title': item['title'], 'category': item.get('category')} for item in items
+        ])
+        
+        if result['success']:
+            return jsonify({
+                'success': True,
+                'data': {
+                    # 요청의 id(news_id 등)를 그대로 돌려줘 결과를 짝지을 수 있게 함
+                    'results': [
+                        dict(item_result, id=item.get('id')) for item, item_result in zip(items, result['results'])
+                    ],
+                    'succeeded': result['succeeded'],
+                    'batches': result['batches'],
+                    'usage': result['usage']
+                }
+            })
+        else:
+            return gpt_error_response(result, '해시태그 일괄 생성 실패')
+        
     except Exception as e:
-        logger.error(f"해시태그 생성 중 오류: {e}")
+        logger.error("해시태그 일괄 생성 중 오류: %s", e)
         return jsonify({
             'success': False,
             'message': str(e)
         }), 500
 
+@app.route('/api/generate/stats', methods=['GET'])
+def get_generate_stats():
+    """GPT 호출 유량 제한기 및 서킷 브레이커 상태를 제공하는 API 엔드포인트"""
+    gpt_client = get_gpt_client()
+    if not gpt_client:
+        return jsonify({
+            'success': False,
+            'message': 'GPT 클라이언트가 초기화되지 않았습니다.'
+        }), 500
+    
+    stats = gpt_client.get_stats()
+    stats['pregeneration'] = pregen_scheduler.get_stats() if pregen_scheduler else {'enabled': False}
+    
+    return jsonify({
+        'success': True,
+        'data': stats
+    })
+
 # 빌드된 정적 자산 (assets) 서빙
 @app.route('/static/<path:filepath>')
 def serve_static_assets(filepath):
     """React 정적 파일 서빙 (CSS, JS, 이미지 등)"""
-    logger.debug("\n=== 정적 파일 요청 ===")
-    logger.debug("요청된 파일 경로: /static/%s", filepath)
+    logger.debug("정적 파일 요청: /static/%s", filepath)
     
     try:
         response = static_handler.serve_file(os.path.join('static', filepath))
@@ -545,8 +1098,6 @@ def serve_static_assets(filepath):
 @app.route('/manifest.json')
 def serve_manifest():
     """React manifest.json 서빙"""
-    logger.debug("\n=== manifest.json 요청 ===")
-    
     try:
         return static_handler.serve_file('manifest.json')
     except:
@@ -558,35 +1109,26 @@ def serve_manifest():
 @app.route('/<path:path>')
 def serve_react_app(path):
     """React 앱 서빙 (SPA 라우팅 지원)"""
-    logger.debug("\n=== React 앱 요청 ===")
-    logger.debug("요청된 경로: %s", path or '/')
+    logger.debug("React 앱 요청: %s", path or '/')
     
     # API 경로는 제외 (이미 위에서 정의됨)
     if path.startswith('api/'):
         logger.debug("API 경로이므로 건너뜀")
         return jsonify({'error': 'API endpoint not found'}), 404
     
-    # 파비콘, 로고 등의 파일들 처리
+    # 파비콘, 로고 등 빌드 최상위 파일 처리 (시작 시 만든 인덱스 조회)
     static_files = ['favicon.ico', 'logo192.png', 'logo512.png', 'robots.txt']
+    if path and static_handler.has_file(path):
+        response = static_handler.serve_file(path)
+        response.headers['Cache-Control'] = 'public, max-age=3600'  # 1시간
+        return response
     if path in static_files:
-        for base_path in [os.path.join(os.getcwd(), 'static'), 
-                         os.path.join(os.path.dirname(os.getcwd()), 'frontend', 'build')]:
-            file_path = os.path.join(base_path, path)
-            if os.path.exists(file_path):
-                return send_from_directory(base_path, path)
         return '', 404
     
-    # index.html 서빙 시도
-    index_base_path = static_handler.get_index_html_path()
-    
-    if index_base_path:
+    # index.html 서빙 시도 (메모리에 올려 둔 내용)
+    if static_handler.has_file('index.html'):
         try:
-            response = send_from_directory(index_base_path, 'index.html')
-            # 캐싱 방지 (SPA는 항상 최신 버전 제공)
-            response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
-            response.headers['Pragma'] = 'no-cache'
-            response.headers['Expires'] = '0'
-            return response
+            return static_handler.serve_index_html()
         except Exception as e:
             logger.error("index.html 서빙 중 오류: %s", e)
     
@@ -611,6 +1153,79 @@ def health_check():
         'timestamp': datetime.now().isoformat()
     })
 
+def hit_ratio(hits, misses):
+    """캐시 적중률 (조회가 없으면 None)"""
+    total = hits + misses
+    return hits / total if total else None
+
+def collect_cache_hit_ratios():
+    """캐시별 적중률 (/metrics 수집 시 호출)"""
+    static_stats = static_handler.get_stats()
+    return {
+        ('news_day',): hit_ratio(news_cache.hits + news_cache.stale_hits, news_cache.misses),
+        ('static',): hit_ratio(static_stats['hits'], static_stats['misses']),
+        ('generated_content',): hit_ratio(generate_cache.value('hit'), generate_cache.value('miss'))
+    }
+
+metrics_registry.gauge('sse_clients', '연결된 실시간 업데이트(SSE) 클라이언트 수',
+                       lambda: event_broker.listeners)
+metrics_registry.gauge('sse_events_published_total', '발행된 실시간 업데이트 이벤트 수',
+                       lambda: event_broker.published)
+metrics_registry.gauge('cache_hit_ratio', '캐시 적중률', collect_cache_hit_ratios, labels=('cache',))
+metrics_registry.gauge('news_status_entries', '메모리에 있는 뉴스 상태 수', lambda: len(news_status))
+metrics_registry.gauge('log_records', '로깅 큐 상태 (대기/버림/반복 생략)', lambda: {
+    (key,): value for key, value in get_logging_stats().items() if key in ('queued', 'dropped', 'suppressed')
+}, labels=('state',))
+
+@app.route('/metrics')
+def metrics():
+    """Prometheus 텍스트 형식 지표"""
+    return Response(metrics_registry.render(), mimetype='text/plain; version=0.0.4')
+
+def profile_access_error():
+    """프로파일링 관리 API 접근 확인 (비활성이면 404, 비밀값이 틀리면 403)"""
+    if not PROFILE_SECRET:
+        return jsonify({'success': False, 'message': '프로파일링이 비활성화되어 있습니다.'}), 404
+    if not profile_secret_matches(request.headers.get('X-Profile')):
+        return jsonify({'success': False, 'message': '권한이 없습니다.'}), 403
+    return None
+
+@app.route('/api/debug/profile', methods=['POST'])
+def profile_window():
+    """지정한 시간 동안 전체 스레드의 스택을 샘플링하여 folded 보고서로 반환 (?seconds=, 최대 60초)"""
+    error = profile_access_error()
+    if error:
+        return error
+    seconds = min(max(request.args.get('seconds', 10, type=float), 0.1), 60)
+    sampler = StackSampler(interval=PROFILE_SAMPLE_INTERVAL).start()
+    time.sleep(seconds)
+    sampler.stop()
+    report = sampler.folded()
+    name = profile_store.save(f"window-{int(seconds)}s", report)
+    return Response(report, mimetype='text/plain', headers={
+        'X-Profile-Report': name,
+        'X-Profile-Samples': str(sampler.sample_count)
+    })
+
+@app.route('/api/debug/profiles', methods=['GET'])
+def list_profiles():
+    """저장된 프로파일 보고서 목록"""
+    error = profile_access_error()
+    if error:
+        return error
+    return jsonify({'success': True, 'data': profile_store.list()})
+
+@app.route('/api/debug/profiles/<name>', methods=['GET'])
+def get_profile(name):
+    """저장된 프로파일 보고서 (folded 형식 - flamegraph.pl, speedscope 입력)"""
+    error = profile_access_error()
+    if error:
+        return error
+    report = profile_store.read(name)
+    if report is None:
+        return jsonify({'success': False, 'message': '보고서를 찾을 수 없습니다.'}), 404
+    return Response(report, mimetype='text/plain')
+
 # 추가 디버깅 라우트
 @app.route('/api/debug/structure')
 def debug_structure():
@@ -666,54 +1281,125 @@ def debug_structure():
     
     # 사용 가능한 정적 파일 목록
     debug_info['available_static_files'] = static_handler.list_available_files()
+    debug_info['static_cache'] = static_handler.get_stats()
     
     return jsonify(debug_info)
 
-# 실시간 업데이트를 위한 이벤트 저장소
-update_events = []
-update_lock = threading.Lock()
-
-def add_update_event(event_type, data):
-    """실시간 업데이트 이벤트 추가"""
-    with update_lock:
-        timestamp = datetime.now().isoformat()
-        event = {
-            'type': event_type,
-            'data': data,
-            'timestamp': timestamp
-        }
-        update_events.append(event)
-        # 최근 100개 이벤트만 유지
-        if len(update_events) > 100:
-            update_events.pop(0)
-        print(f"📡 실시간 이벤트 추가: {event_type}")
+# 실시간 업데이트를 위한 이벤트 브로커 (최근 이벤트 링 버퍼 + 대기 중인 스트림 즉시 깨우기)
+# 공유 모드에서는 이벤트 ID로 변경 로그 ID를 사용하므로 워커가 바뀌어도 이어받기 가능
+event_broker = EventBroker(
+    maxlen=int(os.getenv('SSE_BUFFER_SIZE', '1000')),
+    heartbeat_interval=float(os.getenv('SSE_HEARTBEAT_INTERVAL', '15')),
+    start_id=shared_state.last_change_id if shared_state else 0,
+    flush_interval=float(os.getenv('SSE_FLUSH_INTERVAL', '0.25'))
+)
+
+def add_update_event(event_type, data, fields=None):
+    """실시간 업데이트 이벤트 추가 (fields: 이 이벤트로 바뀐 상태 필드)"""
+    if shared_state:
+        # 바뀐 필드만 공유 레코드에 합쳐 기록 - 다른 워커가 바꾼 필드를 덮어쓰지 않음, 모든 워커가 읽어 SSE로 전달
+        news_id = data.get('news_id')
+        merged = shared_state.publish(event_type, data, news_id=news_id, fields=fields, default=DEFAULT_STATUS)
+        if merged is not None:
+            news_status[news_id] = merged
+        logger.debug("📡 공유 이벤트 기록: %s", event_type)
+        return
+    
+    event = event_broker.publish(event_type, data)
+    logger.debug("📡 실시간 이벤트 추가: %s (id=%d)", event_type, event['id'])
+
+def apply_shared_record(news_id, record):
+    """변경 로그의 상태 레코드 반영 (다른 워커 변경이 합쳐진 최신 레코드)"""
+    news_status[news_id] = record
+    news_cache.status_changed(news_id, record.get('status', '미진행'))
+
+def deliver_shared_event(event_id, event_type, data, timestamp):
+    """변경 로그에서 읽은 이벤트를 이 워커의 SSE 브로커로 전달"""
+    event_broker.publish(event_type, data, event_id=event_id, timestamp=timestamp)
+
+if shared_state:
+    shared_state.start(apply_shared_record, deliver_shared_event)
+
+def parse_flush_interval(value):
+    """batch_ms 파라미터를 배치 전송 주기(초)로 변환 (없거나 잘못되면 기본값)"""
+    try:
+        return min(max(int(value), 0), 5000) / 1000
+    except (TypeError, ValueError):
+        return None
 
 @app.route('/api/events')
 def stream_updates():
-    """Server-Sent Events 스트림"""
-    def event_stream():
-        last_sent = 0
-        while True:
-            with update_lock:
-                # 새로운 이벤트만 전송
-                new_events = update_events[last_sent:]
-                for event in new_events:
-                    yield f"data: {json.dumps(event)}\n\n"
-                last_sent = len(update_events)
-            
-            time.sleep(1)  # 1초마다 체크
+    """
+    Server-Sent Events 스트림 (Last-Event-ID 헤더 또는 last_event_id 파라미터로 이어받기)
+    batch_ms 파라미터로 이 연결의 배치 전송 주기를 지정 (0이면 이벤트마다 즉시 전송)
+    """
+    last_event_id = request.headers.get('Last-Event-ID') or request.args.get('last_event_id')
+    flush_interval = parse_flush_interval(request.args.get('batch_ms'))
     
     return Response(
-        event_stream(),
+        event_broker.stream(last_event_id, flush_interval),
         mimetype='text/event-stream',
         headers={
             'Cache-Control': 'no-cache',
             'Connection': 'keep-alive',
+            'X-Accel-Buffering': 'no',
             'Access-Control-Allow-Origin': '*',
-            'Access-Control-Allow-Headers': 'Cache-Control'
+            'Access-Control-Allow-Headers': 'Cache-Control, Last-Event-ID'
         }
     )
 
+# 우선순위 기사 콘텐츠 사전 생성 스케줄러 (PREGEN_ENABLED=true 일 때만 동작)
+# 공유 모드에서는 워커마다 스케줄러가 돌지만 하루 예산과 생성 대상은 SQLite에서 선점하여 함께 씀
+pregen_scheduler = None
+if os.getenv('PREGEN_ENABLED', 'false').lower() == 'true' and os.getenv('OPENAI_API_KEY'):
+    PREGEN_DAILY_BUDGET = int(os.getenv('PREGEN_DAILY_BUDGET', '50'))
+    pregen_scheduler = PregenScheduler(
+        generate_fn=pregenerate_article,
+        has_content_fn=content_store.has,
+        rules=PriorityRules(
+            provider_weights=parse_weights(os.getenv('PREGEN_PROVIDERS', '서울경제:2')),
+            category_weights=parse_weights(os.getenv('PREGEN_CATEGORIES', '경제:1')),
+            recency_hours=float(os.getenv('PREGEN_RECENCY_HOURS', '3')),
+            recency_weight=float(os.getenv('PREGEN_RECENCY_WEIGHT', '1')),
+            min_score=float(os.getenv('PREGEN_MIN_SCORE', '2'))
+        ),
+        daily_budget=PREGEN_DAILY_BUDGET,
+        claim_fn=(lambda day, news_id: shared_state.claim_pregen(day, news_id, PREGEN_DAILY_BUDGET))
+        if shared_state else None,
+        release_fn=shared_state.release_pregen if shared_state else None
+    )
+    pregen_scheduler.start()
+
+# 뉴스 캐시 예열 스케줄러 (NEWS_WARMUP_ENABLED=true 일 때만 동작)
+# 오늘/최근 날짜 결과를 만료 전에 미리 받아 두어 사용자 요청이 빅카인즈 조회를 기다리지 않도록 함
+# 캐시는 프로세스마다 있으므로 gunicorn 워커마다 따로 예열함 (호출 한도는 워커 수를 고려해 설정)
+news_warmup = None
+if os.getenv('NEWS_WARMUP_ENABLED', 'false').lower() == 'true':
+    news_warmup = WarmupScheduler(
+        refresh_fn=lambda date, limit: news_revalidator.submit(date, '', limit).result(),
+        age_fn=lambda date, limit: news_cache.age_of(date, '', limit),
+        limits=[int(limit) for limit in os.getenv('NEWS_WARMUP_LIMITS', '1000').split(',') if limit.strip()],
+        today_interval=float(os.getenv('NEWS_WARMUP_TODAY_INTERVAL', '50')),
+        past_days=int(os.getenv('NEWS_WARMUP_PAST_DAYS', '3')),
+        past_interval=float(os.getenv('NEWS_WARMUP_PAST_INTERVAL', '3000')),
+        idle_hours=parse_hours(os.getenv('NEWS_WARMUP_IDLE_HOURS', '1-5')),
+        max_per_minute=int(os.getenv('NEWS_WARMUP_MAX_PER_MINUTE', '6'))
+    )
+    if news_warmup.today_interval >= news_cache.today_ttl:
+        logger.warning("NEWS_WARMUP_TODAY_INTERVAL(%ss)이 NEWS_CACHE_TODAY_TTL(%ss)보다 길어 만료 후 조회가 생길 수 있음",
+                       news_warmup.today_interval, news_cache.today_ttl)
+    news_warmup.start()
+
+def stop_background_refresh():
+    """예열을 멈추고 대기 중인 재조회 취소 (실행 중인 조회는 끝나는 대로 종료)"""
+    if news_warmup:
+        # 예열 스레드는 실행 중인 재조회를 기다리고 있을 수 있으므로 종료 요청만 하고 기다리지 않음
+        news_warmup.stop(timeout=0)
+    news_revalidator.shutdown()
+
+# 종료 신호(gunicorn/uvicorn 종료, Ctrl+C)로 프로세스가 끝날 때 재조회 스레드 풀 정리보다 먼저 실행
+register_exit_hook(stop_background_refresh)
+
 if __name__ == '__main__':
     # 개발/프로덕션 환경 분기
     if os.getenv('FLASK_ENV') == 'production':
@@ -0,0 +1,273 @@
+"""
+비동기(ASGI) 서빙 진입점
+SSE 스트림(/api/events)은 이벤트 루프에서 직접 처리하여 연결 수가 스레드 수에 묶이지 않게 하고,
+나머지 Flask 라우트는 같은 프로세스의 app 모듈 상태를 그대로 공유하며 스레드 풀에서 실행합니다.
+
+실행: uvicorn asgi:application --host 0.0.0.0 --port 8080
+"""
+
+import asyncio
+import io
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import parse_qs
+
+from app import app as flask_app, event_broker, parse_flush_interval, stop_background_refresh
+
+logger = logging.getLogger(__name__)
+
+# Flask 라우트 실행용 스레드 풀 (업스트림 호출이 이벤트 루프를 막지 않도록)
+wsgi_executor = ThreadPoolExecutor(
+    max_workers=int(os.getenv('ASGI_WSGI_THREADS', '16')),
+    thread_name_prefix='wsgi'
+)
+
+SSE_HEADERS = [
+    (b'content-type', b'text/event-stream; charset=utf-8'),
+    (b'cache-control', b'no-cache'),
+    (b'x-accel-buffering', b'no'),
+    (b'access-control-allow-origin', b'*'),
+    (b'access-control-allow-headers', b'Cache-Control, Last-Event-ID')
+]
+
+
+class AsyncEventHub:
+    """브로커 발행 알림을 이벤트 루프의 Future로 전달하는 연결 지점 (루프당 하나)"""
+
+    def __init__(self, broker, loop):
+        self.broker = broker
+        self.loop = loop
+        self.future = loop.create_future()
+        broker.add_callback(self._on_publish)
+
+    def _on_publish(self, event):
+        """발행 스레드에서 호출 - 루프 스레드로 깨우기 예약"""
+        self.loop.call_soon_threadsafe(self._wake)
+
+    def _wake(self):
+        """현재 대기 중인 모든 스트림을 깨우고 다음 대기용 Future 준비"""
+        if not self.future.done():
+            self.future.set_result(None)
+        self.future = self.loop.create_future()
+
+    def close(self):
+        self.broker.remove_callback(self._on_publish)
+
+
+_hub = None
+
+
+def get_hub():
+    """현재 이벤트 루프의 이벤트 허브"""
+    global _hub
+    loop = asyncio.get_running_loop()
+    if _hub is None or _hub.loop is not loop:
+        if _hub is not None:
+            _hub.close()
+        _hub = AsyncEventHub(event_broker, loop)
+    return _hub
+
+
+def header_value(scope, name):
+    """ASGI scope에서 요청 헤더 값 조회"""
+    for key, value in scope.get('headers', []):
+        if key == name:
+            return value.decode('latin-1')
+    return None
+
+
+async def send_text(send, text):
+    """SSE 본문 조각 전송"""
+    await send({'type': 'http.response.body', 'body': text.encode('utf-8'), 'more_body': True})
+
+
+async def stream_events(scope, receive, send):
+    """이벤트 루프에서 처리하는 SSE 스트림 (동작은 EventBroker.stream과 동일)"""
+    query = parse_qs(scope.get('query_string', b'').decode('latin-1'))
+    last_event_id = header_value(scope, b'last-event-id') or (query.get('last_event_id') or [None])[0]
+    last_id = event_broker.parse_last_event_id(last_event_id)
+    flush_interval = parse_flush_interval((query.get('batch_ms') or [None])[0])
+    if flush_interval is None:
+        flush_interval = event_broker.flush_interval
+    hub = get_hub()
+
+    async def watch_disconnect():
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return
+
+    disconnected = asyncio.ensure_future(watch_disconnect())
+    event_broker.connect()
+    try:
+        await send({'type': 'http.response.start', 'status': 200, 'headers': SSE_HEADERS})
+        await send_text(send, f"retry: {event_broker.retry_ms}\n\n")
+
+        if last_id < 0:
+            last_id = event_broker.last_id
+            await send_text(send, event_broker.format_resync())
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + event_broker.heartbeat_interval
+        while not disconnected.done():
+            # 조회 전에 Future를 잡아 두어 조회와 대기 사이에 발행된 이벤트도 놓치지 않음
+            wakeup = hub.future
+            events, gap = event_broker.events_after(last_id)
+            if events:
+                if flush_interval > 0:
+                    # 첫 이벤트 이후 주기 동안 들어온 이벤트를 모아 한 번에 전송
+                    await asyncio.sleep(flush_interval)
+                    events, gap = event_broker.events_after(last_id)
+                chunks = [event_broker.format_resync()] if gap else []
+                if flush_interval > 0:
+                    chunks.append(event_broker.format_batch(events))
+                else:
+                    chunks.extend(event_broker.format_event(event) for event in events)
+                await send_text(send, ''.join(chunks))
+                last_id = events[-1]['id']
+                deadline = loop.time() + event_broker.heartbeat_interval
+                continue
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                # 연결 유지 및 끊어진 연결 감지를 위한 주석 라인
+                await send_text(send, ": heartbeat\n\n")
+                deadline = loop.time() + event_broker.heartbeat_interval
+                continue
+
+            await asyncio.wait({wakeup, disconnected}, timeout=remaining,
+                               return_when=asyncio.FIRST_COMPLETED)
+    except OSError:
+        # 클라이언트가 연결을 끊은 경우
+        pass
+    finally:
+        event_broker.disconnect()
+        disconnected.cancel()
+
+
+async def health(scope, receive, send):
+    """헬스 체크 (스레드 풀을 거치지 않음)"""
+    body = json.dumps({
+        'status': 'healthy',
+        'timestamp': datetime.now().isoformat()
+    }).encode('utf-8')
+    await send({
+        'type': 'http.response.start',
+        'status': 200,
+        'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode())]
+    })
+    await send({'type': 'http.response.body', 'body': body})
+
+
+def build_environ(scope, body):
+    """ASGI scope를 WSGI environ으로 변환"""
+    server = scope.get('server') or ('localhost', 80)
+    client = scope.get('client') or ('', 0)
+    environ = {
+        'REQUEST_METHOD': scope['method'],
+        'SCRIPT_NAME': scope.get('root_path', '').encode('utf-8').decode('latin-1'),
+        'PATH_INFO': scope['path'].encode('utf-8').decode('latin-1'),
+        'QUERY_STRING': scope.get('query_string', b'').decode('latin-1'),
+        'SERVER_NAME': str(server[0]),
+        'SERVER_PORT': str(server[1]),
+        'SERVER_PROTOCOL': f"HTTP/{scope.get('http_version', '1.1')}",
+        'REMOTE_ADDR': client[0],
+        'REMOTE_PORT': str(client[1]),
+        'wsgi.version': (1, 0),
+        'wsgi.url_scheme': scope.get('scheme', 'http'),
+        'wsgi.input': io.BytesIO(body),
+        'wsgi.errors': sys.stderr,
+        'wsgi.multithread': True,
+        'wsgi.multiprocess': False,
+        'wsgi.run_once': False,
+        'CONTENT_LENGTH': str(len(body))
+    }
+    for key, value in scope.get('headers', []):
+        name = key.decode('latin-1').upper().replace('-', '_')
+        value = value.decode('latin-1')
+        if name == 'CONTENT_TYPE':
+            environ['CONTENT_TYPE'] = value
+        elif name == 'CONTENT_LENGTH':
+            continue
+        else:
+            header = f"HTTP_{name}"
+            environ[header] = f"{environ[header]},{value}" if header in environ else value
+    return environ
+
+
+async def call_wsgi(scope, receive, send):
+    """Flask 라우트를 스레드 풀에서 실행하고 응답을 조각 단위로 전달"""
+    body = b''
+    more_body = True
+    while more_body:
+        message = await receive()
+        if message['type'] == 'http.disconnect':
+            return
+        body += message.get('body', b'')
+        more_body = message.get('more_body', False)
+
+    environ = build_environ(scope, body)
+    response_start = {}
+
+    def start_response(status, headers, exc_info=None):
+        response_start['status'] = int(status.split(' ', 1)[0])
+        response_start['headers'] = [
+            (name.lower().encode('latin-1'), value.encode('latin-1')) for name, value in headers
+        ]
+
+    def run_app():
+        result = flask_app(environ, start_response)
+        return result, iter(result)
+
+    loop = asyncio.get_running_loop()
+    result, iterator = await loop.run_in_executor(wsgi_executor, run_app)
+    try:
+        await send({
+            'type': 'http.response.start',
+            'status': response_start['status'],
+            'headers': response_start['headers']
+        })
+        while True:
+            chunk = await loop.run_in_executor(wsgi_executor, next, iterator, None)
+            if chunk is None:
+                break
+            if chunk:
+                await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b''})
+    finally:
+        if hasattr(result, 'close'):
+            await loop.run_in_executor(wsgi_executor, result.close)
+
+
+async def lifespan(scope, receive, send):
+    """서버 시작/종료 알림 처리"""
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            get_hub()
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            stop_background_refresh()
+            wsgi_executor.shutdown(wait=False)
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
+
+
+async def application(scope, receive, send):
+    """ASGI 애플리케이션"""
+    if scope['type'] == 'lifespan':
+        await lifespan(scope, receive, send)
+        return
+    if scope['type'] != 'http':
+        return
+
+    if scope['method'] == 'GET' and scope['path'] == '/api/events':
+        await stream_events(scope, receive, send)
+    elif scope['method'] == 'GET' and scope['path'] == '/health':
+        await health(scope, receive, send)
+    else:
+        await call_wsgi(scope, receive, send)
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+벤치마크용 업스트림 대역 서버
+빅카인즈 검색 API(tools.kinds.or.kr/search/news)와 OpenAI 채팅 완성 API를 흉내 내는 로컬 HTTP 서버입니다.
+실제 키나 네트워크 없이 같은 요청/응답 형태로 백엔드를 구동할 수 있습니다.
+
+- 빅카인즈: 요청 날짜마다 합성 한국어 기사(기본 하루 1만 건)를 항상 같은 내용으로 생성
+- OpenAI: 지정한 지연(+응답 토큰당 지연) 후 고정 형식의 완성 응답과 토큰 사용량 반환
+  (해시태그 요청은 제목 단어로 만든 해시태그, 구조화 출력 요청은 번호별 JSON, max_tokens를 넘으면 잘라서 반환)
+
+백엔드 연결:
+    BIGKINDS_API_URL=http://127.0.0.1:<port>/search/news
+    OPENAI_BASE_URL=http://127.0.0.1:<port>/v1
+
+사용 예:
+    python benchmarks/fake_upstreams.py --bigkinds-port 9001 --openai-port 9002 --openai-latency-ms 800
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PROVIDERS = ['서울경제', '경향신문', '국민일보', '동아일보', '문화일보', '서울신문', '세계일보', '조선일보',
+             '중앙일보', '한겨레', '한국일보', '매일경제', '한국경제', 'KBS', 'MBC', 'SBS', 'YTN']
+CATEGORIES = ['정치>국회_정당', '정치>행정_자치', '경제>금융_재테크', '경제>산업_기업', '경제>부동산',
+              '사회>사건_사고', '사회>교육_시험', '국제>아시아', '국제>미국_북미', 'IT_과학>인터넷_SNS',
+              '문화>전시_공연', '스포츠>야구']
+WORDS = ['정부', '발표', '시장', '경제', '금리', '기업', '투자', '성장', '정책', '지역', '주민', '개발',
+         '기술', '산업', '수출', '증가', '감소', '전망', '분석', '회의', '협력', '지원', '확대', '계획']
+
+GENERATED_CONTENT = """서울 경제 소식을 한눈에 정리했습니다
+
+1️⃣ 핵심 내용
+기사의 주요 내용을 간단히 요약합니다.
+2️⃣ 배경
+이번 소식이 나온 배경을 설명합니다.
+3️⃣ 전망
+앞으로의 흐름을 짚어 봅니다.
+
+#서울경제 #경제뉴스 #오늘의뉴스 #시장 #금리 #투자 #기업 #정책 #산업 #전망"""
+
+FILLER_HASHTAGS = ['뉴스', '오늘의뉴스', '속보', 'news', 'Korea', 'trending', '이슈', '경제뉴스', 'daily', '정보']
+NUMBERED_TITLE = re.compile(r'^(\d+)\. (.+)$', re.MULTILINE)
+
+
+def make_documents(date, count, seed=None):
+    """하루치 합성 기사 목록 (같은 날짜/개수면 항상 같은 내용)"""
+    rng = random.Random(seed if seed is not None else date)
+    compact = date.replace('-', '')
+    documents = []
+    for i in range(count):
+        hour = 23 - (i * 24 // max(count, 1))
+        minute = rng.randint(0, 59)
+        provider_index = rng.randrange(len(PROVIDERS))
+        provider = PROVIDERS[provider_index]
+        title_words = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(4, 9)))
+        body = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(80, 200)))
+        documents.append({
+            'title': f'[{provider}] {title_words}',
+            'news_id': f'0{1100100 + provider_index}.{compact}{hour:02d}{minute:02d}{i:05d}',
+            'published_at': f'{date}T{hour:02d}:{minute:02d}:00.000+09:00',
+            'content': body + '.',
+            'provider': provider,
+            'byline': f'{rng.choice(WORDS)} 기자',
+            'provider_link_page': f'https://news.example.com/{compact}/{i}',
+            'dateline': f'{date}T{hour:02d}:{minute:02d}:00.000+09:00',
+            'enveloped_at': f'{date}T{hour:02d}:{minute:02d}:30.000+09:00',
+            'hilight': '',
+            'category': rng.sample(CATEGORIES, rng.randint(1, 3)),
+            'category_incident': [],
+            'provider_subject': [],
+            'subject_info': ['', '', '']
+        })
+    return documents
+
+
+class UpstreamStats:
+    """대역 서버 호출 통계"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.bigkinds_calls = 0
+        self.openai_calls = 0
+
+    def count(self, name):
+        with self.lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def snapshot(self):
+        with self.lock:
+            return {'bigkinds_calls': self.bigkinds_calls, 'openai_calls': self.openai_calls}
+
+
+class JSONHandler(BaseHTTPRequestHandler):
+    """JSON 요청/응답 공통 처리"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def read_json(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return json.loads(self.rfile.read(length) or b'{}')
+
+    def send_body(self, status, body, content_type='application/json; charset=utf-8'):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def bigkinds_handler(config, stats):
+    """빅카인즈 검색 API 대역 핸들러 클래스"""
+    encoded = {}
+    encoded_lock = threading.Lock()
+
+    class BigkindsHandler(JSONHandler):
+        def do_POST(self):
+            payload = self.read_json()
+            argument = payload.get('argument', {})
+            date = argument.get('published_at', {}).get('from') or time.strftime('%Y-%m-%d')
+            size = min(int(argument.get('return_size') or 10000), config['articles_per_day'])
+            stats.count('bigkinds_calls')
+            if config['latency'] > 0:
+                time.sleep(config['latency'])
+            key = (date, size)
+            with encoded_lock:
+                body = encoded.get(key)
+            if body is None:
+                documents = make_documents(date, config['articles_per_day'])[:size]
+                body = json.dumps({
+                    'result': 0,
+                    'return_object': {'total_hits': config['articles_per_day'], 'documents': documents}
+                }, ensure_ascii=False).encode('utf-8')
+                with encoded_lock:
+                    encoded[key] = body
+            self.send_body(200, body)
+
+    return BigkindsHandler
+
+
+def title_hashtags(title):
+    """제목 단어로 만든 해시태그 10개"""
+    words = [word for word in re.split(r'[^\w]+', title) if len(word) > 1]
+    tags = []
+    for tag in words + FILLER_HASHTAGS:
+        if tag not in tags:
+            tags.append(tag)
+    return tags[:10]
+
+
+def completion_content(payload):
+    """요청 종류에 맞는 완성 텍스트"""
+    messages = payload.get('messages', [])
+    system = messages[0].get('content', '') if messages else ''
+    prompt = messages[-1].get('content', '') if messages else ''
+    if payload.get('response_format'):
+        results = [{'id': int(number), 'hashtags': ' '.join(f'#{tag}' for tag in title_hashtags(title))}
+                   for number, title in NUMBERED_TITLE.findall(prompt)]
+        return json.dumps({'results': results}, ensure_ascii=False)
+    if '해시태그' in system:
+        title = prompt.split('제목:', 1)[-1].split('\n', 1)[0]
+        return ' '.join(f'#{tag}' for tag in title_hashtags(title))
+    return GENERATED_CONTENT
+
+
+def openai_handler(config, stats):
+    """OpenAI 채팅 완성 API 대역 핸들러 클래스"""
+
+    class OpenAIHandler(JSONHandler):
+        def do_POST(self):
+            payload = self.read_json()
+            stats.count('openai_calls')
+            content = completion_content(payload)
+            finish_reason = 'stop'
+            # 토큰 수는 2자당 1토큰으로 근사
+            max_chars = (payload.get('max_tokens') or 0) * 2
+            if max_chars and len(content) > max_chars:
+                content = content[:max_chars]
+                finish_reason = 'length'
+            completion_tokens = len(content) // 2
+            latency = config['latency'] + config.get('token_latency', 0.0) * completion_tokens
+            if latency > 0:
+                time.sleep(latency)
+            prompt_chars = sum(len(message.get('content', '')) for message in payload.get('messages', []))
+            body = json.dumps({
+                'id': f'chatcmpl-bench-{time.monotonic_ns()}',
+                'object': 'chat.completion',
+                'created': int(time.time()),
+                'model': payload.get('model', 'gpt-4o-mini'),
+                'choices': [{
+                    'index': 0,
+                    'message': {'role': 'assistant', 'content': content},
+                    'finish_reason': finish_reason
+                }],
+                'usage': {
+                    'prompt_tokens': prompt_chars // 2,
+                    'completion_tokens': completion_tokens,
+                    'total_tokens': prompt_chars // 2 + completion_tokens
+                }
+            }, ensure_ascii=False).encode('utf-8')
+            self.send_body(200, body)
+
+    return OpenAIHandler
+
+
+class FakeUpstreams:
+    """빅카인즈/OpenAI 대역 서버 묶음 (백그라운드 스레드에서 실행)"""
+
+    def __init__(self, articles_per_day=10000, bigkinds_latency=0.0, openai_latency=0.5,
+                 bigkinds_port=0, openai_port=0, openai_token_latency=0.0):
+        """
+        Args:
+            articles_per_day (int): 날짜별 합성 기사 수
+            bigkinds_latency (float): 빅카인즈 응답 지연(초)
+            openai_latency (float): OpenAI 응답 지연(초)
+            openai_token_latency (float): OpenAI 응답 토큰당 추가 지연(초) - 긴 응답일수록 느린 실제 동작 흉내
+        """
+        self.stats = UpstreamStats()
+        bigkinds_config = {'articles_per_day': articles_per_day, 'latency': bigkinds_latency}
+        openai_config = {'latency': openai_latency, 'token_latency': openai_token_latency}
+        self.bigkinds = ThreadingHTTPServer(('127.0.0.1', bigkinds_port), bigkinds_handler(bigkinds_config, self.stats))
+        self.openai = ThreadingHTTPServer(('127.0.0.1', openai_port), openai_handler(openai_config, self.stats))
+        for server in (self.bigkinds, self.openai):
+            server.daemon_threads = True
+        self._threads = []
+
+    @property
+    def bigkinds_url(self):
+        return f'http://127.0.0.1:{self.bigkinds.server_address[1]}/search/news'
+
+    @property
+    def openai_url(self):
+        return f'http://127.0.0.1:{self.openai.server_address[1]}/v1'
+
+    def backend_env(self):
+        """백엔드를 대역 서버에 연결하는 환경변수"""
+        return {
+            'BIGKINDS_API_KEY': 'benchmark',
+            'BIGKINDS_API_URL': self.bigkinds_url,
+            'OPENAI_API_KEY': 'sk-benchmark',
+            'OPENAI_BASE_URL': self.openai_url
+        }
+
+    def start(self):
+        for server in (self.bigkinds, self.openai):
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self):
+        for server in (self.bigkinds, self.openai):
+            server.shutdown()
+            server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='빅카인즈/OpenAI 대역 서버')
+    parser.add_argument('--bigkinds-port', type=int, default=9001)
+    parser.add_argument('--openai-port', type=int, default=9002)
+    parser.add_argument('--articles', type=int, default=10000, help='날짜별 합성 기사 수')
+    parser.add_argument('--bigkinds-latency-ms', type=float, default=0, help='빅카인즈 응답 지연(ms)')
+    parser.add_argument('--openai-latency-ms', type=float, default=500, help='OpenAI 응답 지연(ms)')
+    parser.add_argument('--openai-token-latency-ms', type=float, default=0, help='OpenAI 응답 토큰당 추가 지연(ms)')
+    args = parser.parse_args()
+
+    upstreams = FakeUpstreams(
+        articles_per_day=args.articles,
+        bigkinds_latency=args.bigkinds_latency_ms / 1000,
+        openai_latency=args.openai_latency_ms / 1000,
+        bigkinds_port=args.bigkinds_port,
+        openai_port=args.openai_port,
+        openai_token_latency=args.openai_token_latency_ms / 1000
+    ).start()
+    for name, value in upstreams.backend_env().items():
+        print(f'{name}={value}')
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        upstreams.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+해시태그 일괄 생성 비교 스크립트
+대역 OpenAI 서버(benchmarks/fake_upstreams.py)에 대해 같은 제목 목록의 해시태그를
+- 제목마다 한 번씩 호출 (generate_quick_hashtags, 순차 / 동시 N개)
+- 여러 제목을 묶어 호출 (generate_batch_hashtags)
+으로 생성하여 호출 수, 프롬프트/응답 토큰, 예상 비용, 전체 소요 시간을 비교합니다.
+토큰 수는 대역 서버의 근사치(2자당 1토큰)이며, 지연은 기본 지연 + 응답 토큰당 지연으로 흉내 냅니다.
+
+사용 예:
+    python benchmarks/hashtag_batch.py --titles 100 --latency-ms 400 --token-latency-ms 8 --output hashtags.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_upstreams import FakeUpstreams, make_documents  # noqa: E402
+
+# gpt-4o-mini 가격 (USD / 100만 토큰)
+INPUT_PRICE = 0.15
+OUTPUT_PRICE = 0.60
+
+
+def usage_of(client, kind):
+    """클라이언트에 누적된 종류별 토큰 사용량"""
+    totals = client.get_stats()['token_usage']['by_kind'].get(kind, {})
+    return totals.get('prompt_tokens', 0), totals.get('completion_tokens', 0)
+
+
+def summarize(name, calls, prompt_tokens, completion_tokens, seconds, succeeded, count, input_price, output_price):
+    cost = (prompt_tokens * input_price + completion_tokens * output_price) / 1_000_000
+    return {
+        'mode': name,
+        'calls': calls,
+        'prompt_tokens': prompt_tokens,
+        'completion_tokens': completion_tokens,
+        'cost_usd': round(cost, 6),
+        'seconds': round(seconds, 3),
+        'succeeded': succeeded,
+        'titles': count
+    }
+
+
+def run_per_title(client, items, concurrency):
+    """제목마다 한 번씩 호출 -> (성공 수, 소요 시간)"""
+    def generate(item):
+        return client.generate_quick_hashtags(item['title'], item['category'])
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(generate, items))
+    return sum(1 for result in results if result['success'] and result['hashtags']), time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description='해시태그 일괄 생성 비교')
+    parser.add_argument('--titles', type=int, default=100, help='제목 수')
+    parser.add_argument('--latency-ms', type=float, default=400, help='대역 OpenAI 기본 응답 지연(ms)')
+    parser.add_argument('--token-latency-ms', type=float, default=8, help='대역 OpenAI 응답 토큰당 지연(ms)')
+    parser.add_argument('--concurrency', type=int, default=8, help='제목별 호출 동시 실행 수 (순차 실행과 함께 측정)')
+    parser.add_argument('--input-price', type=float, default=INPUT_PRICE, help='입력 100만 토큰당 가격(USD)')
+    parser.add_argument('--output-price', type=float, default=OUTPUT_PRICE, help='출력 100만 토큰당 가격(USD)')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+    args = parser.parse_args()
+
+    upstreams = FakeUpstreams(articles_per_day=0, openai_latency=args.latency_ms / 1000,
+                              openai_token_latency=args.token_latency_ms / 1000).start()
+    os.environ.update(upstreams.backend_env())
+    # 비교 중 클라이언트 측 유량 제한에 걸리지 않도록
+    os.environ.setdefault('OPENAI_RPM_LIMIT', '100000')
+    os.environ.setdefault('OPENAI_TPM_LIMIT', '100000000')
+
+    from utils.gpt_client import GPTClient
+
+    documents = make_documents('2026-10-18', args.titles)
+    items = [{'title': doc['title'], 'category': doc['category'][0] if doc['category'] else None}
+             for doc in documents]
+    runs = []
+    try:
+        for concurrency in (1, args.concurrency):
+            client = GPTClient()
+            succeeded, seconds = run_per_title(client, items, concurrency)
+            prompt_tokens, completion_tokens = usage_of(client, 'hashtags')
+            runs.append(summarize(f'per_title_x{concurrency}', client.get_stats()['calls']['calls'],
+                                  prompt_tokens, completion_tokens, seconds, succeeded, len(items),
+                                  args.input_price, args.output_price))
+
+        client = GPTClient()
+        started = time.perf_counter()
+        result = client.generate_batch_hashtags(items)
+        seconds = time.perf_counter() - started
+        runs.append(summarize('batched', result['batches'], result['usage']['prompt_tokens'],
+                              result['usage']['completion_tokens'], seconds, result['succeeded'], len(items),
+                              args.input_price, args.output_price))
+    finally:
+        upstreams.stop()
+
+    baseline = runs[0]
+    batched = runs[-1]
+    output = {
+        'titles': args.titles,
+        'latency_ms': args.latency_ms,
+        'token_latency_ms': args.token_latency_ms,
+        'runs': runs,
+        'batched_vs_per_title': {
+            'calls_ratio': round(baseline['calls'] / max(1, batched['calls']), 2),
+            'prompt_token_ratio': round(baseline['prompt_tokens'] / max(1, batched['prompt_tokens']), 2),
+            'cost_ratio': round(baseline['cost_usd'] / batched['cost_usd'], 2) if batched['cost_usd'] else None,
+            'speedup_vs_sequential': round(baseline['seconds'] / batched['seconds'], 2),
+            'speedup_vs_concurrent': round(runs[1]['seconds'] / batched['seconds'], 2)
+        }
+    }
+    print(json.dumps(output, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+app 모듈 임포트 시간 프로파일 스크립트
+python -X importtime 출력을 모아 임포트 비용이 큰 모듈(누적/자체 시간)을 정리합니다.
+콜드 스타트 최적화 전후 비교와 무거운 의존성이 시작 경로에 다시 들어왔는지 확인하는 데 사용합니다.
+
+사용 예:
+    python benchmarks/import_profile.py --top 20
+    python benchmarks/import_profile.py --module asgi --output import_profile.json
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# "import time:   self [us] | cumulative | imported package"
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)')
+
+
+def profile_import(module='app', workdir=None, env=None):
+    """
+    새 인터프리터에서 모듈을 임포트하며 모듈별 임포트 시간을 수집합니다.
+
+    Returns:
+        list: [{'module', 'self_ms', 'cumulative_ms', 'depth'}] (임포트 순서)
+    """
+    process_env = dict(os.environ)
+    process_env.setdefault('BIGKINDS_API_KEY', 'import-profile')
+    process_env.setdefault('FLASK_ENV', 'production')
+    process_env['PYTHONPATH'] = BACKEND_DIR
+    process_env.update(env or {})
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=workdir or tempfile.mkdtemp(prefix='import-profile-'),
+        env=process_env, capture_output=True, text=True, check=True
+    )
+
+    entries = []
+    for line in completed.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        entries.append({
+            'module': name,
+            'self_ms': int(self_us) / 1000,
+            'cumulative_ms': int(cumulative_us) / 1000,
+            'depth': (len(indent) - 1) // 2
+        })
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description='app 모듈 임포트 시간 프로파일')
+    parser.add_argument('--module', default='app', help='임포트할 모듈 (app 또는 asgi)')
+    parser.add_argument('--top', type=int, default=15, help='출력할 상위 모듈 수')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+    args = parser.parse_args()
+
+    entries = profile_import(args.module)
+    target = next(entry for entry in entries if entry['module'] == args.module)
+    # 최상위(직접 임포트한) 패키지별 누적 시간
+    top_level = sorted((entry for entry in entries if entry['depth'] <= 1 and entry['module'] != args.module),
+                       key=lambda entry: entry['cumulative_ms'], reverse=True)
+    result = {
+        'module': args.module,
+        'total_ms': round(target['cumulative_ms'], 1),
+        'module_body_ms': round(target['self_ms'], 1),
+        'modules_imported': len(entries),
+        'top_cumulative': [
+            {'module': entry['module'], 'cumulative_ms': round(entry['cumulative_ms'], 1)}
+            for entry in top_level[:args.top]
+        ],
+        'top_self': [
+            {'module': entry['module'], 'self_ms': round(entry['self_ms'], 1)}
+            for entry in sorted(entries, key=lambda entry: entry['self_ms'], reverse=True)[:args.top]
+        ]
+    }
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,437 @@
+#!/usr/bin/env python3
+"""
+백엔드 부하 테스트 묶음
+로컬 빅카인즈/OpenAI 대역 서버(fake_upstreams.py)에 연결한 백엔드를 띄우고,
+뉴스 조회(/api/news, 스트리밍 /api/news?format=ndjson, /api/news/hours), 상태 변경, 콘텐츠 생성, SSE 전달을
+정해진 동시성으로 실행하여 시나리오별 p50/p95/p99 지연(과 첫 바이트까지 시간), 처리량, 오류 수와 서버 RSS를 JSON으로 남깁니다.
+같은 옵션으로 측정한 이전 결과(--baseline)와 p95/처리량 변화를 비교할 수 있습니다.
+
+사용 예:
+    python benchmarks/load_suite.py --output bench.json
+    python benchmarks/load_suite.py --scenarios news news_stream hours --concurrency 8 --duration 20 --baseline bench.json
+    python benchmarks/load_suite.py --server uvicorn --openai-latency-ms 1500 --scenarios generate sse
+"""
+
+import argparse
+import http.client
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from fake_upstreams import FakeUpstreams  # noqa: E402
+from startup_time import BACKEND_DIR, free_port, server_command  # noqa: E402
+
+SCENARIOS = ['news', 'news_stream', 'hours', 'status', 'generate', 'sse']
+
+# gunicorn(--threads 8)에서는 SSE 연결이 스레드를 하나씩 차지하므로 상태 변경 요청용 스레드를 남겨 둠
+GUNICORN_SSE_CLIENT_LIMIT = 6
+
+
+def percentile(values, pct):
+    """백분위수 (values는 정렬된 목록)"""
+    if not values:
+        return None
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def summarize(latencies, errors, duration, extra=None):
+    """지연 목록(초)을 백분위수/처리량 요약으로"""
+    latencies = sorted(latencies)
+    result = {
+        'requests': len(latencies),
+        'errors': errors,
+        'throughput_rps': round(len(latencies) / duration, 2) if duration else None,
+        'p50_ms': None,
+        'p95_ms': None,
+        'p99_ms': None,
+        'max_ms': None
+    }
+    if latencies:
+        result.update({
+            'p50_ms': round(percentile(latencies, 50) * 1000, 2),
+            'p95_ms': round(percentile(latencies, 95) * 1000, 2),
+            'p99_ms': round(percentile(latencies, 99) * 1000, 2),
+            'max_ms': round(latencies[-1] * 1000, 2)
+        })
+    result.update(extra or {})
+    return result
+
+
+def process_tree_rss(pid):
+    """프로세스와 자식 프로세스(gunicorn 워커 등)의 RSS 합계(바이트, /proc 기준)"""
+    total = 0
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f'/proc/{current}/status') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        total += int(line.split()[1]) * 1024
+                        break
+            with open(f'/proc/{current}/task/{current}/children') as f:
+                pending.extend(int(child) for child in f.read().split())
+        except (OSError, ValueError):
+            continue
+    return total or None
+
+
+class RSSSampler:
+    """측정 중 서버 RSS 최대값 기록"""
+
+    def __init__(self, pid, interval=0.2):
+        self.pid = pid
+        self.interval = interval
+        self.peak = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self):
+        if self.pid:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.is_set():
+            rss = process_tree_rss(self.pid)
+            if rss and (self.peak is None or rss > self.peak):
+                self.peak = rss
+            self._stop.wait(self.interval)
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+
+
+def spawn_backend(server, workdir, env):
+    """대역 서버에 연결한 백엔드 실행"""
+    port = free_port()
+    process_env = dict(os.environ)
+    process_env.update({
+        'FLASK_ENV': 'production',
+        'PYTHONPATH': BACKEND_DIR,
+        # 클라이언트 측 유량 제한이 측정을 가리지 않도록 넉넉하게
+        'OPENAI_RPM_LIMIT': '1000000',
+        'OPENAI_TPM_LIMIT': '1000000000',
+        'PREGEN_ENABLED': 'false'
+    })
+    process_env.update(env)
+    process = subprocess.Popen(server_command(server, port), cwd=workdir, env=process_env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{port}/health', timeout=1).read()
+            return process, f'http://127.0.0.1:{port}'
+        except OSError:
+            if process.poll() is not None:
+                raise RuntimeError(f'백엔드가 종료되었습니다 (exit code {process.returncode})')
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError('백엔드가 시작되지 않았습니다.')
+
+
+def run_http_scenario(base_url, make_request, concurrency, duration, warmup=0):
+    """
+    동시 연결 수만큼 스레드를 두고 정해진 시간 동안 요청을 반복합니다.
+
+    Args:
+        make_request (callable): (워커 번호, 반복 번호) -> (method, path, body)
+        warmup (int): 측정 전 워커별 예열 요청 수 (업스트림/캐시 첫 호출 제외)
+    """
+    host, port = base_url.split('://', 1)[1].split(':')
+    latencies = []
+    first_bytes = []
+    errors = [0]
+    response_bytes = [0]
+    lock = threading.Lock()
+    deadline = [None]
+    # 모든 워커가 예열을 마친 시점부터 측정 시간 시작
+    start_barrier = threading.Barrier(
+        concurrency + 1, action=lambda: deadline.__setitem__(0, time.monotonic() + duration))
+
+    def send(conn, method, path, body):
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        conn.request(method, path, json.dumps(body) if body is not None else None, headers)
+        response = conn.getresponse()
+        # 응답 헤더는 첫 본문 조각과 함께 오므로 헤더 수신 시점을 첫 바이트 시점으로 봄
+        first_byte = time.perf_counter()
+        data = response.read()
+        return response.status, len(data), first_byte
+
+    def worker(index):
+        conn = http.client.HTTPConnection(host, int(port), timeout=120)
+        for i in range(warmup):
+            try:
+                send(conn, *make_request(index, -1 - i))
+            except (OSError, http.client.HTTPException):
+                conn.close()
+        start_barrier.wait()
+        local = []
+        local_first = []
+        local_errors = 0
+        local_bytes = 0
+        i = 0
+        while time.monotonic() < deadline[0]:
+            method, path, body = make_request(index, i)
+            started = time.perf_counter()
+            try:
+                status, size, first_byte = send(conn, method, path, body)
+                if status < 400:
+                    local.append(time.perf_counter() - started)
+                    local_first.append(first_byte - started)
+                    local_bytes += size
+                else:
+                    local_errors += 1
+            except (OSError, http.client.HTTPException):
+                local_errors += 1
+                conn.close()
+            i += 1
+        conn.close()
+        with lock:
+            latencies.extend(local)
+            first_bytes.extend(local_first)
+            errors[0] += local_errors
+            response_bytes[0] += local_bytes
+
+    threads = [threading.Thread(target=worker, args=(index,), daemon=True) for index in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    start_barrier.wait()
+    started = deadline[0] - duration
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+    first_bytes.sort()
+    return summarize(latencies, errors[0], elapsed, {
+        'concurrency': concurrency,
+        'ttfb_p50_ms': round(percentile(first_bytes, 50) * 1000, 1) if first_bytes else None,
+        'ttfb_p95_ms': round(percentile(first_bytes, 95) * 1000, 1) if first_bytes else None,
+        'response_mb': round(response_bytes[0] / 1048576, 2)
+    })
+
+
+def run_sse_scenario(base_url, clients, updates, interval):
+    """
+    SSE 연결 여러 개를 열어 두고 상태 변경을 보낸 뒤, 각 연결에 이벤트가 도착하기까지의 지연을 측정합니다.
+    (배치 전송 없이 batch_ms=0으로 연결, 스레드 수에 묶인 서버에서는 일부만 연결될 수 있음 - connected로 보고)
+    """
+    host, port = base_url.split('://', 1)[1].split(':')
+    received = [dict() for _ in range(clients)]
+    connected = [0]
+    connected_lock = threading.Condition()
+    stop = threading.Event()
+
+    def listen(index):
+        sock = socket.create_connection((host, int(port)))
+        sock.sendall(b'GET /api/events?batch_ms=0 HTTP/1.1\r\nHost: localhost\r\n\r\n')
+        sock.settimeout(0.5)
+        buffer = b''
+        ready = False
+        while not stop.is_set():
+            try:
+                chunk = sock.recv(65536)
+            except socket.timeout:
+                continue
+            if not chunk:
+                break
+            buffer += chunk
+            if not ready and b'retry:' in buffer:
+                ready = True
+                with connected_lock:
+                    connected[0] += 1
+                    connected_lock.notify_all()
+            while b'\n\n' in buffer:
+                message, buffer = buffer.split(b'\n\n', 1)
+                for line in message.split(b'\n'):
+                    if not line.startswith(b'data: '):
+                        continue
+                    event = json.loads(line[6:])
+                    events = event['data']['events'] if event.get('type') == 'batch' else [event]
+                    for item in events:
+                        marker = (item.get('data') or {}).get('news_id', '')
+                        if marker.startswith('sse-bench-'):
+                            received[index].setdefault(marker, time.monotonic())
+        sock.close()
+
+    listeners = [threading.Thread(target=listen, args=(index,), daemon=True) for index in range(clients)]
+    for listener in listeners:
+        listener.start()
+    with connected_lock:
+        connected_lock.wait_for(lambda: connected[0] >= clients, timeout=10)
+
+    sent = {}
+    for i in range(updates):
+        marker = f'sse-bench-{i}'
+        request = urllib.request.Request(
+            f'{base_url}/api/news/status',
+            data=json.dumps({'news_id': marker, 'status': '작업중'}).encode(),
+            headers={'Content-Type': 'application/json'},
+            method='POST'
+        )
+        sent[marker] = time.monotonic()
+        urllib.request.urlopen(request, timeout=30).read()
+        time.sleep(interval)
+    time.sleep(1.0)
+    stop.set()
+    for listener in listeners:
+        listener.join(2)
+
+    latencies = [
+        client[marker] - sent_at
+        for client in received for marker, sent_at in sent.items() if marker in client
+    ]
+    expected = connected[0] * updates
+    return summarize(latencies, expected - len(latencies), 0, {
+        'clients': clients,
+        'connected': connected[0],
+        'updates': updates,
+        'delivered': len(latencies)
+    })
+
+
+def build_requests(args):
+    """시나리오별 요청 생성 함수"""
+    today = datetime.now()
+    dates = [(today - timedelta(days=offset)).strftime('%Y-%m-%d') for offset in range(args.dates)]
+
+    def news(index, i):
+        return 'GET', f'/api/news?date={dates[(index + i) % len(dates)]}&limit={args.limit}', None
+
+    def news_stream(index, i):
+        return 'GET', f'/api/news?date={dates[(index + i) % len(dates)]}&limit={args.limit}&format=ndjson', None
+
+    def hours(index, i):
+        return 'GET', f'/api/news/hours?date={dates[(index + i) % len(dates)]}&limit={args.limit}', None
+
+    def status(index, i):
+        body = {'news_id': f'bench-{index}-{i % 1000}', 'status': ('작업중', '작업완료', '미진행')[i % 3]}
+        return 'POST', '/api/news/status', body
+
+    def generate(index, i):
+        # 매번 다른 뉴스 ID로 생성 캐시를 거치지 않고 업스트림까지 호출
+        body = {
+            'news_id': f'gen-{index}-{i}-{time.monotonic_ns()}',
+            'title': '정부 금리 정책 발표에 시장 반응',
+            'content': '정부가 새로운 금리 정책을 발표했다. ' * 40,
+            'category': '경제>금융_재테크'
+        }
+        return 'POST', '/api/generate/instagram', body
+
+    return {'news': news, 'news_stream': news_stream, 'hours': hours, 'status': status, 'generate': generate}
+
+
+def git_commit():
+    """측정한 코드의 커밋 (비교용)"""
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=BACKEND_DIR,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(result, baseline):
+    """이전 결과 대비 시나리오별 p95/처리량 비율"""
+    changes = {}
+    for name, current in result['scenarios'].items():
+        previous = baseline.get('scenarios', {}).get(name)
+        if not previous:
+            continue
+        change = {}
+        if current.get('p95_ms') and previous.get('p95_ms'):
+            change['p95_ratio'] = round(current['p95_ms'] / previous['p95_ms'], 3)
+        if current.get('throughput_rps') and previous.get('throughput_rps'):
+            change['throughput_ratio'] = round(current['throughput_rps'] / previous['throughput_rps'], 3)
+        changes[name] = change
+    return changes
+
+
+def main():
+    parser = argparse.ArgumentParser(description='백엔드 부하 테스트 묶음 (로컬 업스트림 대역 사용)')
+    parser.add_argument('--scenarios', nargs='+', choices=SCENARIOS, default=SCENARIOS)
+    parser.add_argument('--server', choices=['gunicorn', 'uvicorn', 'flask'], default='gunicorn')
+    parser.add_argument('--concurrency', type=int, default=8, help='HTTP 시나리오 동시 연결 수')
+    parser.add_argument('--duration', type=float, default=10.0, help='HTTP 시나리오별 측정 시간(초)')
+    parser.add_argument('--articles', type=int, default=10000, help='대역 빅카인즈의 날짜별 기사 수')
+    parser.add_argument('--limit', type=int, default=10000, help='뉴스 조회 limit')
+    parser.add_argument('--dates', type=int, default=3, help='뉴스 조회에 번갈아 쓸 날짜 수')
+    parser.add_argument('--bigkinds-latency-ms', type=float, default=300, help='대역 빅카인즈 응답 지연(ms)')
+    parser.add_argument('--openai-latency-ms', type=float, default=800, help='대역 OpenAI 응답 지연(ms)')
+    parser.add_argument('--sse-clients', type=int, default=100, help='SSE 연결 수')
+    parser.add_argument('--sse-updates', type=int, default=20, help='SSE 시나리오 상태 변경 횟수')
+    parser.add_argument('--sse-interval', type=float, default=0.1, help='SSE 상태 변경 간격(초)')
+    parser.add_argument('--env', nargs='*', default=[], metavar='KEY=VALUE', help='백엔드 추가 환경변수')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+    parser.add_argument('--baseline', help='비교할 이전 결과 JSON 파일')
+    args = parser.parse_args()
+
+    upstreams = FakeUpstreams(
+        articles_per_day=args.articles,
+        bigkinds_latency=args.bigkinds_latency_ms / 1000,
+        openai_latency=args.openai_latency_ms / 1000
+    ).start()
+    env = upstreams.backend_env()
+    env.update(item.split('=', 1) for item in args.env)
+    workdir = tempfile.mkdtemp(prefix='load-suite-')
+    process, base_url = spawn_backend(args.server, workdir, env)
+
+    requests = build_requests(args)
+    result = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'cpu_count': os.cpu_count(),
+        'config': {key: value for key, value in vars(args).items() if key not in ('output', 'baseline')},
+        'rss_idle_mb': None,
+        'scenarios': {}
+    }
+    try:
+        rss = process_tree_rss(process.pid)
+        result['rss_idle_mb'] = round(rss / 1048576, 1) if rss else None
+        for name in args.scenarios:
+            with RSSSampler(process.pid) as sampler:
+                if name == 'sse':
+                    clients = args.sse_clients
+                    if args.server != 'uvicorn':
+                        clients = min(clients, GUNICORN_SSE_CLIENT_LIMIT)
+                    summary = run_sse_scenario(base_url, clients, args.sse_updates, args.sse_interval)
+                else:
+                    # 조회 시나리오는 날짜별 첫 업스트림 호출을 예열로 제외
+                    warmup = 1 if name in ('news', 'news_stream', 'hours') else 0
+                    summary = run_http_scenario(base_url, requests[name], args.concurrency, args.duration, warmup)
+            summary['rss_peak_mb'] = round(sampler.peak / 1048576, 1) if sampler.peak else None
+            result['scenarios'][name] = summary
+            print(json.dumps({name: summary}, ensure_ascii=False), file=sys.stderr)
+        result['upstream_calls'] = upstreams.stats.snapshot()
+    finally:
+        process.terminate()
+        try:
+            process.wait(10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        upstreams.stop()
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            result['compared_to'] = {'file': args.baseline, 'changes': compare(result, json.load(f))}
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+로깅 방식별 요청 스레드 부담 측정 스크립트
+여러 스레드가 라우트와 같은 패턴(요청마다 debug 몇 줄 + 가끔 info/warning)으로 로그를 남길 때,
+기존 방식(basicConfig DEBUG, 호출 스레드에서 바로 stdout 출력)과 큐 기반 비동기 파이프라인에서
+로그 호출에 걸린 시간(p50/p99)과 전체 소요 시간을 비교합니다.
+stdout 수집기(컨테이너 로그 에이전트 등)가 느린 상황을 쓰기 지연(--write-latency-us)으로 흉내 냅니다.
+
+사용 예:
+    python benchmarks/logging_overhead.py --threads 8 --requests 2000 --write-latency-us 50
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import log_config  # noqa: E402
+
+
+class SlowStream(io.TextIOBase):
+    """쓰기마다 지연이 있는 출력 스트림 (느린 stdout 수집기 흉내)"""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.lines = 0
+
+    def write(self, text):
+        # 파이프처럼 한 번에 한 스레드만 쓸 수 있음
+        with self.lock:
+            if self.latency:
+                time.sleep(self.latency)
+            self.lines += text.count('\n')
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+def reset_root():
+    """루트 로거와 파이프라인 상태 초기화"""
+    log_config.stop_logging()
+    log_config._handler = None
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+
+
+def simulate_requests(logger, threads, requests):
+    """라우트 로그 패턴으로 요청 처리를 흉내 내며 로그 호출 시간 측정"""
+    durations = []
+    lock = threading.Lock()
+
+    def worker(index):
+        local = []
+        for i in range(requests):
+            started = time.perf_counter()
+            logger.debug("React 앱 요청: %s", f'/news/{i}')
+            logger.debug("정적 파일 요청: /static/%s", 'js/main.js')
+            if i % 10 == 0:
+                logger.info("상태 변경: %s -> %s", f'news-{index}-{i}', '작업중')
+            if i % 50 == 0:
+                logger.warning("날짜 파싱 오류: %s, %s", 'invalid', 'bad format')
+            local.append(time.perf_counter() - started)
+        with lock:
+            durations.extend(local)
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    started = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    durations.sort()
+    return {
+        'wall_seconds': round(elapsed, 3),
+        'per_request_p50_us': round(durations[len(durations) // 2] * 1e6, 1),
+        'per_request_p99_us': round(durations[int(len(durations) * 0.99)] * 1e6, 1),
+        'per_request_max_us': round(durations[-1] * 1e6, 1)
+    }
+
+
+def run(mode, args):
+    """방식 하나 측정"""
+    reset_root()
+    stream = SlowStream(args.write_latency_us / 1e6)
+    if mode == 'basic_debug':
+        logging.basicConfig(level=logging.DEBUG, stream=stream)
+    else:
+        os.environ['LOG_LEVEL'] = 'INFO' if mode == 'queue_info' else 'DEBUG'
+        # queue_debug_unlimited: 반복 생략 없이 큐 효과만 측정
+        os.environ['LOG_RATE_LIMIT'] = '0' if mode == 'queue_debug_unlimited' else '20'
+        log_config.configure_logging(stream)
+    result = simulate_requests(logging.getLogger('bench'), args.threads, args.requests)
+    started = time.perf_counter()
+    log_config.stop_logging()
+    result['drain_seconds'] = round(time.perf_counter() - started, 3)
+    result['lines_written'] = stream.lines
+    result['logging'] = log_config.get_logging_stats()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='로깅 방식별 요청 스레드 부담 측정')
+    parser.add_argument('--threads', type=int, default=8, help='요청 스레드 수')
+    parser.add_argument('--requests', type=int, default=2000, help='스레드별 요청 수')
+    parser.add_argument('--write-latency-us', type=float, default=50, help='출력 한 번당 지연(마이크로초)')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+    args = parser.parse_args()
+
+    os.environ.setdefault('LOG_FORMAT', 'json')
+    result = {
+        'threads': args.threads,
+        'requests_per_thread': args.requests,
+        'write_latency_us': args.write_latency_us,
+        'modes': {
+            mode: run(mode, args)
+            for mode in ('basic_debug', 'queue_debug_unlimited', 'queue_debug', 'queue_info')
+        }
+    }
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
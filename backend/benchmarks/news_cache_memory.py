@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+기사 캐시 메모리 비교 스크립트
+빅카인즈 응답을 파싱한 그대로의 dict 목록과 압축 레코드(NewsDayCache) 보관 시
+메모리 사용량(tracemalloc)과 응답용 dict 변환 시간을 같은 합성 데이터로 측정합니다.
+
+사용 예:
+    python benchmarks/news_cache_memory.py --articles 10000 --days 7
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.news_cache import NewsDayCache  # noqa: E402
+
+PROVIDERS = ['경향신문', '국민일보', '동아일보', '문화일보', '서울신문', '세계일보', '조선일보',
+             '중앙일보', '한겨레', '한국일보', '매일경제', '한국경제', 'KBS', 'MBC', 'SBS', 'YTN']
+CATEGORIES = ['정치>국회_정당', '정치>행정_자치', '경제>금융_재테크', '경제>산업_기업', '사회>사건_사고',
+              '사회>교육_시험', '국제>아시아', '국제>미국_북미', 'IT_과학>인터넷_SNS', '문화>전시_공연']
+INCIDENTS = ['사회>사건_사고>교통사고', '사회>사건_사고>화재', '경제>부동산>분양', '']
+
+
+def make_day_payload(date, articles, seed):
+    """하루치 빅카인즈 응답 본문(JSON 문자열) - 실제처럼 파싱 시 문자열이 따로 생성되도록 JSON으로 만듦"""
+    rng = random.Random(seed)
+    compact = date.replace('-', '')
+    documents = []
+    for i in range(articles):
+        provider = rng.choice(PROVIDERS)
+        documents.append({
+            'title': f'{provider} 기사 제목 {i} ' + '가' * rng.randint(10, 40),
+            'news_id': f'0{rng.randint(1000000, 9999999)}.{compact}{i:06d}{rng.randint(10, 99)}',
+            'published_at': f'{date}T{i % 24:02d}:{i % 60:02d}:00.000+09:00',
+            'content': '본문 ' * rng.randint(20, 60),
+            'provider': provider,
+            'byline': f'{provider} 기자' if rng.random() < 0.5 else '',
+            'provider_link_page': f'https://news.example.com/{compact}/{i}',
+            'dateline': f'{date} {i % 24:02d}:{i % 60:02d}:00',
+            'enveloped_at': f'{date}T{i % 24:02d}:{i % 60:02d}:30.000+09:00',
+            'hilight': '',
+            'category': rng.sample(CATEGORIES, rng.randint(1, 3)),
+            'category_incident': [rng.choice(INCIDENTS)],
+            'provider_subject': [{'code': '', 'name': ''}],
+            'subject_info': ['', '', '']
+        })
+    return json.dumps({'result': 0, 'return_object': {'documents': documents}}, ensure_ascii=False)
+
+
+def measure(build):
+    """build()가 만든 객체가 붙잡고 있는 메모리(바이트)와 만든 객체"""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, held
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기사 캐시 메모리 비교')
+    parser.add_argument('--articles', type=int, default=10000, help='하루 기사 수')
+    parser.add_argument('--days', type=int, default=7, help='캐시할 날짜 수')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+    args = parser.parse_args()
+
+    dates = [f'2026-10-{day + 1:02d}' for day in range(args.days)]
+    payloads = [make_day_payload(date, args.articles, seed) for seed, date in enumerate(dates)]
+
+    def build_dicts():
+        return [json.loads(payload)['return_object']['documents'] for payload in payloads]
+
+    def build_records():
+        cache = NewsDayCache(max_entries=args.days)
+        for date, payload in zip(dates, payloads):
+            documents = json.loads(payload)['return_object']['documents']
+            cache.put(date, '', args.articles, documents)
+            del documents
+        return cache
+
+    dict_bytes, days = measure(build_dicts)
+    record_bytes, cache = measure(build_records)
+
+    # 변환 결과가 원래 dict와 같은지 확인하고, 하루치 변환 시간 측정
+    snapshot = cache.get(dates[0], '', args.articles, today=dates[-1])
+    started = time.perf_counter()
+    converted = snapshot.to_dicts()
+    to_dicts_seconds = time.perf_counter() - started
+    assert converted == days[0]
+
+    total = args.articles * args.days
+    result = {
+        'articles_per_day': args.articles,
+        'days': args.days,
+        'dicts': {
+            'bytes': dict_bytes,
+            'bytes_per_article': round(dict_bytes / total)
+        },
+        'records': {
+            'bytes': record_bytes,
+            'bytes_per_article': round(record_bytes / total)
+        },
+        'memory_ratio': round(dict_bytes / record_bytes, 2),
+        'to_dicts_seconds_per_day': round(to_dicts_seconds, 4)
+    }
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
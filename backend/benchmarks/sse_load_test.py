@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+SSE 동시 접속 부하 테스트 스크립트
+한 프로세스에 수백 개의 /api/events 연결을 열어 두고 상태 변경 이벤트를 발생시킨 뒤,
+모든 연결이 이벤트를 받기까지 걸린 시간을 측정합니다.
+
+사용 예:
+    python benchmarks/sse_load_test.py --clients 500 --events 20            # ASGI 서버를 직접 띄워 측정
+    python benchmarks/sse_load_test.py --url http://localhost:8080 --clients 300
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from urllib.parse import urlparse
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def percentile(values, pct):
+    """백분위수 (values는 정렬된 목록)"""
+    if not values:
+        return None
+    index = min(len(values) - 1, int(round(pct / 100 * (len(values) - 1))))
+    return values[index]
+
+
+def free_port():
+    """사용 가능한 로컬 포트"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def spawn_server(mode, port, workdir):
+    """측정용 서버 실행 (asgi: uvicorn, wsgi: gunicorn --threads 8)"""
+    env = dict(os.environ)
+    env.setdefault('BIGKINDS_API_KEY', 'load-test')
+    env['FLASK_ENV'] = 'production'
+    env['PYTHONPATH'] = BACKEND_DIR
+    if mode == 'asgi':
+        command = [sys.executable, '-m', 'uvicorn', 'asgi:application',
+                   '--host', '127.0.0.1', '--port', str(port), '--log-level', 'warning']
+    else:
+        command = [sys.executable, '-m', 'gunicorn', '--bind', f'127.0.0.1:{port}',
+                   '--workers', '1', '--threads', '8', '--timeout', '0', 'app:app']
+    process = subprocess.Popen(command, cwd=workdir, env=env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{port}/health', timeout=1).read()
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError('서버가 시작되지 않았습니다.')
+
+
+class SSEClient:
+    """원시 소켓 기반 경량 SSE 클라이언트"""
+
+    def __init__(self, host, port, batch_ms=None):
+        self.host = host
+        self.port = port
+        self.path = '/api/events' if batch_ms is None else f'/api/events?batch_ms={batch_ms}'
+        self.received = {}
+        self.messages = 0
+        self.connected = asyncio.Event()
+
+    async def run(self, stop):
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        writer.write(
+            f"GET {self.path} HTTP/1.1\r\nHost: {self.host}\r\n"
+            f"Accept: text/event-stream\r\n\r\n".encode()
+        )
+        await writer.drain()
+        try:
+            buffer = b''
+            while not stop.is_set():
+                chunk = await reader.read(65536)
+                if not chunk:
+                    break
+                buffer += chunk
+                if b'retry:' in buffer:
+                    self.connected.set()
+                while b'\n\n' in buffer:
+                    message, buffer = buffer.split(b'\n\n', 1)
+                    for line in message.split(b'\n'):
+                        if line.startswith(b'data: '):
+                            self.messages += 1
+                            event = json.loads(line[6:])
+                            events = event['data']['events'] if event.get('type') == 'batch' else [event]
+                            for item in events:
+                                marker = item.get('data', {}).get('news_id', '')
+                                if marker.startswith('load-test-'):
+                                    self.received[marker] = time.monotonic()
+        finally:
+            writer.close()
+
+
+def post_status(base_url, news_id):
+    """상태 변경 요청 (이벤트 발생)"""
+    request = urllib.request.Request(
+        f"{base_url}/api/news/status",
+        data=json.dumps({'news_id': news_id, 'status': '작업중'}).encode(),
+        headers={'Content-Type': 'application/json'},
+        method='POST'
+    )
+    urllib.request.urlopen(request, timeout=10).read()
+
+
+async def run_load_test(base_url, clients, events, connect_timeout, batch_ms=None, interval=0.05):
+    """부하 테스트 실행 후 결과 dict 반환"""
+    parsed = urlparse(base_url)
+    stop = asyncio.Event()
+    sse_clients = [SSEClient(parsed.hostname, parsed.port or 80, batch_ms) for _ in range(clients)]
+    tasks = [asyncio.ensure_future(client.run(stop)) for client in sse_clients]
+
+    started = time.monotonic()
+    try:
+        await asyncio.wait_for(
+            asyncio.gather(*(client.connected.wait() for client in sse_clients)),
+            timeout=connect_timeout
+        )
+    except asyncio.TimeoutError:
+        pass
+    connected = sum(1 for client in sse_clients if client.connected.is_set())
+    connect_seconds = time.monotonic() - started
+
+    loop = asyncio.get_running_loop()
+    sent_at = {}
+    failed_posts = 0
+    for i in range(events):
+        marker = f'load-test-{i}'
+        sent_at[marker] = time.monotonic()
+        try:
+            await loop.run_in_executor(None, post_status, base_url, marker)
+        except OSError:
+            # 서버 스레드가 모두 SSE 연결에 묶이면 일반 요청도 처리되지 않음
+            failed_posts += 1
+        await asyncio.sleep(interval)
+    await asyncio.sleep(1.0)
+
+    stop.set()
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+    latencies = sorted(
+        (received - sent_at[marker]) * 1000
+        for client in sse_clients
+        for marker, received in client.received.items()
+    )
+    expected = connected * events
+    return {
+        'clients': clients,
+        'connected': connected,
+        'connect_seconds': round(connect_seconds, 3),
+        'events': events,
+        'failed_posts': failed_posts,
+        'batch_ms': batch_ms,
+        'deliveries': len(latencies),
+        'messages': sum(client.messages for client in sse_clients),
+        'delivery_ratio': round(len(latencies) / expected, 4) if expected else 0,
+        'latency_ms': {
+            'p50': round(percentile(latencies, 50), 2) if latencies else None,
+            'p95': round(percentile(latencies, 95), 2) if latencies else None,
+            'p99': round(percentile(latencies, 99), 2) if latencies else None,
+            'max': round(latencies[-1], 2) if latencies else None,
+            'mean': round(statistics.mean(latencies), 2) if latencies else None
+        }
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SSE 동시 접속 부하 테스트')
+    parser.add_argument('--url', help='측정할 서버 주소 (없으면 서버를 직접 실행)')
+    parser.add_argument('--mode', choices=['asgi', 'wsgi'], default='asgi', help='직접 실행할 서버 모드')
+    parser.add_argument('--clients', type=int, default=500, help='동시 SSE 연결 수')
+    parser.add_argument('--events', type=int, default=20, help='발생시킬 이벤트 수')
+    parser.add_argument('--batch-ms', type=int, help='연결별 배치 전송 주기(밀리초, 0이면 즉시 전송)')
+    parser.add_argument('--interval', type=float, default=0.05, help='이벤트 발생 간격(초)')
+    parser.add_argument('--connect-timeout', type=float, default=20.0, help='연결 대기 시간(초)')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+    args = parser.parse_args()
+
+    process = None
+    workdir = tempfile.mkdtemp(prefix='sse-load-')
+    base_url = args.url
+    if not base_url:
+        port = free_port()
+        process = spawn_server(args.mode, port, workdir)
+        base_url = f'http://127.0.0.1:{port}'
+
+    try:
+        result = asyncio.run(run_load_test(base_url, args.clients, args.events, args.connect_timeout,
+                                           args.batch_ms, args.interval))
+        result['mode'] = args.mode if process else 'external'
+    finally:
+        if process:
+            process.terminate()
+            try:
+                process.wait(10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
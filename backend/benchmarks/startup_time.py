@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+콜드 스타트 측정 스크립트
+Cloud Run과 같은 방식(gunicorn app:app)으로 서버를 띄우고 첫 /health 200 응답까지의 시간을 측정합니다.
+프로세스 시작 ~ 모듈 임포트 ~ 워커 준비까지 사용자가 체감하는 지연 전체가 포함됩니다.
+
+사용 예:
+    python benchmarks/startup_time.py --runs 5
+    python benchmarks/startup_time.py --server flask --runs 3 --output startup.json
+"""
+
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port():
+    """사용 가능한 로컬 포트"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def server_command(server, port):
+    """측정할 서버 실행 명령"""
+    if server == 'gunicorn':
+        return [sys.executable, '-m', 'gunicorn', '--bind', f'127.0.0.1:{port}',
+                '--workers', '1', '--threads', '8', '--timeout', '0', 'app:app']
+    if server == 'uvicorn':
+        return [sys.executable, '-m', 'uvicorn', 'asgi:application',
+                '--host', '127.0.0.1', '--port', str(port), '--log-level', 'warning']
+    return [sys.executable, '-c',
+            f"from app import app; app.run(host='127.0.0.1', port={port}, debug=False, use_reloader=False)"]
+
+
+def measure_startup(server='gunicorn', workdir=None, env=None, timeout=60.0):
+    """
+    서버 프로세스 시작부터 첫 /health 200 응답까지의 시간(초)을 측정합니다.
+
+    Args:
+        server (str): gunicorn, uvicorn 또는 flask(개발 서버)
+        workdir (str): 서버 작업 디렉토리 (상태 파일/정적 파일 위치, 없으면 임시 디렉토리)
+        env (dict): 추가 환경변수
+        timeout (float): 최대 대기 시간(초)
+
+    Returns:
+        float: 첫 정상 응답까지 걸린 시간(초)
+    """
+    workdir = workdir or tempfile.mkdtemp(prefix='startup-')
+    port = free_port()
+    process_env = dict(os.environ)
+    process_env.setdefault('BIGKINDS_API_KEY', 'startup-benchmark')
+    process_env.setdefault('FLASK_ENV', 'production')
+    process_env['PYTHONPATH'] = BACKEND_DIR
+    process_env.update(env or {})
+
+    started = time.monotonic()
+    process = subprocess.Popen(server_command(server, port), cwd=workdir, env=process_env,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        while time.monotonic() - started < timeout:
+            try:
+                with urllib.request.urlopen(f'http://127.0.0.1:{port}/health', timeout=1) as response:
+                    if response.status == 200:
+                        return time.monotonic() - started
+            except OSError:
+                if process.poll() is not None:
+                    raise RuntimeError(f'서버가 종료되었습니다 (exit code {process.returncode})')
+                time.sleep(0.01)
+        raise RuntimeError('서버가 제한 시간 내에 응답하지 않았습니다.')
+    finally:
+        process.terminate()
+        try:
+            process.wait(10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='콜드 스타트(첫 정상 응답까지 시간) 측정')
+    parser.add_argument('--server', choices=['gunicorn', 'uvicorn', 'flask'], default='gunicorn')
+    parser.add_argument('--runs', type=int, default=5, help='측정 횟수')
+    parser.add_argument('--workdir', help='서버 작업 디렉토리 (상태 파일/정적 빌드 포함 시 실제 환경과 유사)')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+    args = parser.parse_args()
+
+    samples = [measure_startup(args.server, args.workdir) for _ in range(args.runs)]
+    result = {
+        'server': args.server,
+        'runs': args.runs,
+        'time_to_healthy_seconds': {
+            'min': round(min(samples), 3),
+            'median': round(statistics.median(samples), 3),
+            'max': round(max(samples), 3)
+        },
+        'samples': [round(sample, 3) for sample in samples]
+    }
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
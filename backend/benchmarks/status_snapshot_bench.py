@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+뉴스 상태 저장 형식 비교 스크립트
+기존 방식(들여쓰기된 news_status.json 전체 저장/파싱)과 바이너리 스냅샷의
+저장 시간, 로드 시간, 파일 크기를 같은 합성 데이터로 측정합니다.
+
+사용 예:
+    python benchmarks/status_snapshot_bench.py --entries 500000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.status_snapshot import read_snapshot, write_snapshot  # noqa: E402
+
+STATUSES = ['미진행', '작업중', '작업완료']
+
+
+def make_status(entries, seed=42):
+    """실제 레코드와 같은 모양의 합성 상태 맵"""
+    rng = random.Random(seed)
+    status = {}
+    for i in range(entries):
+        record = {'status': rng.choice(STATUSES), 'has_content': rng.random() < 0.3}
+        if record['has_content']:
+            record['ai_generated_at'] = f'2026-10-{i % 28 + 1:02d}T10:{i % 60:02d}:00.000000'
+        if record['status'] != '미진행':
+            record['updated_at'] = f'2026-10-{i % 28 + 1:02d}T11:{i % 60:02d}:00.000000'
+        status[f'0110{i % 10000:04d}.2026{i % 12 + 1:02d}{i % 28 + 1:02d}{i:08d}'] = record
+    return status
+
+
+def timed(fn, repeat):
+    """여러 번 실행한 최소 시간(초)과 마지막 결과"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='뉴스 상태 저장 형식 비교')
+    parser.add_argument('--entries', type=int, default=500000, help='상태 레코드 수')
+    parser.add_argument('--repeat', type=int, default=3, help='측정 반복 횟수 (최소값 사용)')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+    args = parser.parse_args()
+
+    status = make_status(args.entries)
+    workdir = tempfile.mkdtemp(prefix='status-bench-')
+    json_path = os.path.join(workdir, 'news_status.json')
+    snapshot_path = os.path.join(workdir, 'news_status.snapshot')
+
+    def save_json():
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(status, f, ensure_ascii=False, indent=2)
+
+    def load_json():
+        with open(json_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    json_save, _ = timed(save_json, args.repeat)
+    json_load, loaded_json = timed(load_json, args.repeat)
+    snapshot_save, _ = timed(lambda: write_snapshot(snapshot_path, status), args.repeat)
+    snapshot_load, loaded_snapshot = timed(lambda: read_snapshot(snapshot_path), args.repeat)
+    assert loaded_json == status and loaded_snapshot == status
+
+    result = {
+        'entries': args.entries,
+        'json': {
+            'save_seconds': round(json_save, 3),
+            'load_seconds': round(json_load, 3),
+            'bytes': os.path.getsize(json_path)
+        },
+        'snapshot': {
+            'save_seconds': round(snapshot_save, 3),
+            'load_seconds': round(snapshot_load, 3),
+            'bytes': os.path.getsize(snapshot_path)
+        }
+    }
+    result['load_speedup'] = round(json_load / snapshot_load, 2)
+    result['save_speedup'] = round(json_save / snapshot_save, 2)
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
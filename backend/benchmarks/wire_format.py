@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+기사 목록 응답 형식 비교 스크립트
+하루치 기사 목록을 행 형식(/api/news 기본)과 열 형식(format=columnar)으로 직렬화하여
+응답 크기(원본/gzip), 직렬화 시간, 파싱+복원 시간을 측정합니다.
+node가 있으면 프론트엔드 디코더(frontend/src/hooks/columnar.js)로 브라우저와 같은 JSON.parse 시간도 측정합니다.
+
+사용 예:
+    python benchmarks/wire_format.py --articles 10000 --output wire.json
+"""
+
+import argparse
+import gzip
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_upstreams import make_documents  # noqa: E402
+from utils.columnar import encode_columnar, decode_columnar  # noqa: E402
+
+DECODER_JS = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+                          'frontend', 'src', 'hooks', 'columnar.js')
+
+NODE_SCRIPT = """
+const fs = require('fs');
+const [rowsPath, columnarPath, repeat] = process.argv.slice(1);
+%s
+const median = (values) => values.sort((a, b) => a - b)[Math.floor(values.length / 2)];
+const time = (fn) => {
+  const samples = [];
+  for (let i = 0; i < Number(repeat); i++) {
+    const started = process.hrtime.bigint();
+    fn();
+    samples.push(Number(process.hrtime.bigint() - started) / 1e6);
+  }
+  return median(samples);
+};
+const rowsText = fs.readFileSync(rowsPath, 'utf8');
+const columnarText = fs.readFileSync(columnarPath, 'utf8');
+const rows = JSON.parse(rowsText).data;
+const decoded = decodeColumnar(JSON.parse(columnarText).data);
+const keys = Object.keys(rows[0] || {}).sort();
+if (JSON.stringify(decoded, keys) !== JSON.stringify(rows, keys)) throw new Error('decoded rows differ');
+console.log(JSON.stringify({
+  rows_parse_ms: time(() => JSON.parse(rowsText)),
+  columnar_parse_decode_ms: time(() => decodeColumnar(JSON.parse(columnarText).data))
+}));
+"""
+
+
+def enriched_articles(date, count):
+    """/api/news가 내보내는 모양의 기사 목록 (상태 추가, 카테고리는 첫 값)"""
+    articles = make_documents(date, count)
+    for i, news in enumerate(articles):
+        news['status'] = ('미진행', '작업중', '작업완료')[i % 7 % 3]
+        news['has_content'] = i % 5 == 0
+        news['category'] = news['category'][0] if news['category'] else None
+    return articles
+
+
+def dumps(payload):
+    """Flask jsonify와 같은 설정(ASCII 이스케이프, 키 정렬, 공백 없음)으로 직렬화"""
+    return json.dumps(payload, ensure_ascii=True, sort_keys=True, separators=(',', ':'))
+
+
+def timed(fn, repeat):
+    """fn을 repeat번 실행한 중앙값(ms)과 마지막 결과"""
+    samples = []
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 2), result
+
+
+def measure_node(rows_text, columnar_text, repeat):
+    """node로 JSON.parse(+디코더) 시간 측정 (node가 없으면 None)"""
+    node = shutil.which('node')
+    if not node or not os.path.exists(DECODER_JS):
+        return None
+    with open(DECODER_JS, 'r', encoding='utf-8') as f:
+        decoder = f.read().replace('export const', 'const')
+    with tempfile.TemporaryDirectory() as workdir:
+        rows_path = os.path.join(workdir, 'rows.json')
+        columnar_path = os.path.join(workdir, 'columnar.json')
+        with open(rows_path, 'w', encoding='utf-8') as f:
+            f.write(rows_text)
+        with open(columnar_path, 'w', encoding='utf-8') as f:
+            f.write(columnar_text)
+        completed = subprocess.run(
+            [node, '-e', NODE_SCRIPT % decoder, rows_path, columnar_path, str(repeat)],
+            capture_output=True, text=True, check=True
+        )
+    return {key: round(value, 2) for key, value in json.loads(completed.stdout).items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='기사 목록 응답 형식 비교')
+    parser.add_argument('--articles', type=int, default=10000, help='하루 기사 수')
+    parser.add_argument('--repeat', type=int, default=7, help='시간 측정 반복 횟수 (중앙값)')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+    args = parser.parse_args()
+
+    articles = enriched_articles('2026-10-18', args.articles)
+
+    rows_ms, rows_text = timed(lambda: dumps({'success': True, 'format': 'rows', 'data': articles}), args.repeat)
+    columnar_ms, columnar_text = timed(
+        lambda: dumps({'success': True, 'format': 'columnar', 'data': encode_columnar(articles)}), args.repeat)
+
+    rows_parse_ms, parsed_rows = timed(lambda: json.loads(rows_text)['data'], args.repeat)
+    columnar_parse_ms, decoded = timed(lambda: decode_columnar(json.loads(columnar_text)['data']), args.repeat)
+    assert decoded == parsed_rows
+
+    rows_bytes = len(rows_text.encode('utf-8'))
+    columnar_bytes = len(columnar_text.encode('utf-8'))
+    rows_gzip = len(gzip.compress(rows_text.encode('utf-8'), 6))
+    columnar_gzip = len(gzip.compress(columnar_text.encode('utf-8'), 6))
+
+    result = {
+        'articles': args.articles,
+        'rows': {
+            'bytes': rows_bytes,
+            'gzip_bytes': rows_gzip,
+            'serialize_ms': rows_ms,
+            'python_parse_ms': rows_parse_ms
+        },
+        'columnar': {
+            'bytes': columnar_bytes,
+            'gzip_bytes': columnar_gzip,
+            'serialize_ms': columnar_ms,
+            'python_parse_decode_ms': columnar_parse_ms
+        },
+        'size_ratio': round(rows_bytes / columnar_bytes, 2),
+        'gzip_size_ratio': round(rows_gzip / columnar_gzip, 2),
+        'node': measure_node(rows_text, columnar_text, args.repeat)
+    }
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
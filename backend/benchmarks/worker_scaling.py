@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+gunicorn 워커 수별 처리량 및 워커 간 이벤트 전달 지연 측정 스크립트
+SHARED_STATE_DB(SQLite 변경 로그)를 켠 상태로 워커 수를 바꿔 가며 서버를 띄우고,
+상태 변경/요약 조회 요청 처리량과 다른 워커에서 발생한 이벤트가 SSE로 도착하기까지의 지연을 측정합니다.
+
+사용 예:
+    python benchmarks/worker_scaling.py --workers 1 2 4 --duration 10 --concurrency 16
+"""
+
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port():
+    """사용 가능한 로컬 포트"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def spawn_gunicorn(workers, port, workdir):
+    """공유 상태 모드로 gunicorn 실행"""
+    env = dict(os.environ)
+    env.setdefault('BIGKINDS_API_KEY', 'benchmark')
+    env['FLASK_ENV'] = 'production'
+    env['PYTHONPATH'] = BACKEND_DIR
+    env['SHARED_STATE_DB'] = os.path.join(workdir, 'shared_state.db')
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '--bind', f'127.0.0.1:{port}',
+         '--workers', str(workers), '--threads', '8', '--timeout', '0', 'app:app'],
+        cwd=workdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f'http://127.0.0.1:{port}/health', timeout=1).read()
+            # 모든 워커가 뜰 때까지 잠시 대기
+            time.sleep(1.0)
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError('gunicorn이 시작되지 않았습니다.')
+
+
+def load_worker(port, duration, worker_index, result_queue):
+    """별도 프로세스에서 상태 변경과 요약 조회를 번갈아 반복"""
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    completed = 0
+    errors = 0
+    deadline = time.monotonic() + duration
+    i = 0
+    while time.monotonic() < deadline:
+        try:
+            if i % 2 == 0:
+                body = json.dumps({'news_id': f'bench-{worker_index}-{i % 500}', 'status': '작업중'})
+                conn.request('POST', '/api/news/status', body, {'Content-Type': 'application/json'})
+            else:
+                conn.request('GET', '/api/news/status/summary')
+            response = conn.getresponse()
+            response.read()
+            if response.status == 200:
+                completed += 1
+            else:
+                errors += 1
+        except (OSError, http.client.HTTPException):
+            errors += 1
+            conn.close()
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        i += 1
+    result_queue.put((completed, errors))
+
+
+def measure_throughput(port, concurrency, duration):
+    """동시 요청 처리량 (요청/초)"""
+    queue = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=load_worker, args=(port, duration, index, queue))
+        for index in range(concurrency)
+    ]
+    for process in processes:
+        process.start()
+    results = [queue.get() for _ in processes]
+    for process in processes:
+        process.join()
+    completed = sum(result[0] for result in results)
+    errors = sum(result[1] for result in results)
+    return {
+        'requests': completed,
+        'errors': errors,
+        'requests_per_second': round(completed / duration, 1)
+    }
+
+
+def measure_propagation(port, samples):
+    """상태 변경 요청(새 연결 - 임의 워커)부터 SSE 연결(다른 워커일 수 있음) 수신까지의 지연"""
+    received = {}
+    ready = threading.Event()
+    stop = threading.Event()
+
+    def listen():
+        sock = socket.create_connection(('127.0.0.1', port))
+        sock.sendall(b"GET /api/events HTTP/1.1\r\nHost: localhost\r\n\r\n")
+        sock.settimeout(0.5)
+        buffer = b''
+        while not stop.is_set():
+            try:
+                chunk = sock.recv(65536)
+            except socket.timeout:
+                continue
+            if not chunk:
+                break
+            buffer += chunk
+            if b'retry:' in buffer:
+                ready.set()
+            while b'\n\n' in buffer:
+                message, buffer = buffer.split(b'\n\n', 1)
+                for line in message.split(b'\n'):
+                    if not line.startswith(b'data: '):
+                        continue
+                    event = json.loads(line[6:])
+                    events = event['data']['events'] if event.get('type') == 'batch' else [event]
+                    for item in events:
+                        marker = item.get('data', {}).get('news_id', '')
+                        if marker.startswith('propagation-'):
+                            received.setdefault(marker, time.monotonic())
+        sock.close()
+
+    listener = threading.Thread(target=listen, daemon=True)
+    listener.start()
+    ready.wait(10)
+
+    sent = {}
+    for i in range(samples):
+        marker = f'propagation-{i}'
+        request = urllib.request.Request(
+            f'http://127.0.0.1:{port}/api/news/status',
+            data=json.dumps({'news_id': marker, 'status': '작업완료'}).encode(),
+            headers={'Content-Type': 'application/json', 'Connection': 'close'},
+            method='POST'
+        )
+        sent[marker] = time.monotonic()
+        urllib.request.urlopen(request, timeout=10).read()
+        time.sleep(0.05)
+    time.sleep(1.0)
+    stop.set()
+
+    latencies = sorted((received[m] - sent[m]) * 1000 for m in sent if m in received)
+    if not latencies:
+        return {'samples': samples, 'delivered': 0}
+    return {
+        'samples': samples,
+        'delivered': len(latencies),
+        'p50_ms': round(latencies[len(latencies) // 2], 2),
+        'p99_ms': round(latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))], 2),
+        'max_ms': round(latencies[-1], 2)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='gunicorn 워커 수별 처리량 벤치마크')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4], help='측정할 워커 수 목록')
+    parser.add_argument('--concurrency', type=int, default=16, help='동시 부하 프로세스 수')
+    parser.add_argument('--duration', type=float, default=10.0, help='워커 수별 측정 시간(초)')
+    parser.add_argument('--samples', type=int, default=30, help='이벤트 전달 지연 측정 횟수')
+    parser.add_argument('--output', help='결과를 저장할 JSON 파일 경로')
+    args = parser.parse_args()
+
+    results = {'cpu_count': os.cpu_count(), 'runs': []}
+    for workers in args.workers:
+        workdir = tempfile.mkdtemp(prefix=f'workers-{workers}-')
+        port = free_port()
+        process = spawn_gunicorn(workers, port, workdir)
+        try:
+            run = {'workers': workers}
+            run['throughput'] = measure_throughput(port, args.concurrency, args.duration)
+            run['propagation'] = measure_propagation(port, args.samples)
+            results['runs'].append(run)
+            print(json.dumps(run, ensure_ascii=False))
+        finally:
+            process.terminate()
+            try:
+                process.wait(10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == '__main__':
+    main()
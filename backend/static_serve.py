@@ -1,22 +1,237 @@
 """
 정적 파일 서빙을 위한 미들웨어 및 유틸리티 함수
 Flask 애플리케이션이 React 빌드 파일들을 올바르게 서빙하도록 지원
+시작 시 빌드 파일을 메모리에 올리고 gzip/brotli 압축본을 미리 만들어 두어
+요청마다 디스크를 읽거나 압축하지 않습니다.
 """
 
 import os
+import gzip
+import json
+import time
+import hashlib
 import logging
-from flask import send_from_directory
+import mimetypes
+import threading
+from collections import namedtuple
+from email.utils import formatdate
+from types import MappingProxyType
+from flask import Response, request, send_from_directory
 from werkzeug.exceptions import NotFound
 
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 없으면 gzip만 제공
+    brotli = None
+
 logger = logging.getLogger(__name__)
 
+# 압축해서 보관할 파일 형식 (이미지/폰트 등 이미 압축된 형식은 제외)
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/json',
+                      'application/xml', 'image/svg+xml', 'application/manifest+json')
+
+# 이 크기보다 작은 파일은 압축 이득이 없어 원본만 보관
+MIN_COMPRESS_SIZE = 512
+
+
+def guess_content_type(filepath):
+    """파일 확장자로 Content-Type 결정"""
+    if filepath.endswith('.js'):
+        return 'application/javascript'
+    if filepath.endswith('.map'):
+        return 'application/json'
+    content_type = mimetypes.guess_type(filepath)[0] or 'application/octet-stream'
+    if content_type.startswith('text/'):
+        content_type += '; charset=utf-8'
+    return content_type
+
+
+def parse_accept_encoding(header):
+    """Accept-Encoding 헤더에서 허용된(q > 0) 인코딩 집합"""
+    accepted = set()
+    for part in (header or '').split(','):
+        name, _, params = part.strip().partition(';')
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        if name and q > 0:
+            accepted.add(name.strip().lower())
+    return accepted
+
+
+# 시작 시 만든 경로 인덱스의 항목
+StaticEntry = namedtuple('StaticEntry', ['base_path', 'size', 'mtime', 'content_type'])
+
+
+class StaticAsset:
+    """메모리에 올린 정적 파일 하나 (원본 + 압축본 + ETag)"""
+
+    __slots__ = ('full_path', 'mtime', 'content_type', 'variants', 'etag', 'last_modified')
+
+    def __init__(self, full_path, data, mtime, compress=True):
+        self.full_path = full_path
+        self.mtime = mtime
+        self.content_type = guess_content_type(full_path)
+        self.last_modified = formatdate(mtime, usegmt=True)
+        digest = hashlib.sha1(data).hexdigest()[:20]
+        self.etag = digest
+        self.variants = {'identity': data}
+        if compress:
+            self.compress()
+
+    def compress(self):
+        """gzip/brotli 압축본 생성 (압축 이득이 있는 경우만 보관)"""
+        data = self.variants['identity']
+        if len(data) < MIN_COMPRESS_SIZE or not self.content_type.startswith(COMPRESSIBLE_TYPES):
+            return
+        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        if len(compressed) < len(data):
+            self.variants['gzip'] = compressed
+        if brotli is not None:
+            compressed = brotli.compress(data, quality=11)
+            if len(compressed) < len(data):
+                self.variants['br'] = compressed
+
+    def select(self, accept_encoding):
+        """요청이 허용하는 가장 작은 표현 선택 (br > gzip > 원본, 아직 압축 전이면 있는 것 중에서)"""
+        accepted = parse_accept_encoding(accept_encoding)
+        for encoding in ('br', 'gzip'):
+            if encoding in self.variants and encoding in accepted:
+                return encoding
+        return 'identity'
+
+    def etag_for(self, encoding):
+        """표현(인코딩)별 강한 ETag - 바이트가 다르므로 인코딩마다 달라야 함"""
+        if encoding == 'identity':
+            return f'"{self.etag}"'
+        return f'"{self.etag}-{encoding}"'
+
+
+class StaticAssetCache:
+    """정적 파일 메모리 캐시 (개발 환경에서는 mtime이 바뀐 파일만 다시 읽음)"""
+
+    def __init__(self, reload=False, max_file_size=5 * 1024 * 1024):
+        """
+        Args:
+            reload (bool): 요청 시 mtime을 확인하여 바뀐 파일을 다시 읽을지 여부 (개발용)
+            max_file_size (int): 메모리에 올릴 최대 파일 크기(바이트) - 큰 파일은 디스크에서 서빙
+        """
+        self.reload = reload
+        self.max_file_size = max_file_size
+        self._assets = {}
+        self._lock = threading.Lock()
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.reloads = 0
+
+    def _load(self, full_path, compress=True):
+        """파일을 읽어 캐시에 등록 (크기 제한을 넘으면 None)"""
+        try:
+            stat = os.stat(full_path)
+        except OSError:
+            return None
+        if stat.st_size > self.max_file_size:
+            return None
+        with open(full_path, 'rb') as f:
+            asset = StaticAsset(full_path, f.read(), stat.st_mtime, compress=compress)
+        with self._lock:
+            self._assets[full_path] = asset
+        return asset
+
+    def preload(self, full_paths):
+        """
+        주어진 파일들을 미리 메모리에 올립니다.
+        압축(특히 brotli 최고 품질)은 느리므로 시작을 늦추지 않도록 백그라운드 스레드에서 만들고,
+        그 전까지는 원본으로 응답합니다.
+        """
+        assets = []
+        for full_path in full_paths:
+            asset = self._load(full_path, compress=False)
+            if asset:
+                assets.append(asset)
+        logger.info(f"Static assets preloaded: {len(assets)} files, "
+                    f"{sum(len(asset.variants['identity']) for asset in assets)} bytes")
+        if assets:
+            threading.Thread(target=self._compress_all, args=(assets,),
+                             name='static-compress', daemon=True).start()
+
+    def _compress_all(self, assets):
+        """미리 올린 파일들의 압축본 생성"""
+        started = time.monotonic()
+        for asset in assets:
+            asset.compress()
+        logger.info(f"Static assets compressed in {time.monotonic() - started:.2f}s "
+                    f"(brotli={'on' if brotli else 'off'})")
+
+    def get(self, full_path):
+        """캐시된 파일 조회 (없으면 읽어서 등록, 개발 모드에서는 mtime 변경 시 다시 읽음)"""
+        asset = self._assets.get(full_path)
+        if asset is not None and self.reload:
+            try:
+                mtime = os.stat(full_path).st_mtime
+            except OSError:
+                mtime = None
+            if mtime != asset.mtime:
+                self.reloads += 1
+                asset = self._load(full_path)
+        if asset is None:
+            self.misses += 1
+            asset = self._load(full_path)
+        else:
+            self.hits += 1
+        return asset
+
+    def get_stats(self):
+        """캐시 통계"""
+        with self._lock:
+            files = len(self._assets)
+            memory = sum(len(data) for asset in self._assets.values() for data in asset.variants.values())
+        return {
+            'files': files,
+            'memory_bytes': memory,
+            'brotli': brotli is not None,
+            'reload': self.reload,
+            'hits': self.hits,
+            'misses': self.misses,
+            'not_modified': self.not_modified,
+            'reloads': self.reloads
+        }
+
+
+def etag_matches(if_none_match, etag):
+    """If-None-Match 헤더가 ETag와 일치하는지 (약한 비교)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    for candidate in if_none_match.split(','):
+        candidate = candidate.strip()
+        if candidate.startswith('W/'):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
 
 class StaticFileHandler:
     """정적 파일 처리를 위한 헬퍼 클래스"""
     
-    def __init__(self, app_root):
+    def __init__(self, app_root, reload=False, max_file_size=5 * 1024 * 1024):
         self.app_root = app_root
         self.static_paths = self._initialize_static_paths()
+        self.reload = reload
+        self.manifest_files = 0
+        self._last_rebuild = 0.0
+        self.index = self._build_index()
+        self.cache = StaticAssetCache(reload=reload, max_file_size=max_file_size)
+        self.cache.preload(os.path.join(entry.base_path, rel_path) for rel_path, entry in self.index.items())
         
     def _initialize_static_paths(self):
         """가능한 정적 파일 경로들을 초기화"""
@@ -36,21 +251,69 @@ class StaticFileHandler:
             
         return paths
     
-    def find_static_file(self, filepath):
-        """정적 파일을 찾아서 전체 경로를 반환"""
+    def _build_index(self):
+        """
+        정적 경로를 한 번 훑어 상대 경로 -> (기준 경로, 크기, 수정 시각, Content-Type) 인덱스를 만듭니다.
+        같은 상대 경로가 여러 기준 경로에 있으면 static_paths 순서상 앞의 것(Docker 빌드)이 우선합니다.
+        asset-manifest.json에 적힌 파일이 빠져 있으면 경고를 남깁니다.
+        """
+        index = {}
         for base_path in self.static_paths:
-            full_path = os.path.join(base_path, filepath)
-            if os.path.exists(full_path) and os.path.isfile(full_path):
-                return base_path, filepath
-                
-        # static/static 구조 체크 (React 빌드의 중첩 구조)
-        if filepath.startswith('static/'):
-            for base_path in self.static_paths:
-                nested_path = os.path.join(base_path, filepath)
-                if os.path.exists(nested_path) and os.path.isfile(nested_path):
-                    return base_path, filepath
-                    
-        return None, None
+            for root, dirs, filenames in os.walk(base_path):
+                for filename in filenames:
+                    full_path = os.path.join(root, filename)
+                    rel_path = os.path.relpath(full_path, base_path).replace(os.sep, '/')
+                    if rel_path in index:
+                        continue
+                    try:
+                        stat = os.stat(full_path)
+                    except OSError:
+                        continue
+                    index[rel_path] = StaticEntry(base_path, stat.st_size, stat.st_mtime,
+                                                  guess_content_type(filename))
+
+        # React 빌드 매니페스트와 대조
+        manifest = index.get('asset-manifest.json')
+        if manifest:
+            try:
+                with open(os.path.join(manifest.base_path, 'asset-manifest.json'), encoding='utf-8') as f:
+                    listed = json.load(f).get('files', {})
+                self.manifest_files = len(listed)
+                for url in listed.values():
+                    if url.lstrip('/') not in index:
+                        logger.warning(f"asset-manifest.json에 있으나 빌드에 없는 파일: {url}")
+            except (OSError, ValueError) as e:
+                logger.warning(f"asset-manifest.json 읽기 실패: {e}")
+
+        logger.info(f"Static index built: {len(index)} files")
+        return MappingProxyType(index)
+
+    def _rebuild_index_on_miss(self):
+        """개발 모드에서 인덱스에 없는 파일이 요청되면 인덱스를 다시 만듦 (초당 최대 1회)"""
+        if not self.reload or time.monotonic() - self._last_rebuild < 1.0:
+            return False
+        self._last_rebuild = time.monotonic()
+        self.index = self._build_index()
+        return True
+
+    def lookup(self, filepath):
+        """인덱스에서 정적 파일 항목 조회 (없으면 None)"""
+        rel_path = filepath.replace(os.sep, '/').lstrip('/')
+        entry = self.index.get(rel_path)
+        if entry is None and self._rebuild_index_on_miss():
+            entry = self.index.get(rel_path)
+        return entry
+
+    def find_static_file(self, filepath):
+        """정적 파일을 찾아서 (기준 경로, 상대 경로)를 반환 - 시작 시 만든 인덱스 조회"""
+        entry = self.lookup(filepath)
+        if entry is None:
+            return None, None
+        return entry.base_path, filepath.replace(os.sep, '/').lstrip('/')
+
+    def has_file(self, filepath):
+        """정적 파일 존재 여부"""
+        return self.lookup(filepath) is not None
     
     def serve_file(self, filepath):
         """파일을 찾아서 서빙"""
@@ -58,7 +321,11 @@ class StaticFileHandler:
         
         if base_path and file_path:
             try:
-                return send_from_directory(base_path, file_path)
+                asset = self.cache.get(os.path.join(base_path, file_path))
+                if asset is None:
+                    # 크기 제한을 넘는 파일은 디스크에서 직접 서빙
+                    return send_from_directory(base_path, file_path)
+                return self.build_response(asset)
             except Exception as e:
                 logger.error(f"Error serving file {filepath}: {e}")
                 raise NotFound(f"Error serving file: {e}")
@@ -66,22 +333,46 @@ class StaticFileHandler:
             logger.warning(f"Static file not found: {filepath}")
             raise NotFound(f"Static file not found: {filepath}")
     
+    def build_response(self, asset):
+        """Accept-Encoding에 맞는 표현으로 응답 생성 (If-None-Match 일치 시 304)"""
+        encoding = asset.select(request.headers.get('Accept-Encoding'))
+        etag = asset.etag_for(encoding)
+        headers = {
+            'ETag': etag,
+            'Last-Modified': asset.last_modified,
+            'Vary': 'Accept-Encoding'
+        }
+        if etag_matches(request.headers.get('If-None-Match'), etag):
+            self.cache.not_modified += 1
+            return Response(status=304, headers=headers)
+
+        if encoding != 'identity':
+            headers['Content-Encoding'] = encoding
+        return Response(asset.variants[encoding], headers=headers, content_type=asset.content_type)
+
     def get_index_html_path(self):
         """index.html의 경로를 반환"""
-        for base_path in self.static_paths:
-            index_path = os.path.join(base_path, 'index.html')
-            if os.path.exists(index_path):
-                return base_path
-        return None
-    
+        entry = self.lookup('index.html')
+        return entry.base_path if entry else None
+
+    def serve_index_html(self):
+        """메모리에 올려 둔 index.html 서빙 (SPA는 항상 최신 버전을 받도록 캐싱 방지)"""
+        response = self.serve_file('index.html')
+        response.headers['Cache-Control'] = 'no-cache, no-store, must-revalidate'
+        response.headers['Pragma'] = 'no-cache'
+        response.headers['Expires'] = '0'
+        return response
+
     def list_available_files(self):
         """디버깅용: 사용 가능한 정적 파일 목록 반환"""
-        files = {}
-        for base_path in self.static_paths:
-            path_files = []
-            for root, dirs, filenames in os.walk(base_path):
-                for filename in filenames:
-                    rel_path = os.path.relpath(os.path.join(root, filename), base_path)
-                    path_files.append(rel_path)
-            files[base_path] = path_files
-        return files
\ No newline at end of file
+        files = {base_path: [] for base_path in self.static_paths}
+        for rel_path, entry in self.index.items():
+            files[entry.base_path].append(rel_path)
+        return files
+
+    def get_stats(self):
+        """정적 파일 인덱스/캐시 통계"""
+        stats = self.cache.get_stats()
+        stats['indexed_files'] = len(self.index)
+        stats['manifest_files'] = self.manifest_files
+        return stats
\ No newline at end of file
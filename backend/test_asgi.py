@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+ASGI 진입점 테스트 스크립트
+가짜 receive/send로 asgi.application을 직접 호출하여 Flask 라우트 왕복(요청 본문, 헤더 변환),
+NDJSON 응답의 조각 단위 전달, /api/events의 재동기화/배치/하트비트 전송과 연결 종료 시 정리,
+lifespan 종료 시 스레드 풀 정리를 확인합니다.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks.startup_time import BACKEND_DIR
+
+SCRIPT = r"""
+import asyncio, json
+import app, asgi
+
+app.event_broker.heartbeat_interval = 0.3
+app.news_cache.put('2026-10-18', '', 5, [
+    {'news_id': f'01100101.20261018{i:09d}', 'title': f'기사 {i}', 'provider': '경향신문',
+     'category': ['경제>금융'], 'dateline': '2026-10-18T09:10:00'}
+    for i in range(5)
+])
+results = {}
+
+
+def http_scope(method, path, query=b'', headers=()):
+    return {'type': 'http', 'method': method, 'path': path, 'query_string': query,
+            'headers': list(headers), 'http_version': '1.1', 'scheme': 'http',
+            'server': ('testserver', 80), 'client': ('127.0.0.1', 50000), 'root_path': ''}
+
+
+async def call(scope, body=b''):
+    # 본문을 두 조각으로 나눠 보내 조각 합치기도 확인
+    messages = [{'type': 'http.request', 'body': body[:3], 'more_body': True},
+                {'type': 'http.request', 'body': body[3:], 'more_body': False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await asgi.application(scope, receive, send)
+    return sent
+
+
+def body_of(sent):
+    return b''.join(message.get('body', b'') for message in sent if message['type'] == 'http.response.body')
+
+
+async def wait_for(sent, text, timeout=5.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while text not in body_of(sent).decode('utf-8'):
+        assert loop.time() < deadline, f'{text} 시간 초과'
+        await asyncio.sleep(0.01)
+
+
+async def main():
+    environ = asgi.build_environ(http_scope('POST', '/뉴스', b'a=1', [
+        (b'x-trace', b'1'), (b'x-trace', b'2'),
+        (b'content-type', b'application/json'), (b'content-length', b'999')
+    ]), b'abc')
+    results['environ'] = {key: environ[key] for key in
+                          ('PATH_INFO', 'QUERY_STRING', 'HTTP_X_TRACE', 'CONTENT_TYPE', 'CONTENT_LENGTH')}
+    results['environ']['PATH_INFO'] = results['environ']['PATH_INFO'].encode('latin-1').decode('utf-8')
+
+    # Flask 라우트 왕복
+    sent = await call(http_scope('POST', '/api/news/status', headers=[(b'content-type', b'application/json')]),
+                      json.dumps({'news_id': 'n1', 'status': '작업중'}).encode('utf-8'))
+    results['status_post'] = {'status': sent[0]['status'], 'body': json.loads(body_of(sent)),
+                              'stored': app.news_status.get('n1')['status']}
+
+    # NDJSON - 조각마다 body 메시지 하나, 마지막은 빈 본문으로 종료
+    sent = await call(http_scope('GET', '/api/news', b'date=2026-10-18&limit=5&format=ndjson'))
+    chunks = [message for message in sent if message['type'] == 'http.response.body']
+    results['ndjson'] = {
+        'status': sent[0]['status'],
+        'content_type': dict(sent[0]['headers']).get(b'content-type', b'').decode(),
+        'chunks': sum(1 for message in chunks if message['body']),
+        'last': [chunks[-1]['body'], chunks[-1].get('more_body', False)] == [b'', False],
+        'lines': [json.loads(line) for line in body_of(sent).decode('utf-8').splitlines()]
+    }
+
+    # SSE - 알 수 없는 Last-Event-ID면 재동기화, 발행 이벤트 전달, 배치, 하트비트, 연결 종료 시 정리
+    incoming = asyncio.Queue()
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = http_scope('GET', '/api/events', b'batch_ms=100', [(b'last-event-id', b'999999')])
+    stream = asyncio.ensure_future(asgi.application(scope, incoming.get, send))
+    await wait_for(sent, '"resync"')
+    results['listeners_open'] = app.event_broker.listeners
+
+    app.event_broker.publish('status_change', {'news_id': 'n1', 'status': '작업완료'})
+    await wait_for(sent, '"status_change"')
+    app.event_broker.publish('status_change', {'news_id': 'n2', 'status': '작업중'})
+    app.event_broker.publish('status_change', {'news_id': 'n3', 'status': '작업중'})
+    await wait_for(sent, '"batch"')
+    await wait_for(sent, ': heartbeat')
+
+    await incoming.put({'type': 'http.disconnect'})
+    await asyncio.wait_for(stream, 5)
+    results['sse'] = {'status': sent[0]['status'],
+                      'content_type': dict(sent[0]['headers'])[b'content-type'].decode(),
+                      'body': body_of(sent).decode('utf-8')}
+    results['listeners_closed'] = app.event_broker.listeners
+
+    # lifespan
+    lifespan_messages = [{'type': 'lifespan.startup'}, {'type': 'lifespan.shutdown'}]
+    sent = []
+
+    async def receive():
+        return lifespan_messages.pop(0)
+
+    await asgi.application({'type': 'lifespan'}, receive, send)
+    results['lifespan'] = [message['type'] for message in sent]
+    results['executors_shut_down'] = [asgi.wsgi_executor._shutdown, app.news_revalidator._executor._shutdown]
+
+
+asyncio.run(main())
+print(json.dumps(results, ensure_ascii=False))
+"""
+
+
+def test_asgi_application(tmp_path):
+    """Flask 라우트 왕복, NDJSON 조각 전달, SSE 전달과 연결 정리, lifespan 종료"""
+    env = dict(os.environ, BIGKINDS_API_KEY='test', OPENAI_API_KEY='sk-test', FLASK_ENV='production',
+               PYTHONPATH=BACKEND_DIR, NEWS_STREAM_BATCH='2', PREGEN_ENABLED='false')
+    completed = subprocess.run([sys.executable, '-c', SCRIPT], cwd=tmp_path, env=env,
+                               capture_output=True, text=True, timeout=60)
+    assert completed.returncode == 0, completed.stderr[-2000:]
+    results = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    assert results['environ'] == {'PATH_INFO': '/뉴스', 'QUERY_STRING': 'a=1', 'HTTP_X_TRACE': '1,2',
+                                  'CONTENT_TYPE': 'application/json', 'CONTENT_LENGTH': '3'}
+
+    assert results['status_post']['status'] == 200
+    assert results['status_post']['body']['success'] is True
+    assert results['status_post']['stored'] == '작업중'
+
+    ndjson = results['ndjson']
+    assert ndjson['status'] == 200 and ndjson['content_type'].startswith('application/x-ndjson')
+    assert ndjson['chunks'] > 1 and ndjson['last']
+    lines = ndjson['lines']
+    assert lines[0]['type'] == 'meta' and lines[-1] == {'type': 'end', 'actual_count': 5}
+    assert [news['title'] for news in lines[1:-1]] == [f'기사 {i}' for i in range(5)]
+
+    sse = results['sse']
+    assert sse['status'] == 200 and sse['content_type'].startswith('text/event-stream')
+    assert sse['body'].startswith('retry: ')
+    events = [json.loads(line[len('data: '):]) for line in sse['body'].splitlines() if line.startswith('data: ')]
+    assert [event['type'] for event in events] == ['resync', 'status_change', 'batch']
+    assert events[1]['data'] == {'news_id': 'n1', 'status': '작업완료'}
+    assert events[2]['data']['received'] == 2
+    assert ': heartbeat' in sse['body']
+    assert results['listeners_open'] == 1 and results['listeners_closed'] == 0
+
+    assert results['lifespan'] == ['lifespan.startup.complete', 'lifespan.shutdown.complete']
+    assert results['executors_shut_down'] == [True, True]
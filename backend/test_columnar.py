@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+열 형식 응답 테스트 스크립트
+열 형식으로 바꾼 기사 목록이 사전 인코딩된 뒤 원래 목록으로 되돌아오는지 확인합니다.
+"""
+
+from utils.columnar import encode_columnar, decode_columnar
+
+
+def test_columnar_roundtrip_with_dictionaries():
+    """언론사/카테고리/상태는 사전 번호로, 나머지는 값 그대로 열에 담기고 되돌리면 같음"""
+    articles = [
+        {'news_id': 'a', 'title': '제목1', 'provider': '경향신문', 'category': '정치>국회_정당',
+         'status': '미진행', 'has_content': False},
+        {'news_id': 'b', 'title': '제목2', 'provider': '한겨레', 'category': None,
+         'status': '작업완료', 'has_content': True},
+        {'news_id': 'c', 'title': '제목3', 'provider': '경향신문', 'category': '정치>국회_정당',
+         'status': '미진행', 'has_content': False}
+    ]
+    data = encode_columnar(articles)
+
+    assert data['count'] == 3
+    assert data['columns']['title'] == ['제목1', '제목2', '제목3']
+    assert data['dictionaries']['provider'] == ['경향신문', '한겨레']
+    assert data['columns']['provider'] == [0, 1, 0]
+    assert data['dictionaries']['category'] == ['정치>국회_정당', None]
+    assert 'has_content' not in data['dictionaries']
+    assert decode_columnar(data) == articles
+
+    # 목록 값은 사전 인코딩 없이 그대로, 빈 목록도 처리
+    listed = [{'news_id': 'd', 'category': ['경제>금융_재테크']}]
+    assert 'category' not in encode_columnar(listed)['dictionaries']
+    assert decode_columnar(encode_columnar(listed)) == listed
+    assert decode_columnar(encode_columnar([])) == []
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+생성 콘텐츠 저장소 테스트 스크립트
+뉴스 ID별 파일 저장/조회, 해시 앞 두 글자 디렉토리 분산, 최근 조회 캐시(LRU) 교체와
+상태 JSON에 들어 있던 생성 콘텐츠를 저장소로 옮기는 이전 작업을 확인합니다.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks.startup_time import BACKEND_DIR
+from utils.content_store import ContentStore
+
+
+def test_put_get_and_shard_placement(tmp_path):
+    """저장한 콘텐츠를 같은 내용으로 읽고, 파일은 ID 해시 앞 두 글자 디렉토리에 위치"""
+    base_dir = tmp_path / 'ai_contents'
+    store = ContentStore(str(base_dir), cache_size=4)
+    # 디렉토리는 첫 저장 때 생성
+    assert not base_dir.exists()
+    assert store.get('news-1') is None and not store.has('news-1')
+    store.delete('news-1')
+    assert not base_dir.exists()
+    entry = store.put('news-1', '생성된 콘텐츠 🔥', '2026-10-19T09:00:00')
+
+    digest = hashlib.sha1('news-1'.encode('utf-8')).hexdigest()
+    path = base_dir / digest[:2] / f'{digest}.json'
+    assert path.exists()
+    assert json.loads(path.read_text(encoding='utf-8')) == entry
+    assert not [name for name in os.listdir(path.parent) if name.endswith('.tmp')]
+
+    # 캐시를 거치지 않는 새 저장소에서도 같은 내용
+    fresh = ContentStore(str(base_dir))
+    assert fresh.get('news-1') == {'news_id': 'news-1', 'content': '생성된 콘텐츠 🔥',
+                                   'generated_at': '2026-10-19T09:00:00'}
+    assert fresh.has('news-1') and not fresh.has('news-2')
+    assert fresh.get('news-2') is None and fresh.get('') is None
+
+    fresh.delete('news-1')
+    assert fresh.get('news-1') is None and not path.exists()
+
+
+def test_lru_eviction(tmp_path):
+    """캐시 크기를 넘으면 가장 오래 조회하지 않은 항목부터 캐시에서 빠지고, 파일에서는 다시 읽음"""
+    store = ContentStore(str(tmp_path), cache_size=2)
+    store.put('a', 'A')
+    store.put('b', 'B')
+    assert store.get('a')['content'] == 'A'   # a가 가장 최근
+    store.put('c', 'C')                        # b 교체
+    assert list(store._cache) == ['a', 'c']
+
+    assert store.get('b')['content'] == 'B'    # 파일에서 읽어 다시 캐시, a 교체
+    assert list(store._cache) == ['c', 'b']
+
+
+def test_migrate_inline_content(tmp_path):
+    """상태 JSON의 ai_content는 저장소 파일로 옮겨지고 상태 레코드에는 has_content만 남음"""
+    (tmp_path / 'news_status.json').write_text(json.dumps({
+        'n1': {'status': '작업완료', 'ai_content': '본문 콘텐츠', 'ai_generated_at': '2026-10-18T10:00:00'},
+        'n2': {'status': '작업중', 'ai_content': ''},
+        'n3': {'status': '미진행'}
+    }, ensure_ascii=False), encoding='utf-8')
+    env = dict(os.environ, BIGKINDS_API_KEY='test', OPENAI_API_KEY='sk-test',
+               FLASK_ENV='production', PYTHONPATH=BACKEND_DIR)
+    completed = subprocess.run(
+        [sys.executable, '-c',
+         "import json, app; app.load_status(); "
+         "print(json.dumps([app.news_status.snapshot(), app.content_store.get('n1')], ensure_ascii=False))"],
+        cwd=tmp_path, env=env, capture_output=True, text=True, check=True
+    )
+    status, stored = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    assert all('ai_content' not in record for record in status.values())
+    assert status['n1'] == {'status': '작업완료', 'ai_generated_at': '2026-10-18T10:00:00', 'has_content': True}
+    assert status['n2'] == {'status': '작업중', 'has_content': False}
+    assert status['n3'] == {'status': '미진행'}
+    assert stored['content'] == '본문 콘텐츠' and stored['generated_at'] == '2026-10-18T10:00:00'
+    assert ContentStore(str(tmp_path / 'ai_contents')).get('n1')['content'] == '본문 콘텐츠'
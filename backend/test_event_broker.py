@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+실시간 이벤트 브로커 테스트 스크립트
+이벤트 ID 부여, Last-Event-ID 이어받기, 링 버퍼 누락 감지, 배치 병합, 대기 스트림 깨우기를 확인합니다.
+"""
+
+import json
+import threading
+import time
+from utils.event_broker import EventBroker
+
+
+def test_resume_from_last_event_id():
+    """재연결 시 마지막 ID 이후 이벤트만 다시 전송"""
+    broker = EventBroker(maxlen=10, heartbeat_interval=0.05)
+    for i in range(5):
+        broker.publish('status_change', {'news_id': f'n{i}'})
+
+    stream = broker.stream(last_event_id='3')
+    assert next(stream).startswith('retry:')
+    assert next(stream).startswith('id: 4\n')
+    assert next(stream).startswith('id: 5\n')
+    assert next(stream) == ': heartbeat\n\n'
+    stream.close()
+    assert broker.listeners == 0
+
+
+def test_resync_when_buffer_overflowed():
+    """링 버퍼에서 밀려난 이벤트가 있으면 재동기화 이벤트 전송"""
+    broker = EventBroker(maxlen=3, heartbeat_interval=0.05)
+    for i in range(10):
+        broker.publish('status_change', {'news_id': f'n{i}'})
+
+    stream = broker.stream(last_event_id='2')
+    next(stream)
+    assert '"resync"' in next(stream)
+    assert next(stream).startswith('id: 8\n')
+    stream.close()
+
+
+def test_batch_coalesces_same_news():
+    """배치 주기 동안의 이벤트를 한 메시지로 모으고 같은 뉴스의 중복 변경은 마지막 것만 전송"""
+    broker = EventBroker(heartbeat_interval=5, flush_interval=0.05)
+    for status in ['작업중', '작업완료', '대기']:
+        broker.publish('status_change', {'news_id': 'n1', 'status': status})
+    broker.publish('status_change', {'news_id': 'n2', 'status': '작업중'})
+    broker.publish('ai_content_generated', {'news_id': 'n1'})
+
+    stream = broker.stream(last_event_id='0')
+    next(stream)
+    message = next(stream)
+    assert message.startswith('id: 5\n')
+    batch = json.loads(message.split('data: ', 1)[1])
+    assert batch['type'] == 'batch'
+    assert batch['data']['received'] == 5
+    assert [(e['type'], e['data']['news_id']) for e in batch['data']['events']] == [
+        ('status_change', 'n1'), ('status_change', 'n2'), ('ai_content_generated', 'n1')
+    ]
+    assert batch['data']['events'][0]['data']['status'] == '대기'
+    stream.close()
+
+
+def test_waiting_streams_wake_on_publish():
+    """대기 중인 여러 스트림이 발행 즉시 이벤트를 받음"""
+    broker = EventBroker(heartbeat_interval=5)
+    received = []
+
+    def listen():
+        stream = broker.stream()
+        next(stream)
+        received.append((next(stream), time.monotonic()))
+        stream.close()
+
+    threads = [threading.Thread(target=listen) for _ in range(50)]
+    for thread in threads:
+        thread.start()
+    while broker.listeners < 50:
+        time.sleep(0.01)
+
+    published_at = time.monotonic()
+    broker.publish('status_change', {'news_id': 'n1'})
+    for thread in threads:
+        thread.join(2)
+
+    assert len(received) == 50
+    assert all(message.startswith('id: 1\n') for message, _ in received)
+    assert max(at for _, at in received) - published_at < 0.5
+
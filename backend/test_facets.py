@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+기사 집계 테스트 스크립트
+캐시된 검색 결과의 언론사/카테고리/시간대/상태별 수가 한 번 센 뒤 상태 변경과 재조회 결과에 맞게 증분 갱신되는지 확인합니다.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from benchmarks.startup_time import BACKEND_DIR
+from utils.news_cache import NewsDayCache
+
+
+def article(news_id, provider, category, hour):
+    return {
+        'news_id': news_id,
+        'provider': provider,
+        'category': [category] if category else [],
+        'dateline': f'2026-10-19T{hour:02d}:10:00.000+09:00'
+    }
+
+
+def test_facets_update_incrementally():
+    """상태 변경은 상태별 수만, 재조회는 늘어나거나 빠진 기사만 반영"""
+    statuses = {'a': '작업완료'}
+    cache = NewsDayCache(status_lookup=statuses.get)
+    first = cache.put('2026-10-19', '', 100, [
+        article('a', '경향신문', '정치>국회_정당', 9),
+        article('b', '경향신문', '경제>부동산', 9),
+        article('c', '한겨레', None, 13)
+    ])
+    assert cache.status_changed('a', '작업중') == 0  # 아직 집계 전
+
+    facets = cache.facets_for(first)
+    assert cache.facets_for(first) is facets
+    assert facets.to_dict() == {
+        'total': 3,
+        'facets': {
+            'provider': {'경향신문': 2, '한겨레': 1},
+            'category': {'정치>국회_정당': 1, '경제>부동산': 1, '미분류': 1},
+            'hour': {'9시': 2, '13시': 1},
+            'status': {'작업완료': 1, '미진행': 2}
+        }
+    }
+
+    assert cache.status_changed('b', '작업중') == 1
+    assert cache.status_changed('zzz', '작업중') == 0
+    assert facets.to_dict()['facets']['status'] == {'작업완료': 1, '작업중': 1, '미진행': 1}
+
+    # 오늘 날짜 재조회: c가 빠지고 d가 새로 들어옴 - 이전 집계를 이어받아 차이만 반영
+    second = cache.put('2026-10-19', '', 100, [
+        article('a', '경향신문', '정치>국회_정당', 9),
+        article('b', '경향신문', '경제>부동산', 9),
+        article('d', '한겨레', '경제>부동산', 14)
+    ])
+    assert second.facets is not None and second.facets is not facets
+    result = cache.facets_for(second).to_dict()
+    assert result['total'] == 3
+    assert result['facets']['category'] == {'정치>국회_정당': 1, '경제>부동산': 2}
+    assert result['facets']['hour'] == {'9시': 2, '14시': 1}
+    assert result['facets']['status'] == {'작업완료': 1, '작업중': 1, '미진행': 1}
+
+
+def test_undated_articles_grouped_like_hours_endpoint():
+    """시간 정보가 없거나 형식이 다른 기사는 /api/news/hours 와 같이 '기타'로 묶여 시간대 합이 전체 수와 같음"""
+    from utils.facets import hour_label
+
+    assert hour_label('2026-10-19T09:10:00Z') == '9시'
+    assert hour_label(None) == hour_label('') == hour_label('어제 오후') == '기타'
+
+    cache = NewsDayCache(status_lookup=lambda news_id: None)
+    undated = {'news_id': 'u', 'provider': '한겨레', 'category': [], 'dateline': None, 'published_at': ''}
+    malformed = dict(article('m', '한겨레', None, 9), dateline='오전 9시')
+    snapshot = cache.put('2026-10-19', '', 100, [article('a', '경향신문', None, 9), undated, malformed])
+    result = cache.facets_for(snapshot).to_dict()
+    assert result['facets']['hour'] == {'9시': 1, '기타': 2}
+    assert sum(result['facets']['hour'].values()) == result['total'] == 3
+
+
+def test_status_change_during_refresh_reaches_new_facets():
+    """재조회 결과로 교체하는 중에 들어온 상태 변경도 새 결과 집계에 반영됨"""
+    statuses = {}
+    cache = NewsDayCache(status_lookup=statuses.get)
+    first = cache.put('2026-10-19', '', 100, [article('a', '경향신문', None, 9), article('b', '한겨레', None, 10)])
+    facets = cache.facets_for(first)
+
+    changer = threading.Thread(target=lambda: cache.status_changed('a', '작업완료'))
+    original_rebase = facets.rebase
+
+    def slow_rebase(articles):
+        # 이전 집계를 복사한 뒤, 새 결과로 교체하기 전에 다른 요청에서 상태 변경
+        rebased = original_rebase(articles)
+        statuses['a'] = '작업완료'
+        changer.start()
+        time.sleep(0.05)
+        return rebased
+
+    facets.rebase = slow_rebase
+    second = cache.put('2026-10-19', '', 100, [article('a', '경향신문', None, 9), article('b', '한겨레', None, 10)])
+    changer.join()
+
+    assert second.facets.to_dict()['facets']['status'] == {'작업완료': 1, '미진행': 1}
+
+
+ARCHIVE_SCRIPT = """
+import json, app
+
+archived_id = '01100101.20250901093000001'
+app.ensure_status_loaded()
+app.news_status[archived_id] = {'status': '작업완료', 'has_content': False}
+app.status_archive.archive(app.news_status)
+assert app.news_status.get(archived_id) is None
+
+def doc(news_id):
+    return {'news_id': news_id, 'provider': '경향신문', 'category': [], 'dateline': '2025-09-01T09:10:00'}
+
+first = app.news_cache.put('2025-09-01', '', 10, [doc('01100101.20250902093000002')])
+app.news_cache.facets_for(first)
+# 재조회 결과에 새로 들어온 기사는 재조회 스레드에서 집계 (보관된 상태를 불러와서 셈)
+second = app.news_cache.put('2025-09-01', '', 10, [doc('01100101.20250902093000002'), doc(archived_id)])
+print(json.dumps(second.facets.to_dict()['facets']['status'], ensure_ascii=False))
+"""
+
+
+def test_archived_status_counted_on_refresh(tmp_path):
+    """보관된 상태의 기사는 재조회로 집계에 더해질 때도 /api/news와 같은 상태로 셈"""
+    env = dict(os.environ, BIGKINDS_API_KEY='test', OPENAI_API_KEY='sk-test',
+               FLASK_ENV='production', PYTHONPATH=BACKEND_DIR)
+    completed = subprocess.run([sys.executable, '-c', ARCHIVE_SCRIPT], cwd=tmp_path, env=env,
+                               capture_output=True, text=True, timeout=60)
+    assert completed.returncode == 0, completed.stderr[-2000:]
+
+    assert json.loads(completed.stdout.strip().splitlines()[-1]) == {'미진행': 1, '작업완료': 1}
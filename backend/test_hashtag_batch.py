@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+해시태그 일괄 생성 테스트 스크립트
+제목 묶음이 토큰 예산에 맞게 나뉘고, 잘리거나 형식이 어긋난 응답에서도 번호별 해시태그를 읽으며,
+대역 OpenAI 서버에 대해 여러 묶음 요청 결과가 입력 순서대로 모이는지 확인합니다.
+"""
+
+from benchmarks.fake_upstreams import FakeUpstreams
+from utils.hashtag_batch import pack_batches, parse_batch_response
+from utils.prompt_builder import TokenCounter
+
+
+def test_parse_and_pack():
+    """정상 JSON, 잘린 JSON, 번호 줄 응답을 읽고 범위 밖 번호는 무시, 묶음은 예산 안에서 순서대로"""
+    assert parse_batch_response('{"results": [{"id": 1, "hashtags": "#경제 #금리"}, '
+                                '{"id": 2, "hashtags": ["#AI", "인공 지능", "AI"]}, '
+                                '{"id": 9, "hashtags": "#범위밖"}]}', 2) == {
+        1: ['경제', '금리'], 2: ['AI', '인공지능']}
+
+    # 최대 토큰에서 잘린 응답: 완성된 항목만
+    truncated = '{"results": [{"id": 1, "hashtags": "#정부 #발표"}, {"id": 2, "hashtags": "#시장 #'
+    assert parse_batch_response(truncated, 3) == {1: ['정부', '발표']}
+
+    # 코드 블록 / 번호 줄 형식
+    assert parse_batch_response('```json\n{"results": [{"id": 1, "hashtags": "#a"}]}\n```', 1) == {1: ['a']}
+    assert parse_batch_response('1. #수출 #증가\n2) #기술, #산업\n잡담', 2) == {1: ['수출', '증가'], 2: ['기술', '산업']}
+    assert parse_batch_response('', 2) == {}
+
+    counter = TokenCounter()
+    lines = ['제목' * 10] * 7
+    batches = pack_batches(lines, counter, prompt_budget=10000, output_budget=300, item_tokens=100)
+    assert batches == [[0, 1, 2], [3, 4, 5], [6]]
+    batches = pack_batches(lines, counter, prompt_budget=counter.count(lines[0]) * 2 + 2,
+                           output_budget=10000, item_tokens=100)
+    assert [len(batch) for batch in batches] == [2, 2, 2, 1]
+
+
+def test_batched_client_against_fake_upstream(monkeypatch):
+    """여러 묶음을 동시에 요청해 입력 순서대로 모으고, 잘린 응답에서 빠진 제목은 다시 요청"""
+    upstreams = FakeUpstreams(articles_per_day=0, openai_latency=0).start()
+    try:
+        for name, value in upstreams.backend_env().items():
+            monkeypatch.setenv(name, value)
+        monkeypatch.setenv('OPENAI_HASHTAG_BATCH_OUTPUT_BUDGET', '600')
+        from utils.gpt_client import GPTClient
+
+        items = [{'title': f'기업{i} 투자 확대 발표', 'category': '경제>산업_기업'} for i in range(1, 13)]
+        client = GPTClient()
+        result = client.generate_batch_hashtags(items)
+
+        assert result['success'] and result['succeeded'] == 12
+        # 600 / 120 = 묶음당 5개 -> 3번 호출
+        assert result['batches'] == 3
+        assert upstreams.stats.snapshot()['openai_calls'] == 3
+        for i, item_result in enumerate(result['results'], 1):
+            assert item_result['hashtags'][0] == f'기업{i}'
+        assert result['usage']['prompt_tokens'] > 0
+
+        # 제목당 응답 한도를 실제 응답보다 작게 주면 응답이 잘리고, 빠진 제목은 한 번 더 묶어서 요청
+        client.hashtag_item_tokens = 12
+        result = client.generate_batch_hashtags(items[:4])
+        assert result['batches'] >= 2
+        for item_result in result['results']:
+            assert item_result['success'] == bool(item_result['hashtags'])
+            assert item_result['success'] or item_result['error']
+    finally:
+        upstreams.stop()
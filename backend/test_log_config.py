@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+로깅 설정 테스트 스크립트
+반복 메시지 생략과 큐 핸들러의 메시지 확정, JSON 포맷을 확인합니다.
+"""
+
+import json
+import logging
+import queue
+
+from utils.log_config import JSONFormatter, NonBlockingQueueHandler, RateLimitFilter, parse_levels
+
+
+def make_record(msg, *args):
+    return logging.LogRecord('app', logging.WARNING, __file__, 1, msg, args, None)
+
+
+def test_rate_limit_and_json_format():
+    """형식별로 limit회까지만 통과, 다음 구간 첫 기록에 생략 수 표시, 큐가 차면 버림"""
+    rate_filter = RateLimitFilter(limit=1, window=60)
+    assert rate_filter.filter(make_record("a %s", 1)) is True
+    assert rate_filter.filter(make_record("a %s", 2)) is False
+    assert rate_filter.filter(make_record("b %s", 1)) is True
+    rate_filter.window = 0
+    record = make_record("a %s", 3)
+    assert rate_filter.filter(record) is True and record.suppressed == 1
+
+    handler = NonBlockingQueueHandler(queue.Queue(maxsize=1))
+    handler.handle(make_record("상태 %s", {'news_id': 'x'}))
+    handler.handle(make_record("상태 %s", 'dropped'))
+    assert handler.dropped == 1
+    queued = handler.queue.get_nowait()
+    assert queued.args is None and queued.msg == "상태 {'news_id': 'x'}"
+
+    record.news_id = 'n1'
+    entry = json.loads(JSONFormatter().format(record))
+    assert entry['message'] == 'a 3' and entry['news_id'] == 'n1' and entry['suppressed'] == 1
+    assert parse_levels('app=debug, werkzeug=WARNING,bad') == {'app': 'DEBUG', 'werkzeug': 'WARNING'}
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+지표 수집 테스트 스크립트
+카운터/히스토그램/게이지가 Prometheus 텍스트 형식으로 내보내지는지 확인합니다.
+"""
+
+from utils.metrics import MetricsRegistry
+
+
+def test_render_prometheus_text():
+    """히스토그램 구간은 누적, 레이블 값은 이스케이프, 값이 없는 게이지는 생략"""
+    registry = MetricsRegistry()
+    latency = registry.histogram('request_seconds', '응답 시간', labels=('route',), buckets=(0.1, 1))
+    requests = registry.counter('requests_total', '요청 수', labels=('route', 'status'))
+    registry.gauge('ratio', '적중률', lambda: {('a',): 0.5, ('b',): None}, labels=('cache',))
+
+    for value in (0.05, 0.5, 3):
+        latency.observe(value, '/api/news')
+    requests.inc('/api/"x"', '200', amount=2)
+
+    lines = registry.render().splitlines()
+    assert '# TYPE request_seconds histogram' in lines
+    assert 'request_seconds_bucket{route="/api/news",le="0.1"} 1' in lines
+    assert 'request_seconds_bucket{route="/api/news",le="1"} 2' in lines
+    assert 'request_seconds_bucket{route="/api/news",le="+Inf"} 3' in lines
+    assert 'request_seconds_count{route="/api/news"} 3' in lines
+    assert 'requests_total{route="/api/\\"x\\"",status="200"} 2' in lines
+    assert 'ratio{cache="a"} 0.5' in lines
+    assert not any(line.startswith('ratio{cache="b"}') for line in lines)
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+기사 캐시 테스트 스크립트
+압축 레코드로 보관한 기사가 원래 응답 형태로 되돌아오는지, 날짜별 유효 시간이 지켜지는지 확인합니다.
+"""
+
+from utils.news_cache import NewsDayCache
+
+
+def test_records_roundtrip_and_ttl():
+    """레코드 변환 후에도 응답 dict가 같고, 오늘 날짜는 짧은 유효 시간 적용"""
+    documents = [
+        {'title': '제목', 'news_id': '01100101.20261019093000001', 'provider': '경향신문',
+         'category': ['정치>국회_정당', '정치>행정_자치'], 'provider_subject': [{'code': '', 'name': ''}],
+         'hilight': None, 'extra_field': 1},
+        {'title': '제목2', 'news_id': '01100101.20261019093000002', 'provider': '경향신문'}
+    ]
+    cache = NewsDayCache(max_entries=1, today_ttl=0, past_ttl=60)
+
+    snapshot = cache.put('2026-10-18', '', 10, documents)
+    assert snapshot.to_dicts() == documents
+    assert snapshot.articles[0].provider is snapshot.articles[1].provider
+    # 응답 dict를 수정해도 캐시 내용은 그대로
+    snapshot.to_dicts()[0]['category'].append('수정')
+    assert cache.get('2026-10-18', '', 10, today='2026-10-19').to_dicts() == documents
+
+    cache.put('2026-10-19', '', 10, documents)
+    assert cache.get('2026-10-19', '', 10, today='2026-10-19') is None
+    assert cache.get('2026-10-18', '', 10, today='2026-10-19') is None
+    stats = cache.get_stats()
+    assert (stats['hits'], stats['misses'], stats['evictions']) == (1, 2, 1)
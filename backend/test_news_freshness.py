@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+뉴스 응답 신선도 테스트 스크립트
+빅카인즈가 느릴 때 마감 시간 안에 응답하고(504 또는 일부 결과), 만료된 캐시는 바로 내준 뒤 뒤에서 갱신하는지 확인합니다.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+
+from benchmarks.fake_upstreams import FakeUpstreams
+from benchmarks.startup_time import BACKEND_DIR
+from utils.revalidate import Revalidator
+
+CLIENT_SCRIPT = """
+import json, time, app
+client = app.app.test_client()
+results = []
+
+def get(limit):
+    started = time.perf_counter()
+    response = client.get('/api/news', query_string={'date': '2026-10-18', 'limit': limit})
+    body = response.get_json()
+    results.append({
+        'status': response.status_code,
+        'seconds': time.perf_counter() - started,
+        'freshness': body.get('freshness'),
+        'count': len(body.get('data') or []),
+        'header': response.headers.get('X-News-Freshness')
+    })
+
+get(100)             # 캐시 없음 - 마감 시간 초과로 504, 조회는 뒤에서 계속
+time.sleep(1.5)
+get(100)             # 뒤에서 받아 둔 결과 (유효 시간 0초라 바로 만료 - stale, 다시 재조회 시작)
+get(200)             # 캐시 없음 - 마감 시간 초과, 더 적은 개수 결과로 partial
+print(json.dumps({'results': results, 'revalidation': app.news_revalidator.get_stats()}))
+"""
+
+
+def test_deadline_stale_and_partial(tmp_path):
+    """느린 업스트림에도 마감 시간 안에 응답하고 신선도를 표시"""
+    upstreams = FakeUpstreams(articles_per_day=300, bigkinds_latency=1.0, openai_latency=0).start()
+    try:
+        env = dict(os.environ, **upstreams.backend_env(), FLASK_ENV='production', PYTHONPATH=BACKEND_DIR,
+                   NEWS_DEADLINE_SECONDS='0.3', NEWS_CACHE_PAST_TTL='0')
+        completed = subprocess.run([sys.executable, '-c', CLIENT_SCRIPT], cwd=tmp_path, env=env,
+                                   capture_output=True, text=True, check=True)
+    finally:
+        upstreams.stop()
+    output = json.loads(completed.stdout.strip().splitlines()[-1])
+    cold, stale, partial = output['results']
+
+    assert cold['status'] == 504 and cold['seconds'] < 0.9
+    assert (stale['status'], stale['freshness'], stale['header'], stale['count']) == (200, 'stale', 'stale', 100)
+    assert stale['seconds'] < 0.3
+    assert (partial['status'], partial['freshness'], partial['count']) == (200, 'partial', 100)
+    assert partial['seconds'] < 0.9
+    assert output['revalidation']['started'] == 3
+
+
+def test_revalidator_single_flight():
+    """같은 키의 동시 재조회는 한 번만 실행되고 결과를 함께 받음"""
+    release = threading.Event()
+    calls = []
+
+    def fetch(date, query, limit):
+        calls.append((date, query, limit))
+        release.wait(5)
+        return limit
+
+    revalidator = Revalidator(fetch, max_workers=2)
+    first = revalidator.submit('2026-10-18', '', 100)
+    second = revalidator.submit('2026-10-18', '', 100)
+    other = revalidator.submit('2026-10-18', '', 200)
+    release.set()
+
+    assert first is second
+    assert (first.result(5), other.result(5)) == (100, 200)
+    assert sorted(calls) == [('2026-10-18', '', 100), ('2026-10-18', '', 200)]
+    stats = revalidator.get_stats()
+    assert (stats['started'], stats['joined'], stats['succeeded'], stats['in_flight']) == (2, 1, 2, 0)
+    revalidator.shutdown()
+
+
+EXIT_SCRIPT = """
+import atexit, time, app
+
+# atexit 함수는 스레드 풀 정리 뒤에 실행되므로 이 시점에는 예열이 이미 멈춰 있어야 함
+atexit.register(lambda: open('warmup.txt', 'w').write(str(app.news_warmup._stop.is_set())))
+
+def slow_fetch(date, query, limit):
+    with open('fetched.txt', 'a') as f:
+        f.write(f'{limit}\\n')
+    time.sleep(0.5)
+
+app.news_revalidator.fetch_fn = slow_fetch
+futures = [app.news_revalidator.submit('2026-10-18', '', limit) for limit in (100, 200, 300, 400)]
+time.sleep(0.1)
+"""
+
+
+def test_queued_refreshes_cancelled_on_exit(tmp_path):
+    """프로세스 종료 시 예열을 멈추고, 실행 중인 재조회만 끝내고 대기 중인 재조회는 취소"""
+    env = dict(os.environ, BIGKINDS_API_KEY='test', OPENAI_API_KEY='sk-test', FLASK_ENV='production',
+               PYTHONPATH=BACKEND_DIR, NEWS_REFRESH_WORKERS='1', NEWS_WARMUP_ENABLED='true')
+    subprocess.run([sys.executable, '-c', EXIT_SCRIPT], cwd=tmp_path, env=env,
+                   capture_output=True, text=True, check=True, timeout=30)
+
+    assert (tmp_path / 'fetched.txt').read_text().split() == ['100']
+    assert (tmp_path / 'warmup.txt').read_text() == 'True'
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+뉴스 스트리밍 응답 테스트 스크립트
+/api/news?format=ndjson 이 메타 줄, 기사 줄, 완료 줄 순서로 오고 기사 내용이 일반 JSON 응답과 같은지 확인합니다.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks.fake_upstreams import FakeUpstreams
+from benchmarks.startup_time import BACKEND_DIR
+
+CLIENT_SCRIPT = """
+import json, app
+client = app.app.test_client()
+params = {'date': '2026-10-18', 'limit': 500}
+streamed = client.get('/api/news', query_string=dict(params, format='ndjson'))
+plain = client.get('/api/news', query_string=params).get_json()
+print(json.dumps({
+    'mimetype': streamed.mimetype,
+    'lines': [json.loads(line) for line in streamed.get_data(as_text=True).splitlines()],
+    'plain': plain['data']
+}, ensure_ascii=False))
+"""
+
+
+def test_ndjson_stream_matches_json_response(tmp_path):
+    """스트리밍 응답의 기사 줄이 일반 응답의 기사 목록과 같음"""
+    upstreams = FakeUpstreams(articles_per_day=450, openai_latency=0).start()
+    try:
+        env = dict(os.environ, **upstreams.backend_env(), FLASK_ENV='production',
+                   PYTHONPATH=BACKEND_DIR, NEWS_STREAM_BATCH='100', PREGEN_ENABLED='false')
+        completed = subprocess.run([sys.executable, '-c', CLIENT_SCRIPT], cwd=tmp_path, env=env,
+                                   capture_output=True, text=True, check=True)
+    finally:
+        upstreams.stop()
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    lines = result['lines']
+
+    assert result['mimetype'] == 'application/x-ndjson'
+    meta = lines[0]
+    assert (meta['type'], meta['total'], meta['requested_limit'], meta['freshness']) == ('meta', 450, 500, 'fresh')
+    assert lines[-1] == {'type': 'end', 'actual_count': 450}
+    assert lines[1:-1] == result['plain']
+    assert all(news['status'] == '미진행' and isinstance(news['category'], str) for news in lines[1:-1])
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+콘텐츠 사전 생성 스케줄러 테스트 스크립트
+가중치 설정 파싱, 언론사/카테고리 접두어/최신성 점수, 점수 순 생성, 일일 예산 소진 시 중단,
+유량 제한(rate_limited) 결과 시 대기열에 되돌리고 잠시 멈추는지,
+여러 워커가 공유 저장소로 예산과 생성 대상을 나눠 쓰는지 확인합니다.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from utils.pregen_scheduler import PregenScheduler, PriorityRules, parse_weights
+from utils.shared_state import SharedStateBus
+
+
+def wait_until(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, '시간 초과'
+        time.sleep(0.01)
+
+
+def test_parse_weights_and_score():
+    """가중치 생략 시 1, 잘못된 값은 무시 / 언론사 + 첫 일치 카테고리 접두어 + 경과 시간에 따라 줄어드는 가산점"""
+    assert parse_weights('서울경제:3, 한국경제 ,MBC:x,,KBS:0.5') == {'서울경제': 3.0, '한국경제': 1.0, 'KBS': 0.5}
+    assert parse_weights(None) == {}
+
+    rules = PriorityRules(provider_weights={'서울경제': 3}, category_weights={'경제': 2, '경제>금융': 5},
+                          recency_hours=4, recency_weight=1)
+    now = datetime(2026, 10, 19, 12, 0)
+    article = {'provider': '서울경제', 'category': '경제>금융_재테크', 'published_at': '2026-10-19T11:00:00'}
+    assert rules.score(article, now) == pytest.approx(3 + 2 + 0.75)
+    assert rules.score(dict(article, published_at='2026-10-19T06:00:00'), now) == pytest.approx(5)
+    # 미래 시각은 최대 가산점, 형식이 다른 시각과 빈 값은 가산점 없음
+    assert rules.score(dict(article, published_at='2026-10-19T13:00:00'), now) == pytest.approx(6)
+    assert rules.score({'provider': None, 'category': None, 'published_at': '어제'}, now) == 0
+
+
+def make_scheduler(generate_fn, daily_budget=10, bus=None):
+    rules = PriorityRules(provider_weights=parse_weights('A:3,B:2,C:1'), recency_hours=0, min_score=1)
+    return PregenScheduler(generate_fn, lambda news_id: False, rules, daily_budget=daily_budget,
+                           idle_interval=0.05,
+                           claim_fn=(lambda day, news_id: bus.claim_pregen(day, news_id, daily_budget))
+                           if bus else None,
+                           release_fn=bus.release_pregen if bus else None)
+
+
+def articles():
+    return [
+        {'news_id': 'c', 'provider': 'C', 'title': 'c'},
+        {'news_id': 'a', 'provider': 'A', 'title': 'a'},
+        {'news_id': 'low', 'provider': 'Z', 'title': 'low'},
+        {'news_id': 'done', 'provider': 'A', 'has_content': True},
+        {'news_id': 'b', 'provider': 'B', 'title': 'b'}
+    ]
+
+
+def test_generates_by_score_within_budget():
+    """점수 높은 순으로 생성하고 예산을 다 쓰면 나머지는 대기열에 남김"""
+    generated = []
+    scheduler = make_scheduler(lambda article: generated.append(article['news_id']) or {'success': True},
+                               daily_budget=2)
+    today = datetime.now().strftime('%Y-%m-%d')
+    yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+
+    assert scheduler.submit(articles(), yesterday) == 0
+    assert scheduler.submit(articles(), today) == 3
+    # 이미 본 기사는 다시 넣지 않음
+    assert scheduler.submit(articles(), today) == 0
+
+    scheduler.start()
+    try:
+        wait_until(lambda: scheduler.get_stats()['used_today'] == 2)
+        time.sleep(0.15)
+    finally:
+        scheduler.stop()
+
+    assert generated == ['a', 'b']
+    stats = scheduler.get_stats()
+    assert stats['generated'] == 2 and stats['queued'] == 1
+    assert scheduler.submit([{'news_id': 'new', 'provider': 'A'}], today) == 0
+
+
+def test_rate_limited_result_requeues_and_pauses():
+    """rate_limited 결과는 예산을 쓰지 않고 대기열에 되돌린 뒤 retry_after 동안 멈춤"""
+    calls = []
+
+    def generate(article):
+        calls.append((article['news_id'], time.monotonic()))
+        if len(calls) == 1:
+            return {'success': False, 'error_type': 'rate_limited', 'retry_after': 0.3}
+        return {'success': True}
+
+    scheduler = make_scheduler(generate)
+    scheduler.submit(articles(), datetime.now().strftime('%Y-%m-%d'))
+    scheduler.start()
+    try:
+        wait_until(lambda: scheduler.get_stats()['generated'] == 3)
+    finally:
+        scheduler.stop()
+
+    assert [news_id for news_id, _ in calls] == ['a', 'a', 'b', 'c']
+    assert calls[1][1] - calls[0][1] >= 0.25
+    stats = scheduler.get_stats()
+    assert stats['deferred'] == 1 and stats['used_today'] == 3 and stats['failed'] == 0
+
+
+def test_shared_claims(tmp_path):
+    """같은 기사는 한 번만 선점, 예산은 모든 워커 합계, 선점 취소 시 예산 반환"""
+    db_path = str(tmp_path / 'shared.db')
+    worker_a, worker_b = SharedStateBus(db_path), SharedStateBus(db_path)
+
+    assert worker_a.claim_pregen('2026-10-19', 'a', 2) == 'claimed'
+    assert worker_b.claim_pregen('2026-10-19', 'a', 2) == 'duplicate'
+    assert worker_b.claim_pregen('2026-10-19', 'b', 2) == 'claimed'
+    assert worker_a.claim_pregen('2026-10-19', 'c', 2) == 'exhausted'
+    # 날짜별 예산
+    assert worker_a.claim_pregen('2026-10-20', 'a', 2) == 'claimed'
+
+    worker_b.release_pregen('2026-10-19', 'b')
+    assert worker_a.claim_pregen('2026-10-19', 'c', 2) == 'claimed'
+
+
+def test_workers_share_budget_and_targets(tmp_path):
+    """같은 기사를 받은 두 워커가 함께 쓰는 예산 안에서 서로 다른 기사만 생성"""
+    db_path = str(tmp_path / 'shared.db')
+    generated = []
+    lock = threading.Lock()
+
+    def generate(article):
+        with lock:
+            generated.append(article['news_id'])
+        time.sleep(0.05)
+        return {'success': True}
+
+    schedulers = [make_scheduler(generate, daily_budget=2, bus=SharedStateBus(db_path)) for _ in range(2)]
+    today = datetime.now().strftime('%Y-%m-%d')
+    for scheduler in schedulers:
+        assert scheduler.submit(articles(), today) == 3
+        scheduler.start()
+    try:
+        wait_until(lambda: all(scheduler.get_stats()['budget_exhausted'] for scheduler in schedulers))
+        time.sleep(0.15)
+    finally:
+        for scheduler in schedulers:
+            scheduler.stop()
+
+    assert len(generated) == 2 and len(set(generated)) == 2
+    assert sum(scheduler.get_stats()['generated'] for scheduler in schedulers) == 2
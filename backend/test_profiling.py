@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+요청 프로파일링 테스트 스크립트
+구간 기록과 스택 샘플러가 Server-Timing 값과 folded 보고서를 만드는지 확인합니다.
+"""
+
+import threading
+import time
+
+from utils.profiling import ProfileStore, StackSampler, begin_spans, end_spans, server_timing, span
+
+
+def busy_wait(seconds):
+    """샘플러가 잡을 수 있도록 잠시 CPU 사용"""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def test_spans_and_sampler(tmp_path):
+    """구간은 요청 기록 중에만 모이고, 샘플러 보고서에는 실행 중이던 함수가 포함됨"""
+    with span('outside'):
+        pass
+
+    token = begin_spans()
+    sampler = StackSampler([threading.get_ident()], interval=0.001).start()
+    with span('upstream'):
+        busy_wait(0.05)
+    with span('upstream'):
+        pass
+    sampler.stop()
+    spans = end_spans(token)
+
+    assert [name for name, _ in spans] == ['upstream', 'upstream']
+    assert server_timing(spans).startswith('upstream;dur=')
+    report = sampler.folded()
+    assert 'test_profiling.py:busy_wait' in report
+    assert all(line.rsplit(' ', 1)[1].isdigit() for line in report.splitlines())
+
+    store = ProfileStore(str(tmp_path), keep=1)
+    store.save('GET /api/news', report, spans)
+    name = store.save('GET /api/news', report, spans)
+    assert store.list() == [name]
+    assert store.read(name).startswith('# span upstream')
+    assert store.read('../secret.folded') is None
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+프롬프트 구성 테스트 스크립트
+본문을 문장 경계에서 토큰 예산 이내로 자르는지, 첫 문장부터 예산을 넘으면 문장 중간에서 자르는지,
+tiktoken이 없을 때 근사 계산으로 동작하는지, 고정 템플릿 토큰 수를 한 번만 세고 메시지 앞에 두는지 확인합니다.
+"""
+
+import utils.prompt_builder as prompt_builder
+from utils.prompt_builder import PromptBuilder, TokenCounter, trim_to_token_budget
+
+
+class CountingCounter(TokenCounter):
+    """근사 계산 + 호출 기록"""
+
+    def __init__(self):
+        super().__init__()
+        self._encoding = None
+        self._loaded = True
+        self.counted = []
+
+    def count(self, text):
+        self.counted.append(text)
+        return super().count(text)
+
+
+def test_trim_at_sentence_boundary():
+    """예산 안이면 그대로, 넘으면 예산 안에 들어가는 문장까지만"""
+    counter = CountingCounter()
+    text = '첫 문장입니다. 두 번째 문장입니다! 세 번째 문장인가요? 마지막 문장.'
+
+    assert trim_to_token_budget(text, 1000, counter) == (text, counter.count(text), False)
+    assert trim_to_token_budget('', 10, counter) == ('', 0, False)
+
+    trimmed, tokens, truncated = trim_to_token_budget(text, 20, counter)
+    assert truncated
+    assert trimmed == '첫 문장입니다. 두 번째 문장입니다!'
+    assert tokens <= 20
+
+
+def test_single_long_sentence_is_cut():
+    """첫 문장부터 예산을 넘으면 문장 중간에서 예산만큼 자름"""
+    counter = CountingCounter()
+    text = '가' * 50 + '. 다음 문장.'
+    trimmed, tokens, truncated = trim_to_token_budget(text, 10, counter)
+    assert truncated
+    assert trimmed == '가' * 10
+    assert tokens == 10
+
+
+def test_approximate_fallback_without_tiktoken(monkeypatch):
+    """tiktoken이 없으면 ASCII 4자당 1토큰, 그 외 1자당 1토큰으로 근사"""
+    monkeypatch.setattr(prompt_builder, 'tiktoken', None)
+    counter = TokenCounter()
+    assert counter.backend == 'approximate'
+    assert counter.count('abcdefgh') == 2
+    assert counter.count('뉴스 abc') == 3
+    assert counter.truncate('뉴스 기사 본문', 4) == '뉴스 기'
+    assert counter.truncate('짧음', 10) == '짧음'
+
+
+def test_static_template_counted_once_and_first():
+    """고정 부분 토큰 수는 처음 한 번만 세고, 메시지는 고정 템플릿 뒤에 가변 부분"""
+    counter = CountingCounter()
+    builder = PromptBuilder('시스템 메시지', '\n고정 지시문과 예시\n', counter)
+
+    messages, info = builder.build(header='제목: 첫 기사\n본문: ', body='본문입니다. ' * 50, body_budget=30)
+    builder.build(header='제목: 둘째 기사\n본문: ', body='짧은 본문.', body_budget=30)
+
+    assert counter.counted.count('\n고정 지시문과 예시\n') == 1
+    assert messages[0] == {'role': 'system', 'content': '시스템 메시지'}
+    assert messages[1]['content'].startswith('\n고정 지시문과 예시\n')
+    assert messages[1]['content'].endswith('...')
+    assert info['body_truncated'] and info['body_tokens'] <= 30
+    assert info['estimated_prompt_tokens'] == builder.static_tokens + counter.count(
+        messages[1]['content'][len('\n고정 지시문과 예시\n') + 1:])
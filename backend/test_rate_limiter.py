@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+유량 제어 테스트 스크립트
+토큰 버킷 보충/거절, Retry-After 일시 정지, 서킷 브레이커 상태 전환(닫힘 -> 열림 -> 반개방 시험 1건 -> 닫힘/열림)과
+GPT 호출이 예상하지 못한 예외로 끝나거나 재시도할 때도 서킷 슬롯과 한도를 지키는지 확인합니다.
+"""
+
+import time
+
+import httpx
+import openai
+import pytest
+
+from utils.rate_limiter import TokenBucket, RateLimiter, CircuitBreaker
+
+
+def test_token_bucket_refill_and_rejection():
+    """분당 60 -> 초당 1 보충, 부족하면 필요한 대기 시간, 용량보다 큰 요청은 가득 찼을 때 허용"""
+    bucket = TokenBucket(60)
+    bucket.updated_at = 100.0
+
+    assert bucket.wait_time(60, 100.0) == 0.0
+    bucket.consume(60)
+    assert bucket.wait_time(1, 100.0) == pytest.approx(1.0)
+    assert bucket.wait_time(1, 101.0) == 0.0
+    assert bucket.wait_time(10, 101.0) == pytest.approx(9.0)
+    # 보충은 용량까지만
+    assert bucket.wait_time(1000, 1000.0) == 0.0
+    assert bucket.tokens == 60.0
+
+    limiter = RateLimiter(requests_per_minute=2, tokens_per_minute=1000, max_wait=0)
+    assert limiter.acquire(100) == (True, 0.0)
+    assert limiter.acquire(100) == (True, 0.0)
+    acquired, wait = limiter.acquire(100)
+    assert not acquired and wait == pytest.approx(30.0, abs=0.5)
+    limiter.refund(100)
+    assert limiter.acquire(100)[0]
+    assert limiter.get_stats()['rejected'] == 1
+
+
+def test_pause_honours_retry_after():
+    """pause 동안은 대기 한도 안이면 기다렸다가, 넘으면 남은 시간과 함께 거절"""
+    limiter = RateLimiter(requests_per_minute=100, tokens_per_minute=100000, max_wait=0)
+    limiter.pause(0.3)
+
+    acquired, wait = limiter.acquire(10)
+    assert not acquired and 0.2 < wait <= 0.3
+
+    started = time.monotonic()
+    assert limiter.acquire(10, max_wait=1.0) == (True, 0.0)
+    assert time.monotonic() - started >= 0.2
+    assert limiter.acquire(10) == (True, 0.0)
+
+
+def test_circuit_breaker_transitions():
+    """연속 실패로 열림, 대기 후 시험 호출 1건만 통과, 성공하면 닫힘 / 실패하면 다시 열림"""
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=0.1)
+    assert breaker.allow() == (True, 0.0)
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()[0]
+
+    time.sleep(0.12)
+    assert breaker.allow() == (True, 0.0)
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()[0]
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.get_stats()['times_opened'] == 2
+
+    time.sleep(0.12)
+    assert breaker.allow()[0]
+    # 호출하지 않고 끝나면 시험 슬롯 반환
+    breaker.release()
+    assert breaker.allow()[0]
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()[0] and breaker.allow()[0]
+
+
+class FailingCompletions:
+    """chat.completions.create 대역 - 정해진 예외를 순서대로 발생"""
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+        self.completions = self
+
+    @property
+    def chat(self):
+        return self
+
+    def create(self, **kwargs):
+        self.calls += 1
+        raise self.errors.pop(0) if len(self.errors) > 1 else self.errors[0]
+
+
+def make_client(monkeypatch, **env):
+    monkeypatch.setenv('OPENAI_API_KEY', 'sk-test')
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    from utils.gpt_client import GPTClient
+    return GPTClient()
+
+
+def server_error():
+    request = httpx.Request('POST', 'http://openai.test/v1/chat/completions')
+    response = httpx.Response(500, request=request, headers={'retry-after-ms': '1'})
+    return openai.InternalServerError('boom', response=response, body=None)
+
+
+def test_unexpected_error_does_not_leave_half_open_stuck(monkeypatch):
+    """반개방 시험 호출이 예상하지 못한 예외로 끝나도 다음 호출이 시험 호출로 통과"""
+    from utils.gpt_client import GPTCallError
+
+    client = make_client(monkeypatch, OPENAI_BREAKER_THRESHOLD='1', OPENAI_BREAKER_COOLDOWN='0')
+    client.circuit_breaker.record_failure()
+    assert client.circuit_breaker.state == CircuitBreaker.OPEN
+    available = client.rate_limiter.get_stats()['available_tokens']
+
+    client.client = FailingCompletions([ValueError('bad json')])
+    messages = [{'role': 'user', 'content': '안녕하세요'}]
+    with pytest.raises(ValueError):
+        client._create_completion(messages, max_tokens=10)
+    assert client.rate_limiter.get_stats()['available_tokens'] == pytest.approx(available, abs=1)
+
+    client.client = FailingCompletions([KeyError('choices')])
+    with pytest.raises(KeyError):
+        client._create_completion(messages, max_tokens=10)
+    assert client.client.calls == 1
+
+    client.client = FailingCompletions([server_error()])
+    client.max_retries = 0
+    with pytest.raises(GPTCallError) as error:
+        client._create_completion(messages, max_tokens=10)
+    assert error.value.error_type == 'upstream_error'
+    assert client.get_stats()['calls']['failed'] == 3
+
+
+def test_retries_acquire_rate_limit(monkeypatch):
+    """5xx 재시도도 분당 한도를 다시 확보하고, 한도가 없으면 재시도를 멈춤"""
+    from utils.gpt_client import GPTCallError
+
+    client = make_client(monkeypatch, OPENAI_RPM_LIMIT='2', OPENAI_LIMIT_MAX_WAIT='0', OPENAI_MAX_RETRIES='5')
+    client.client = FailingCompletions([server_error()])
+
+    with pytest.raises(GPTCallError) as error:
+        client._create_completion([{'role': 'user', 'content': '안녕하세요'}], max_tokens=10)
+    assert client.client.calls == 2
+    assert error.value.retry_after > 0
+    stats = client.get_stats()
+    assert stats['calls']['retries'] == 1
+    assert stats['rate_limiter']['acquired'] == 2
+    assert stats['rate_limiter']['rejected'] == 1
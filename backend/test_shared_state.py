@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+워커 간 상태 공유 테스트 스크립트
+같은 SQLite 파일을 쓰는 두 워커가 같은 뉴스의 서로 다른 필드(상태 / 생성 콘텐츠)를
+한 확인 주기 안에 바꿔도 두 변경이 모두 남고, 변경 로그를 따라 읽은 각 워커에 합쳐진 레코드가 반영되는지 확인합니다.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+
+from benchmarks.startup_time import BACKEND_DIR
+from utils.shared_state import SharedStateBus
+
+DEFAULT_STATUS = {'status': '미진행', 'has_content': False}
+
+
+def test_field_updates_from_two_workers_merge(tmp_path):
+    """다른 워커의 변경을 읽기 전에 각자 다른 필드를 바꿔도 마지막 쓰기가 앞의 필드를 되돌리지 않음"""
+    db_path = str(tmp_path / 'shared.db')
+    worker_a = SharedStateBus(db_path)
+    worker_b = SharedStateBus(db_path)
+    worker_a.insert_missing({'n1': dict(DEFAULT_STATUS)})
+
+    merged_a = worker_a.publish('status_change', {'news_id': 'n1'}, news_id='n1',
+                                fields={'status': '작업중', 'updated_at': 't1'}, default=DEFAULT_STATUS)
+    merged_b = worker_b.publish('ai_content_generated', {'news_id': 'n1'}, news_id='n1',
+                                fields={'has_content': True, 'ai_generated_at': 't2'}, default=DEFAULT_STATUS)
+    assert merged_a == {'status': '작업중', 'has_content': False, 'updated_at': 't1'}
+    assert merged_b == {'status': '작업중', 'has_content': True, 'updated_at': 't1', 'ai_generated_at': 't2'}
+    # 이벤트 없는 변경 로그(상태 필드 없음)는 레코드 없이 기록
+    assert worker_b.publish('ping', {}) is None
+
+    for worker in (worker_a, worker_b):
+        local = {}
+        events = []
+        worker.poll(local.__setitem__, lambda *event: events.append(event[1]))
+        assert local['n1'] == merged_b
+        assert events == ['status_change', 'ai_content_generated', 'ping']
+    assert worker_a.applied_remote == 1 and worker_b.applied_remote == 2
+    assert SharedStateBus(db_path).load_status()['n1'] == merged_b
+
+
+def test_concurrent_field_updates_all_survive(tmp_path):
+    """두 워커가 동시에 각자 필드를 여러 번 바꿔도 최종 레코드에 모든 필드의 마지막 값이 남음"""
+    db_path = str(tmp_path / 'shared.db')
+    workers = [SharedStateBus(db_path), SharedStateBus(db_path)]
+
+    def update(worker, prefix):
+        for i in range(50):
+            worker.publish('status_change', {'news_id': 'n1'}, news_id='n1',
+                           fields={f'{prefix}{i % 5}': i}, default=DEFAULT_STATUS)
+
+    threads = [threading.Thread(target=update, args=(worker, prefix)) for worker, prefix in zip(workers, 'ab')]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    record = SharedStateBus(db_path).load_status()['n1']
+    for prefix in 'ab':
+        assert {key: record[key] for key in record if key.startswith(prefix)} == {
+            f'{prefix}{j}': 45 + j for j in range(5)}
+
+
+def test_app_applies_merged_record(tmp_path):
+    """앱 워커가 다른 워커의 콘텐츠 생성 기록을 읽기 전에 상태를 바꿔도 두 필드가 모두 반영됨"""
+    db_path = str(tmp_path / 'shared.db')
+    script = """
+import json, time
+import app
+from utils.shared_state import SharedStateBus
+
+other = SharedStateBus(app.SHARED_STATE_DB)
+other.insert_missing({'n1': dict(app.DEFAULT_STATUS)})
+other.publish('ai_content_generated', {'news_id': 'n1'}, news_id='n1',
+              fields={'has_content': True, 'ai_generated_at': 't2'}, default=app.DEFAULT_STATUS)
+response = app.app.test_client().post('/api/news/status', json={'news_id': 'n1', 'status': '작업완료'})
+assert response.status_code == 200, response.get_data(as_text=True)
+deadline = time.monotonic() + 5
+while app.shared_state.last_change_id < 3 and time.monotonic() < deadline:
+    time.sleep(0.05)
+local = {}
+other.poll(local.__setitem__, lambda *event: None)
+print(json.dumps([app.news_status.get('n1'), local['n1']], ensure_ascii=False))
+"""
+    env = dict(os.environ, BIGKINDS_API_KEY='test', OPENAI_API_KEY='sk-test', FLASK_ENV='production',
+               PYTHONPATH=BACKEND_DIR, SHARED_STATE_DB=db_path, SHARED_STATE_POLL_INTERVAL='0.05')
+    completed = subprocess.run([sys.executable, '-c', script], cwd=tmp_path, env=env,
+                               capture_output=True, text=True, timeout=60)
+    assert completed.returncode == 0, completed.stderr[-2000:]
+    in_app, in_other = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    for record in (in_app, in_other):
+        assert record['status'] == '작업완료'
+        assert record['has_content'] is True and record['ai_generated_at'] == 't2'
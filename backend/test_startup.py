@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+콜드 스타트 테스트 스크립트
+시작 경로에 무거운 초기화(openai SDK 임포트, 상태 파일 로드)가 다시 들어오지 않았는지와
+첫 /health 응답까지의 시간이 예산(STARTUP_BUDGET_SECONDS, 기본 2초) 안인지 확인합니다.
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks.startup_time import BACKEND_DIR, measure_startup
+
+STARTUP_BUDGET_SECONDS = float(os.getenv('STARTUP_BUDGET_SECONDS', '2.0'))
+
+
+def test_import_is_lazy(tmp_path):
+    """app 임포트 시 openai SDK를 불러오지 않고 상태 파일도 읽지 않음"""
+    (tmp_path / 'news_status.json').write_text(json.dumps({'n1': {'status': '작업중'}}), encoding='utf-8')
+    env = dict(os.environ, BIGKINDS_API_KEY='test', OPENAI_API_KEY='sk-test',
+               FLASK_ENV='production', PYTHONPATH=BACKEND_DIR)
+    completed = subprocess.run(
+        [sys.executable, '-c',
+         "import json, sys, app; print(json.dumps(['openai' in sys.modules, len(app.news_status)]))"],
+        cwd=tmp_path, env=env, capture_output=True, text=True, check=True
+    )
+    openai_imported, loaded = json.loads(completed.stdout.strip().splitlines()[-1])
+    assert not openai_imported
+    assert loaded == 0
+
+
+def test_time_to_first_healthy_response(tmp_path):
+    """gunicorn 시작부터 첫 /health 200 응답까지 예산 이내"""
+    elapsed = min(measure_startup('gunicorn', str(tmp_path)) for _ in range(2))
+    assert elapsed < STARTUP_BUDGET_SECONDS, f'{elapsed:.2f}s > {STARTUP_BUDGET_SECONDS}s'
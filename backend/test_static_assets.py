@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+메모리 정적 자산 서빙 테스트 스크립트
+빌드 디렉토리를 만든 임시 폴더에서 앱을 띄워 Accept-Encoding(br/gzip/없음)에 맞는 압축본 선택,
+인코딩별 ETag와 If-None-Match -> 304, 시작 시 만든 인덱스에 없는 경로의 SPA(index.html) 대체 응답을 확인합니다.
+"""
+
+import gzip
+import json
+import os
+import subprocess
+import sys
+
+from benchmarks.startup_time import BACKEND_DIR
+from static_serve import brotli
+
+SCRIPT = r"""
+import json, time
+import app
+from static_serve import brotli
+
+asset = app.static_handler.cache.get(app.static_handler.index['static/js/main.js'].base_path + '/static/js/main.js')
+deadline = time.monotonic() + 10
+expected = {'gzip', 'br'} if brotli else {'gzip'}
+while not expected <= set(asset.variants) and time.monotonic() < deadline:
+    time.sleep(0.02)
+
+client = app.app.test_client()
+results = {}
+
+def record(name, path, headers=None):
+    response = client.get(path, headers=headers or {})
+    results[name] = {
+        'status': response.status_code,
+        'encoding': response.headers.get('Content-Encoding'),
+        'etag': response.headers.get('ETag'),
+        'vary': response.headers.get('Vary'),
+        'cache_control': response.headers.get('Cache-Control'),
+        'body': response.get_data().hex()
+    }
+
+record('br', '/static/js/main.js', {'Accept-Encoding': 'gzip, deflate, br'})
+record('gzip', '/static/js/main.js', {'Accept-Encoding': 'gzip'})
+record('br_refused', '/static/js/main.js', {'Accept-Encoding': 'br;q=0, gzip'})
+record('identity', '/static/js/main.js')
+record('not_modified', '/static/js/main.js',
+       {'Accept-Encoding': 'gzip', 'If-None-Match': 'W/' + results['gzip']['etag']})
+record('other_etag', '/static/js/main.js', {'If-None-Match': results['gzip']['etag']})
+record('spa_route', '/news/2026-10-19')
+record('top_level', '/robots.txt')
+record('missing_top_level', '/favicon.ico')
+print(json.dumps(results))
+"""
+
+
+def test_variants_etag_and_spa_fallback(tmp_path):
+    """br > gzip > 원본 선택 (brotli가 없으면 gzip), 같은 인코딩 ETag면 304, 인덱스에 없는 경로는 index.html"""
+    script_js = ('console.log("뉴스 대시보드");\n' * 400).encode('utf-8')
+    index_html = '<!doctype html><html><body><div id="root"></div></body></html>'.encode('utf-8')
+    build = tmp_path / 'static'
+    (build / 'static' / 'js').mkdir(parents=True)
+    (build / 'static' / 'js' / 'main.js').write_bytes(script_js)
+    (build / 'index.html').write_bytes(index_html)
+    (build / 'robots.txt').write_text('User-agent: *\n', encoding='utf-8')
+
+    env = dict(os.environ, BIGKINDS_API_KEY='test', OPENAI_API_KEY='sk-test',
+               FLASK_ENV='production', PYTHONPATH=BACKEND_DIR)
+    completed = subprocess.run([sys.executable, '-c', SCRIPT], cwd=tmp_path, env=env,
+                               capture_output=True, text=True, timeout=60)
+    assert completed.returncode == 0, completed.stderr[-2000:]
+    results = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    def body(name):
+        return bytes.fromhex(results[name]['body'])
+
+    if brotli is not None:
+        assert results['br']['encoding'] == 'br'
+        assert brotli.decompress(body('br')) == script_js
+    else:
+        assert results['br']['encoding'] == 'gzip'
+    assert results['gzip']['encoding'] == 'gzip'
+    assert gzip.decompress(body('gzip')) == script_js
+    assert results['br_refused']['encoding'] == 'gzip'
+    assert results['identity']['encoding'] is None and body('identity') == script_js
+    for name in ('br', 'gzip', 'identity'):
+        assert results[name]['status'] == 200
+        assert results[name]['vary'] == 'Accept-Encoding'
+        assert results[name]['cache_control'] == 'public, max-age=31536000'
+    # 인코딩마다 바이트가 다르므로 ETag도 다름
+    assert len({results[name]['etag'] for name in ('br', 'gzip', 'identity')}) == (3 if brotli else 2)
+
+    assert results['not_modified']['status'] == 304 and body('not_modified') == b''
+    assert results['not_modified']['etag'] == results['gzip']['etag']
+    # 다른 인코딩의 ETag로는 304가 아님
+    assert results['other_etag']['status'] == 200 and results['other_etag']['encoding'] is None
+
+    assert results['spa_route']['status'] == 200
+    assert results['spa_route']['cache_control'] == 'no-cache, no-store, must-revalidate'
+    assert body('spa_route') == index_html
+    assert results['top_level']['status'] == 200 and body('top_level') == b'User-agent: *\n'
+    assert results['missing_top_level']['status'] == 404
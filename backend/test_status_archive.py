@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+뉴스 상태 보관 테스트 스크립트
+발행일이 오래된 상태가 날짜 파일로 옮겨지고, 해당 날짜를 조회하면 다시 불러와지는지 확인합니다.
+"""
+
+from datetime import datetime
+from utils.status_archive import StatusArchive, published_date_of
+
+
+def test_archive_and_fault_in(tmp_path):
+    """보관 기간이 지난 상태만 옮기고, 날짜/뉴스 ID로 다시 불러옴"""
+    today = datetime(2026, 10, 19)
+    status = {
+        '01100101.20261018093000001': {'status': '작업중', 'has_content': False},
+        '01100101.20260901093000001': {'status': '작업완료', 'has_content': True},
+        '02100201.20260901120000002': {'status': '미진행', 'has_content': False},
+        '02100201.20260815120000003': {'status': '작업중', 'has_content': False},
+        'custom-id': {'status': '미진행', 'has_content': False, 'published_at': '2026-08-01T10:00:00'}
+    }
+    base_dir = tmp_path / 'status_archive'
+    archive = StatusArchive(str(base_dir), hot_days=14, idle_seconds=0)
+    # 파티션 디렉토리는 보관할 레코드가 있을 때 생성
+    assert archive.archive({'01100101.20261018093000001': {}}, today=today) == 0
+    assert archive.fault_in(status, ['2026-09-01'], today=today) == 0
+    assert not base_dir.exists()
+
+    assert archive.archive(status, today=today) == 4
+    assert list(status) == ['01100101.20261018093000001']
+    stats = archive.get_stats(status)
+    assert stats['cold'] == {'partitions': 3, 'entries': 4, 'disk_bytes': stats['cold']['disk_bytes']}
+    assert stats['hot']['entries'] == 1
+
+    assert archive.fault_in(status, ['2026-09-01'], today=today) == 2
+    assert status['01100101.20260901093000001'] == {'status': '작업완료', 'has_content': True}
+    assert archive.fault_in_news(status, '02100201.20260815120000003') == 1
+    assert len(archive.export(status)) == 5
+
+    # 다시 불러온 날짜도 조회가 끝나면 다시 보관 (파일 내용은 메모리 쪽 변경으로 갱신)
+    status['01100101.20260901093000001']['status'] = '미진행'
+    assert archive.archive(status, today=today) == 3
+    assert archive.export({})['01100101.20260901093000001']['status'] == '미진행'
+
+
+def test_published_date_of():
+    """레코드의 published_at이 우선이고, 없으면 뉴스 ID의 발행 일시 사용"""
+    assert published_date_of('01100101.20261018093000001') == '2026-10-18'
+    assert published_date_of('x', {'published_at': '2026-01-02T00:00:00'}) == '2026-01-02'
+    assert published_date_of('no-date') is None
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+뉴스 상태 바이너리 스냅샷 테스트 스크립트
+JSON 상태와 같은 내용으로 왕복되는지, 손상된 파일을 거부하는지 확인합니다.
+"""
+
+import pytest
+from utils.status_snapshot import SnapshotError, decode_snapshot, encode_snapshot, read_snapshot, write_snapshot
+
+
+def test_round_trip_preserves_records(tmp_path):
+    """알려진 상태/사용자 정의 상태/누락 필드/추가 필드 모두 그대로 복원"""
+    status = {
+        '01100101.20261019001': {'status': '작업완료', 'has_content': True,
+                                 'ai_generated_at': '2026-10-19T10:00:00', 'updated_at': '2026-10-19T11:00:00'},
+        '01100101.20261019002': {'status': '미진행', 'has_content': False},
+        '01100101.20261019003': {'status': '보류', 'has_content': False, 'note': '확인 필요'},
+        '01100101.20261019004': {'has_content': True},
+        '01100101.20261019005': {'status': '작업중', 'ai_generated_at': None}
+    }
+    path = tmp_path / 'news_status.snapshot'
+    write_snapshot(str(path), status)
+    assert read_snapshot(str(path)) == status
+    assert read_snapshot(str(tmp_path / 'missing.snapshot')) is None
+
+
+def test_rejects_corrupted_snapshot():
+    """헤더가 다르거나 잘린 파일은 SnapshotError"""
+    data = encode_snapshot({'n1': {'status': '작업중', 'has_content': False}})
+    with pytest.raises(SnapshotError):
+        decode_snapshot(b'JSON' + data[4:])
+    with pytest.raises(SnapshotError):
+        decode_snapshot(data[:-3])
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+상태 저장소 동시성 테스트 스크립트
+여러 스레드가 동시에 상태를 바꾸고 읽고 요약해도 오류나 반쯤 바뀐 레코드가 없는지 확인합니다.
+"""
+
+import threading
+
+from utils.status_store import StatusStore
+
+THREADS = 8
+ROUNDS = 2000
+NEWS_IDS = [f'01100101.2026101909{i:05d}' for i in range(64)]
+
+
+def test_concurrent_updates_snapshots_and_counts():
+    """동시 갱신 중에도 읽기/스냅샷/집계가 항상 완전한 레코드만 보고, 최종 결과가 맞음"""
+    store = StatusStore(shards=4)
+    errors = []
+    start = threading.Barrier(THREADS + 2)
+
+    def writer(worker):
+        start.wait()
+        try:
+            for i in range(ROUNDS):
+                news_id = NEWS_IDS[(worker * 7 + i) % len(NEWS_IDS)]
+                store.setdefault(news_id, {'status': 'v0', 'seq': 0})
+                store.update_record(news_id, status=f'v{i}', seq=i)
+        except Exception as e:
+            errors.append(e)
+
+    def reader():
+        start.wait()
+        try:
+            for _ in range(ROUNDS // 10):
+                for record in store.snapshot().values():
+                    assert record['status'] == f"v{record['seq']}"
+                for news_id in store:
+                    record = store.get(news_id)
+                    assert record['status'] == f"v{record['seq']}"
+                assert sum(store.count_by('status').values()) <= len(NEWS_IDS)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=writer, args=(worker,)) for worker in range(THREADS)]
+    threads += [threading.Thread(target=reader) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert len(store) == len(NEWS_IDS)
+    assert sum(store.count_by('status').values()) == len(NEWS_IDS)
+
+    # 교체된 레코드만 제거되지 않고, 스냅샷은 이후 변경의 영향을 받지 않음
+    news_id = NEWS_IDS[0]
+    old = store[news_id]
+    snapshot = store.snapshot()
+    store.update_record(news_id, status='작업완료')
+    assert store.remove_if(news_id, old) is False
+    assert snapshot[news_id] is old
+    assert store.remove_if(news_id, store[news_id]) is True
+    assert news_id not in store
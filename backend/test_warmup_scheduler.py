@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+뉴스 캐시 예열 스케줄러 테스트 스크립트
+오래되거나 없는 결과만 오늘 먼저 다시 받고, 쉬는 시간대/분당 한도/오류 대기/종료 요청을 지키는지 확인합니다.
+"""
+
+import time
+from datetime import datetime
+
+from utils.api_client import BigkindsAPIError
+from utils.warmup_scheduler import WarmupScheduler, parse_hours
+
+
+def test_refreshes_due_days_within_limits():
+    """오늘 -> 지난 날짜 순으로 필요한 것만, 한도 안에서 예열하고 429면 Retry-After 동안 멈춤"""
+    now = datetime(2026, 10, 19, 9, 0)
+    ages = {('2026-10-19', 100): 55.0, ('2026-10-18', 100): 10.0}
+    calls = []
+    errors = []
+
+    def refresh(date, limit):
+        if errors:
+            raise errors.pop()
+        calls.append(date)
+        ages[(date, limit)] = 0.0
+
+    scheduler = WarmupScheduler(refresh, lambda date, limit: ages.get((date, limit)), limits=(100,),
+                                today_interval=50, past_days=3, past_interval=3000,
+                                idle_hours=parse_hours('1-5,23'), max_per_minute=3)
+
+    assert parse_hours('22-1') == {22, 23, 0, 1}
+    assert [date for date, _, _ in scheduler.due(now)] == ['2026-10-19', '2026-10-17', '2026-10-16']
+    assert scheduler.run_once(datetime(2026, 10, 19, 3, 0)) == 0
+    assert calls == []
+
+    # 분당 3건 한도: 첫 주기에 3건 모두, 다음 주기는 토큰이 없어 건너뜀
+    assert scheduler.run_once(now) == 3
+    assert calls == ['2026-10-19', '2026-10-17', '2026-10-16']
+    ages[('2026-10-19', 100)] = 60.0
+    assert scheduler.run_once(now) == 0
+
+    # 429 오류 - Retry-After 동안 예열 중단
+    scheduler._bucket.tokens = 3
+    errors.append(BigkindsAPIError('API 요청 실패: 429', status_code=429, retry_after=30))
+    assert scheduler.run_once(now) == 0
+    assert scheduler.run_once(now) == 0
+    stats = scheduler.get_stats()
+    assert stats['failed'] == 1 and 29 < stats['backoff_for'] <= 30
+    assert stats['refreshed'] == 3 and stats['idle_skips'] == 1
+
+
+def test_stop_interrupts_waiting():
+    """종료 요청 시 시작 대기 중이어도 바로 멈춤"""
+    scheduler = WarmupScheduler(lambda date, limit: None, lambda date, limit: None, start_delay=60)
+    scheduler.start()
+    started = time.monotonic()
+    scheduler.stop()
+    assert time.monotonic() - started < 1
+    assert not scheduler.get_stats()['running']
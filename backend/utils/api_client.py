@@ -4,12 +4,24 @@
 """
 
 import os
+import time
 import requests
 from dotenv import load_dotenv
+from utils.metrics import upstream_latency, upstream_response_bytes, upstream_errors
 
 # .env 파일에서 환경변수 로드
 load_dotenv()
 
+
+class BigkindsAPIError(Exception):
+    """빅카인즈 API 오류 응답 (상태 코드와 Retry-After 포함)"""
+
+    def __init__(self, message, status_code=None, retry_after=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
 class BigkindsClient:
     """빅카인즈 API 클라이언트 클래스"""
     
@@ -19,7 +31,14 @@ class BigkindsClient:
         if not self.api_key:
             raise ValueError("BIGKINDS_API_KEY가 설정되지 않았습니다. .env 파일을 확인해주세요.")
         
-        self.base_url = "https://tools.kinds.or.kr/search/news"
+        # 검색 API 주소 (벤치마크/테스트에서는 로컬 대역 서버로 지정)
+        self.base_url = os.getenv('BIGKINDS_API_URL', "https://tools.kinds.or.kr/search/news")
+        
+        # (연결, 읽기) 제한 시간(초) - 응답 없는 조회가 재조회 자리를 계속 차지하지 않도록
+        self.timeout = (
+            float(os.getenv('BIGKINDS_CONNECT_TIMEOUT', '5')),
+            float(os.getenv('BIGKINDS_READ_TIMEOUT', '60'))
+        )
         
     def get_news(self, query="", from_date="", until_date="", provider=None, return_size=10000):
         """
@@ -61,11 +80,26 @@ class BigkindsClient:
             }
         }
         
-        # API 요청
-        response = requests.post(self.base_url, json=payload)
+        # API 요청 (호출 시간/응답 크기/오류를 지표로 기록)
+        started = time.monotonic()
+        try:
+            response = requests.post(self.base_url, json=payload, timeout=self.timeout)
+        except requests.RequestException as e:
+            upstream_latency.observe(time.monotonic() - started, 'bigkinds', 'error')
+            upstream_errors.inc('bigkinds', type(e).__name__)
+            raise
+        upstream_latency.observe(time.monotonic() - started, 'bigkinds',
+                                 'ok' if response.status_code == 200 else 'error')
+        upstream_response_bytes.observe(len(response.content), 'bigkinds')
         
         # 응답 확인
         if response.status_code == 200:
             return response.json()
         else:
-            raise Exception(f"API 요청 실패: {response.status_code} - {response.text}") 
\ No newline at end of file
+            upstream_errors.inc('bigkinds', f"http_{response.status_code}")
+            try:
+                retry_after = float(response.headers.get('Retry-After'))
+            except (TypeError, ValueError):
+                retry_after = None
+            raise BigkindsAPIError(f"API 요청 실패: {response.status_code} - {response.text}",
+                                   status_code=response.status_code, retry_after=retry_after)
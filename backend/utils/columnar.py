@@ -0,0 +1,84 @@
+"""
+기사 목록 열(column) 형식 인코딩 모듈입니다.
+행 형식([{필드: 값}, ...])은 기사마다 필드 이름을 반복하므로, 필드별 배열 하나로 묶고
+언론사/카테고리/상태처럼 종류가 적은 값은 사전(dictionary)에 한 번만 적고 번호로 참조합니다.
+
+    {
+        "count": 2,
+        "fields": ["news_id", "title", "provider", ...],
+        "columns": {"news_id": ["a", "b"], "title": ["...", "..."], "provider": [0, 0], ...},
+        "dictionaries": {"provider": ["경향신문"], ...}
+    }
+
+기사에 없는 필드는 null로 채워지므로 되돌리면 null 값 필드로 나타납니다.
+"""
+
+# 사전 인코딩할 필드 (값 종류가 적은 필드)
+DICTIONARY_FIELDS = ('provider', 'category', 'status')
+
+
+def encode_columnar(articles, dictionary_fields=DICTIONARY_FIELDS):
+    """
+    기사 dict 목록을 열 형식으로 변환합니다.
+
+    Args:
+        articles (list): 기사 dict 목록
+        dictionary_fields (iterable): 사전 인코딩할 필드
+
+    Returns:
+        dict: 열 형식 데이터
+    """
+    fields = []
+    seen = set()
+    for article in articles:
+        for field in article:
+            if field not in seen:
+                seen.add(field)
+                fields.append(field)
+
+    columns = {}
+    dictionaries = {}
+    for field in fields:
+        values = [article.get(field) for article in articles]
+        if field in dictionary_fields:
+            encoded = _dictionary_encode(values)
+            if encoded is not None:
+                dictionaries[field], values = encoded
+        columns[field] = values
+
+    return {
+        'count': len(articles),
+        'fields': fields,
+        'columns': columns,
+        'dictionaries': dictionaries
+    }
+
+
+def _dictionary_encode(values):
+    """(사전, 번호 목록) - 해시할 수 없는 값(목록 등)이 있으면 None"""
+    index = {}
+    dictionary = []
+    codes = []
+    try:
+        for value in values:
+            code = index.get(value)
+            if code is None:
+                code = index[value] = len(dictionary)
+                dictionary.append(value)
+            codes.append(code)
+    except TypeError:
+        return None
+    return dictionary, codes
+
+
+def decode_columnar(data):
+    """열 형식 데이터를 기사 dict 목록으로 되돌림"""
+    columns = {}
+    for field in data['fields']:
+        values = data['columns'][field]
+        dictionary = data['dictionaries'].get(field)
+        columns[field] = [dictionary[code] for code in values] if dictionary is not None else values
+    return [
+        {field: columns[field][i] for field in data['fields']}
+        for i in range(data['count'])
+    ]
@@ -0,0 +1,118 @@
+"""
+생성된 AI 콘텐츠 저장소 모듈입니다.
+인스타그램 콘텐츠처럼 크기가 큰 생성 결과를 상태 레코드와 분리하여
+뉴스 ID별 파일로 보관하고, 필요할 때만 읽어옵니다.
+"""
+
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+
+class ContentStore:
+    """뉴스 ID를 키로 생성 콘텐츠를 보관하는 파일 기반 저장소"""
+
+    def __init__(self, base_dir, cache_size=256):
+        """
+        콘텐츠 저장소 초기화
+
+        Args:
+            base_dir (str): 콘텐츠 파일을 저장할 디렉토리
+            cache_size (int): 메모리에 유지할 최근 조회 콘텐츠 개수
+        """
+        self.base_dir = base_dir
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        # 디렉토리는 첫 저장 때 생성 (앱 import 시 작업 디렉토리에 만들지 않도록)
+
+    def _path(self, news_id):
+        """뉴스 ID에 해당하는 파일 경로 (ID 해시 앞 두 글자로 디렉토리 분산)"""
+        digest = hashlib.sha1(news_id.encode('utf-8')).hexdigest()
+        return os.path.join(self.base_dir, digest[:2], f"{digest}.json")
+
+    def _remember(self, news_id, entry):
+        """최근 조회 캐시에 항목 추가 (LRU)"""
+        self._cache[news_id] = entry
+        self._cache.move_to_end(news_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def get(self, news_id):
+        """
+        저장된 콘텐츠를 조회합니다.
+
+        Args:
+            news_id (str): 뉴스 ID
+
+        Returns:
+            dict: {'content': str, 'generated_at': str} 또는 None
+        """
+        if not news_id:
+            return None
+
+        with self._lock:
+            if news_id in self._cache:
+                self._cache.move_to_end(news_id)
+                return self._cache[news_id]
+
+        path = self._path(news_id)
+        if not os.path.exists(path):
+            return None
+
+        with open(path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+
+        with self._lock:
+            self._remember(news_id, entry)
+        return entry
+
+    def put(self, news_id, content, generated_at=None):
+        """
+        콘텐츠를 저장합니다. 임시 파일에 쓴 뒤 교체하여 부분 쓰기를 방지합니다.
+
+        Args:
+            news_id (str): 뉴스 ID
+            content (str): 생성된 콘텐츠
+            generated_at (str): 생성 시각 (ISO 형식, 없으면 현재 시각)
+
+        Returns:
+            dict: 저장된 항목
+        """
+        entry = {
+            'news_id': news_id,
+            'content': content,
+            'generated_at': generated_at or datetime.now().isoformat()
+        }
+
+        path = self._path(news_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._remember(news_id, entry)
+        return entry
+
+    def has(self, news_id):
+        """콘텐츠 존재 여부 확인"""
+        if not news_id:
+            return False
+        with self._lock:
+            if news_id in self._cache:
+                return True
+        return os.path.exists(self._path(news_id))
+
+    def delete(self, news_id):
+        """콘텐츠 삭제"""
+        with self._lock:
+            self._cache.pop(news_id, None)
+        try:
+            os.remove(self._path(news_id))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,280 @@
+"""
+실시간 업데이트 이벤트 브로커 모듈입니다.
+최근 이벤트를 링 버퍼에 보관하고 단조 증가하는 이벤트 ID를 부여하며,
+새 이벤트가 들어오면 조건 변수로 대기 중인 SSE 연결을 즉시 깨웁니다.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+
+class EventBroker:
+    """Server-Sent Events 팬아웃을 위한 이벤트 브로커"""
+
+    def __init__(self, maxlen=1000, heartbeat_interval=15.0, retry_ms=5000, start_id=0,
+                 flush_interval=0.0):
+        """
+        Args:
+            maxlen (int): 재연결 시 다시 보낼 수 있도록 보관할 최근 이벤트 수
+            heartbeat_interval (float): 이벤트가 없을 때 하트비트 주석을 보내는 주기(초)
+            retry_ms (int): 브라우저 재연결 대기 시간(밀리초)
+            start_id (int): 시작 이벤트 ID (외부에서 ID를 부여할 때 이미 지난 ID)
+            flush_interval (float): 기본 배치 전송 주기(초) - 첫 이벤트 후 이 시간 동안 모아서 한 번에 전송
+        """
+        self.heartbeat_interval = heartbeat_interval
+        self.retry_ms = retry_ms
+        self.flush_interval = flush_interval
+        self._events = deque(maxlen=maxlen)
+        self._last_id = start_id
+        self._cond = threading.Condition()
+        self._listeners = 0
+        self._callbacks = []
+
+        # 통계
+        self.published = 0
+        self.resyncs = 0
+        self.batches = 0
+        self.coalesced = 0
+
+    @property
+    def last_id(self):
+        """가장 최근 이벤트 ID"""
+        with self._cond:
+            return self._last_id
+
+    @property
+    def listeners(self):
+        """현재 연결된 스트림 수"""
+        with self._cond:
+            return self._listeners
+
+    def publish(self, event_type, data, event_id=None, timestamp=None):
+        """
+        이벤트를 발행하고 대기 중인 모든 스트림을 깨웁니다.
+
+        Args:
+            event_type (str): 이벤트 종류 (status_change, ai_content_generated 등)
+            data (dict): 이벤트 데이터
+            event_id (int): 외부에서 부여한 이벤트 ID (프로세스 간 공유 시 변경 로그 ID)
+            timestamp (str): 이벤트 발생 시각 (없으면 현재 시각)
+
+        Returns:
+            dict: ID가 부여된 이벤트 (이미 받은 ID면 None)
+        """
+        with self._cond:
+            if event_id is None:
+                event_id = self._last_id + 1
+            elif event_id <= self._last_id:
+                return None
+            self._last_id = event_id
+            event = {
+                'id': event_id,
+                'type': event_type,
+                'data': data,
+                'timestamp': timestamp or datetime.now().isoformat()
+            }
+            self._events.append(event)
+            self.published += 1
+            self._cond.notify_all()
+            callbacks = list(self._callbacks)
+
+        # 비동기 서버 등 스레드 밖의 대기자에게 알림 (콜백은 가볍게 유지해야 함)
+        for callback in callbacks:
+            callback(event)
+        return event
+
+    def add_callback(self, callback):
+        """이벤트 발행 시 호출할 콜백 등록"""
+        with self._cond:
+            self._callbacks.append(callback)
+
+    def remove_callback(self, callback):
+        """등록한 콜백 해제"""
+        with self._cond:
+            if callback in self._callbacks:
+                self._callbacks.remove(callback)
+
+    def connect(self):
+        """외부(비동기) 스트림 연결 수 증가"""
+        with self._cond:
+            self._listeners += 1
+
+    def disconnect(self):
+        """외부(비동기) 스트림 연결 수 감소"""
+        with self._cond:
+            self._listeners -= 1
+
+    def events_after(self, last_id):
+        """
+        last_id 이후 이벤트를 기다리지 않고 바로 조회합니다.
+
+        Returns:
+            tuple: (이벤트 목록, 누락 여부)
+        """
+        with self._cond:
+            return self._events_after(last_id)
+
+    def _events_after(self, last_id):
+        """
+        last_id 이후 이벤트 목록 (_cond 보유 상태에서 호출)
+
+        Returns:
+            tuple: (이벤트 목록, 링 버퍼에서 밀려나 누락된 이벤트가 있는지 여부)
+        """
+        if last_id >= self._last_id:
+            return [], False
+        if not self._events or last_id < self._events[0]['id'] - 1:
+            return list(self._events), True
+        oldest_id = self._events[0]['id']
+        # ID가 연속이면 인덱스로 바로 위치 계산, 중간에 빈 ID가 있으면 뒤에서부터 탐색
+        start = last_id - oldest_id + 1
+        if start >= len(self._events) or self._events[start]['id'] != last_id + 1:
+            start = len(self._events)
+            while start > 0 and self._events[start - 1]['id'] > last_id:
+                start -= 1
+        return [self._events[i] for i in range(start, len(self._events))], False
+
+    def wait(self, last_id, timeout):
+        """
+        last_id 이후 이벤트가 생길 때까지 최대 timeout 초 대기합니다.
+
+        Returns:
+            tuple: (이벤트 목록, 누락 여부) - 시간 초과 시 빈 목록
+        """
+        with self._cond:
+            events, gap = self._events_after(last_id)
+            if events:
+                return events, gap
+            self._cond.wait_for(lambda: self._last_id > last_id, timeout=timeout)
+            return self._events_after(last_id)
+
+    def format_event(self, event):
+        """이벤트를 SSE 메시지 형식으로 변환"""
+        return f"id: {event['id']}\ndata: {json.dumps(event)}\n\n"
+
+    @staticmethod
+    def coalesce(events):
+        """
+        같은 뉴스에 대한 같은 종류의 이벤트는 마지막 것만 남깁니다.
+
+        Returns:
+            list: 마지막 발생 순서대로 정렬된 이벤트 목록
+        """
+        merged = {}
+        for event in events:
+            news_id = event['data'].get('news_id') if isinstance(event['data'], dict) else None
+            key = (event['type'], news_id) if news_id else ('id', event['id'])
+            # 다시 넣어서 마지막 발생 위치로 이동
+            merged.pop(key, None)
+            merged[key] = event
+        return list(merged.values())
+
+    def format_batch(self, events):
+        """
+        모아 둔 이벤트를 하나의 SSE 메시지로 변환합니다.
+        이벤트가 하나면 그대로, 여럿이면 중복을 합친 batch 이벤트로 보냅니다.
+        batch의 ID는 포함된 마지막 이벤트 ID이므로 이어받기에 그대로 사용됩니다.
+        """
+        if len(events) == 1:
+            return self.format_event(events[0])
+        coalesced = self.coalesce(events)
+        with self._cond:
+            self.batches += 1
+            self.coalesced += len(events) - len(coalesced)
+        batch = {
+            'id': events[-1]['id'],
+            'type': 'batch',
+            'data': {
+                'events': coalesced,
+                'received': len(events)
+            },
+            'timestamp': events[-1]['timestamp']
+        }
+        return f"id: {batch['id']}\ndata: {json.dumps(batch)}\n\n"
+
+    def format_resync(self):
+        """누락된 이벤트가 있어 클라이언트가 전체 데이터를 다시 불러와야 함을 알리는 메시지"""
+        with self._cond:
+            self.resyncs += 1
+            last_id = self._last_id
+        event = {
+            'id': last_id,
+            'type': 'resync',
+            'data': {},
+            'timestamp': datetime.now().isoformat()
+        }
+        return f"id: {event['id']}\ndata: {json.dumps(event)}\n\n"
+
+    def parse_last_event_id(self, value):
+        """Last-Event-ID 값 파싱 (없거나 잘못된 값이면 현재 시점부터 전송)"""
+        try:
+            last_id = int(value)
+        except (TypeError, ValueError):
+            return self.last_id
+        # 서버 재시작 등으로 ID가 현재보다 크면 처음부터 다시 동기화
+        return last_id if 0 <= last_id <= self.last_id else -1
+
+    def stream(self, last_event_id=None, flush_interval=None):
+        """
+        SSE 스트림 제너레이터
+
+        Args:
+            last_event_id (str): 클라이언트가 마지막으로 받은 이벤트 ID (재연결 시 이어받기)
+            flush_interval (float): 이 연결의 배치 전송 주기(초), None이면 기본값 (0이면 즉시 전송)
+
+        Yields:
+            str: SSE 메시지 (이벤트, 배치 또는 하트비트 주석)
+        """
+        last_id = self.parse_last_event_id(last_event_id)
+        if flush_interval is None:
+            flush_interval = self.flush_interval
+
+        self.connect()
+        try:
+            yield f"retry: {self.retry_ms}\n\n"
+
+            if last_id < 0:
+                last_id = self.last_id
+                yield self.format_resync()
+
+            deadline = time.monotonic() + self.heartbeat_interval
+            while True:
+                events, gap = self.wait(last_id, max(0.0, deadline - time.monotonic()))
+                if events and flush_interval > 0:
+                    # 첫 이벤트 이후 주기 동안 들어온 이벤트를 모아 한 번에 전송
+                    time.sleep(flush_interval)
+                    events, gap = self.events_after(last_id)
+                if gap:
+                    yield self.format_resync()
+                if events:
+                    if flush_interval > 0:
+                        yield self.format_batch(events)
+                    else:
+                        for event in events:
+                            yield self.format_event(event)
+                    last_id = events[-1]['id']
+                    deadline = time.monotonic() + self.heartbeat_interval
+                elif time.monotonic() >= deadline:
+                    # 연결 유지 및 끊어진 연결 감지를 위한 주석 라인
+                    yield ": heartbeat\n\n"
+                    deadline = time.monotonic() + self.heartbeat_interval
+        finally:
+            self.disconnect()
+
+    def get_stats(self):
+        """브로커 상태"""
+        with self._cond:
+            return {
+                'last_event_id': self._last_id,
+                'buffered': len(self._events),
+                'buffer_size': self._events.maxlen,
+                'listeners': self._listeners,
+                'published': self.published,
+                'resyncs': self.resyncs,
+                'flush_interval': self.flush_interval,
+                'batches': self.batches,
+                'coalesced': self.coalesced
+            }
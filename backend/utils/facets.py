@@ -0,0 +1,156 @@
+"""
+일자별 기사 집계(facet) 모듈입니다.
+언론사/카테고리/시간대/상태별 기사 수를 캐시된 하루치 검색 결과마다 한 번만 세어 두고,
+- 같은 검색의 새 결과(오늘 날짜 재조회)가 들어오면 늘어나거나 빠진 기사만 더하고 빼며
+- 상태가 바뀌면 해당 기사의 이전/새 상태 카운트만 옮겨
+전체 기사를 다시 훑지 않고 작은 응답으로 제공합니다.
+"""
+
+import threading
+from collections import Counter
+from datetime import datetime
+
+DEFAULT_STATUS = '미진행'
+
+# 기사 속성으로 정해지는 집계 (상태는 바뀌므로 따로 관리)
+ARTICLE_FACETS = ('provider', 'category', 'hour')
+
+
+def hour_label(date_str):
+    """시각 문자열의 시간대 ('9시', 시간 정보가 없거나 형식이 다르면 '기타') - /api/news/hours 도 이 기준으로 묶음"""
+    if not isinstance(date_str, str) or not date_str:
+        return '기타'
+    try:
+        return f"{datetime.fromisoformat(date_str.replace('Z', '+00:00')).hour}시"
+    except ValueError:
+        return '기타'
+
+
+def hour_of(article):
+    """기사 레코드의 시간대"""
+    return hour_label(getattr(article, 'dateline', None) or getattr(article, 'published_at', None))
+
+
+def category_of(article):
+    """기사 대표 카테고리 (목록이면 첫 값) - 표에 보이는 값과 같은 기준"""
+    category = getattr(article, 'category', None)
+    if isinstance(category, (tuple, list)):
+        category = category[0] if category else None
+    return category if isinstance(category, str) else None
+
+
+def facet_values(article):
+    """기사의 (언론사, 카테고리, 시간대) 값"""
+    provider = getattr(article, 'provider', None)
+    return (
+        provider if isinstance(provider, str) else None,
+        category_of(article),
+        hour_of(article)
+    )
+
+
+class DayFacets:
+    """하루치 검색 결과 하나의 집계 (상태 변경/재조회 시 증분 갱신)"""
+
+    def __init__(self, status_lookup):
+        """
+        Args:
+            status_lookup (callable): news_id -> 상태 문자열 (없으면 None)
+        """
+        self.status_lookup = status_lookup
+        self.counts = {facet: Counter() for facet in ARTICLE_FACETS}
+        self.status_counts = Counter()
+        # news_id -> (facet 값들, 현재 상태) - 증분 갱신 시 빼야 할 값
+        self._articles = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(cls, articles, status_lookup):
+        """기사 레코드 목록으로 새 집계 생성"""
+        facets = cls(status_lookup)
+        facets.add_articles(articles)
+        return facets
+
+    def rebase(self, articles):
+        """
+        같은 검색의 새 결과에 맞춘 집계 생성 - 이전 결과와 달라진 기사만 더하고 뺌
+
+        Returns:
+            DayFacets: 새 결과의 집계 (이 집계는 그대로 유지)
+        """
+        rebased = DayFacets(self.status_lookup)
+        with self._lock:
+            rebased.counts = {facet: Counter(counts) for facet, counts in self.counts.items()}
+            rebased.status_counts = Counter(self.status_counts)
+            rebased._articles = dict(self._articles)
+        current = {getattr(article, 'news_id', None) for article in articles}
+        rebased.remove_articles([news_id for news_id in rebased._articles if news_id not in current])
+        rebased.add_articles([article for article in articles
+                              if getattr(article, 'news_id', None) not in rebased._articles])
+        return rebased
+
+    def add_articles(self, articles):
+        """기사 추가 (이미 있는 기사는 무시)"""
+        with self._lock:
+            for article in articles:
+                news_id = getattr(article, 'news_id', None)
+                if news_id in self._articles:
+                    continue
+                values = facet_values(article)
+                status = self.status_lookup(news_id) or DEFAULT_STATUS
+                self._articles[news_id] = (values, status)
+                for facet, value in zip(ARTICLE_FACETS, values):
+                    self.counts[facet][value] += 1
+                self.status_counts[status] += 1
+
+    def remove_articles(self, news_ids):
+        """기사 제거"""
+        with self._lock:
+            for news_id in news_ids:
+                entry = self._articles.pop(news_id, None)
+                if entry is None:
+                    continue
+                values, status = entry
+                for facet, value in zip(ARTICLE_FACETS, values):
+                    _decrement(self.counts[facet], value)
+                _decrement(self.status_counts, status)
+
+    def set_status(self, news_id, status):
+        """
+        기사 상태 변경 반영
+
+        Returns:
+            bool: 이 집계에 있는 기사여서 반영했으면 True
+        """
+        with self._lock:
+            entry = self._articles.get(news_id)
+            if entry is None:
+                return False
+            values, previous = entry
+            if previous != status:
+                self._articles[news_id] = (values, status)
+                _decrement(self.status_counts, previous)
+                self.status_counts[status] += 1
+            return True
+
+    def to_dict(self):
+        """응답용 집계 {facet: {값: 수}} (값이 없는 기사는 '미분류')"""
+        with self._lock:
+            facets = {facet: _labelled(counts) for facet, counts in self.counts.items()}
+            facets['status'] = _labelled(self.status_counts)
+            return {'total': len(self._articles), 'facets': facets}
+
+
+def _decrement(counter, value):
+    counter[value] -= 1
+    if counter[value] <= 0:
+        del counter[value]
+
+
+def _labelled(counter):
+    """None 값을 '미분류'로 바꾼 dict"""
+    labelled = {}
+    for value, count in counter.items():
+        label = '미분류' if value is None else value
+        labelled[label] = labelled.get(label, 0) + count
+    return labelled
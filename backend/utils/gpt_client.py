@@ -4,58 +4,24 @@ OpenAI GPT API를 활용한 인스타그램 콘텐츠 생성 클라이언트
 """
 
 import os
+import time
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import openai
+from utils.rate_limiter import RateLimiter, CircuitBreaker
+from utils.prompt_builder import TokenCounter, PromptBuilder
+from utils.hashtag_batch import BATCH_RESPONSE_FORMAT, title_line, pack_batches, parse_batch_response
+from utils.metrics import upstream_latency, upstream_errors
+
+logger = logging.getLogger(__name__)
 
-class GPTClient:
-    """OpenAI GPT API 클라이언트 클래스"""
-    
-    def __init__(self):
-        """GPT 클라이언트 초기화"""
-        # 환경변수에서 직접 읽기 (프로덕션 환경 고려)
-        self.api_key = os.getenv('OPENAI_API_KEY')
-        
-        # 디버깅 정보 출력
-        print(f"GPT 클라이언트 초기화 중...")
-        print(f"OPENAI_API_KEY 존재 여부: {'예' if self.api_key else '아니오'}")
-        if self.api_key:
-            print(f"API 키 앞 20자: {self.api_key[:20]}...")
-        
-        if not self.api_key:
-            raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다. 환경변수를 확인해주세요.")
-        
-        # OpenAI 클라이언트 초기화
-        try:
-            self.client = openai.OpenAI(api_key=self.api_key)
-            print("OpenAI 클라이언트 초기화 성공")
-        except Exception as e:
-            print(f"OpenAI 클라이언트 초기화 실패: {e}")
-            raise
-        
-    def generate_instagram_content(self, title, content, category=None):
-        """
-        뉴스 기사를 바탕으로 인스타그램용 콘텐츠를 생성합니다.
-        
-        Args:
-            title (str): 뉴스 제목
-            content (str): 뉴스 본문
-            category (str): 뉴스 카테고리 (선택사항)
-            
-        Returns:
-            dict: 생성된 인스타그램 콘텐츠
-                - description: 인스타그램용 설명글
-                - hashtags: 해시태그 리스트
-        """
-        try:
-            # 카테고리 정보 포함 여부 확인
-            category_info = f"\n카테고리: {category}" if category else ""
-            
-            # GPT 프롬프트 구성
-            prompt = f"""
-다음 뉴스 기사를 바탕으로 매력적인 인스타그램 포스팅용 콘텐츠를 생성해주세요.
 
-제목: {title}
-본문: {content[:1000]}...{category_info}
+# 인스타그램 콘텐츠 생성 프롬프트 - 호출마다 동일한 고정 부분
+INSTAGRAM_SYSTEM_PROMPT = "당신은 소셜미디어 마케팅 전문가입니다. 뉴스 기사를 매력적인 인스타그램 콘텐츠로 변환하는 것이 전문입니다."
 
+INSTAGRAM_TEMPLATE = """
 출력 형식 (정확히 이 형태로):
 [뉴스 제목을 매력적으로 재작성]
 
@@ -96,21 +62,309 @@ class GPTClient:
 #강화도 #북한 #미국인 #현장검거 #뉴스
 """
 
+# 해시태그 생성 프롬프트 - 고정 부분
+HASHTAG_SYSTEM_PROMPT = "해시태그 생성 전문가입니다. 간결하고 효과적인 해시태그만 생성해주세요."
+
+HASHTAG_TEMPLATE = """
+요구사항:
+- 한국어와 영어 해시태그 혼합
+- 트렌드 반영
+- 뉴스 내용과 관련성 높게
+
+응답 형식: #태그1 #태그2 #태그3 ...
+"""
+
+# 여러 제목 해시태그 일괄 생성 프롬프트 - 고정 부분 (제목 목록만 바뀜)
+HASHTAG_BATCH_TEMPLATE = """
+요구사항:
+- 각 제목마다 해시태그 10개 (공백으로 구분)
+- 한국어와 영어 해시태그 혼합
+- 트렌드 반영
+- 뉴스 내용과 관련성 높게
+- 모든 번호에 대해 빠짐없이 응답
+
+응답 형식 (JSON): {"results": [{"id": 제목 번호, "hashtags": "#태그1 #태그2 ..."}, ...]}
+"""
+
+
+class GPTCallError(Exception):
+    """유량 제한, 서킷 차단, 업스트림 오류로 GPT 호출이 실패했을 때 발생하는 예외"""
+
+    def __init__(self, message, error_type='upstream_error', retry_after=None):
+        super().__init__(message)
+        self.error_type = error_type
+        self.retry_after = retry_after
+
+
+class GPTClient:
+    """OpenAI GPT API 클라이언트 클래스"""
+    
+    def __init__(self):
+        """GPT 클라이언트 초기화"""
+        # 환경변수에서 직접 읽기 (프로덕션 환경 고려)
+        self.api_key = os.getenv('OPENAI_API_KEY')
+        
+        # 디버깅 정보 출력 (키 값은 기록하지 않음)
+        logger.info("GPT 클라이언트 초기화 중 (OPENAI_API_KEY 존재 여부: %s)", '예' if self.api_key else '아니오')
+        
+        if not self.api_key:
+            raise ValueError("OPENAI_API_KEY가 설정되지 않았습니다. 환경변수를 확인해주세요.")
+        
+        # OpenAI 클라이언트 초기화 (재시도는 Retry-After를 반영하여 직접 처리)
+        try:
+            self.client = openai.OpenAI(api_key=self.api_key, max_retries=0)
+            logger.info("OpenAI 클라이언트 초기화 성공")
+        except Exception as e:
+            logger.error("OpenAI 클라이언트 초기화 실패: %s", e)
+            raise
+        
+        # 클라이언트 측 유량 제한 및 서킷 브레이커
+        self.rate_limiter = RateLimiter(
+            requests_per_minute=int(os.getenv('OPENAI_RPM_LIMIT', '500')),
+            tokens_per_minute=int(os.getenv('OPENAI_TPM_LIMIT', '200000')),
+            max_wait=float(os.getenv('OPENAI_LIMIT_MAX_WAIT', '10'))
+        )
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=int(os.getenv('OPENAI_BREAKER_THRESHOLD', '5')),
+            recovery_timeout=float(os.getenv('OPENAI_BREAKER_COOLDOWN', '30'))
+        )
+        self.max_retries = int(os.getenv('OPENAI_MAX_RETRIES', '3'))
+        self.max_retry_wait = float(os.getenv('OPENAI_MAX_RETRY_WAIT', '20'))
+        
+        # 토큰 기준 프롬프트 구성 (고정 템플릿은 빌더에 캐시)
+        self.token_counter = TokenCounter("gpt-4o-mini")
+        self.content_token_budget = int(os.getenv('OPENAI_CONTENT_TOKEN_BUDGET', '600'))
+        self.instagram_prompt = PromptBuilder(INSTAGRAM_SYSTEM_PROMPT, INSTAGRAM_TEMPLATE, self.token_counter)
+        self.hashtag_prompt = PromptBuilder(HASHTAG_SYSTEM_PROMPT, HASHTAG_TEMPLATE, self.token_counter)
+        self.hashtag_batch_prompt = PromptBuilder(HASHTAG_SYSTEM_PROMPT, HASHTAG_BATCH_TEMPLATE, self.token_counter)
+        
+        # 해시태그 일괄 생성 묶음 크기 (제목 줄 토큰 합 / 예상 응답 토큰 상한, 제목당 예상 응답 토큰)
+        self.hashtag_batch_prompt_budget = int(os.getenv('OPENAI_HASHTAG_BATCH_PROMPT_BUDGET', '3000'))
+        self.hashtag_batch_output_budget = int(os.getenv('OPENAI_HASHTAG_BATCH_OUTPUT_BUDGET', '3000'))
+        self.hashtag_item_tokens = int(os.getenv('OPENAI_HASHTAG_ITEM_TOKENS', '120'))
+        self.hashtag_batch_concurrency = int(os.getenv('OPENAI_HASHTAG_BATCH_CONCURRENCY', '4'))
+        
+        # 호출 통계
+        self._stats_lock = threading.Lock()
+        self.stats = {
+            'calls': 0,
+            'succeeded': 0,
+            'failed': 0,
+            'retries': 0,
+            'upstream_rate_limited': 0
+        }
+        
+        # 용량 계획용 토큰 사용량 (종류별 누적 + 최근 호출 기록)
+        self.usage = {}
+        self.recent_usage = deque(maxlen=100)
+    
+    def _count(self, key, amount=1):
+        """호출 통계 증가"""
+        with self._stats_lock:
+            self.stats[key] += amount
+    
+    def _estimate_tokens(self, messages, max_tokens):
+        """유량 제한용 토큰 사용량 추정 (프롬프트 + 최대 응답 토큰)"""
+        return sum(self.token_counter.count(message['content']) for message in messages) + max_tokens
+    
+    def _record_usage(self, kind, response, prompt_info, elapsed):
+        """호출별 프롬프트/응답 토큰 수 기록"""
+        usage = getattr(response, 'usage', None)
+        prompt_tokens = getattr(usage, 'prompt_tokens', None) or 0
+        completion_tokens = getattr(usage, 'completion_tokens', None) or 0
+        
+        with self._stats_lock:
+            totals = self.usage.setdefault(kind, {
+                'calls': 0,
+                'prompt_tokens': 0,
+                'completion_tokens': 0,
+                'body_truncated': 0
+            })
+            totals['calls'] += 1
+            totals['prompt_tokens'] += prompt_tokens
+            totals['completion_tokens'] += completion_tokens
+            if prompt_info and prompt_info.get('body_truncated'):
+                totals['body_truncated'] += 1
+            
+            self.recent_usage.append({
+                'kind': kind,
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens,
+                'estimated_prompt_tokens': (prompt_info or {}).get('estimated_prompt_tokens'),
+                'latency_ms': round(elapsed * 1000, 1),
+                'at': time.time()
+            })
+    
+    @staticmethod
+    def _usage_of(response, prompt_info):
+        """응답 결과에 포함할 토큰 사용량"""
+        usage = getattr(response, 'usage', None)
+        return {
+            'prompt_tokens': getattr(usage, 'prompt_tokens', None),
+            'completion_tokens': getattr(usage, 'completion_tokens', None),
+            'body_truncated': prompt_info.get('body_truncated', False)
+        }
+    
+    @staticmethod
+    def _retry_after(error):
+        """업스트림 응답의 Retry-After 헤더 값(초) 추출"""
+        response = getattr(error, 'response', None)
+        if response is None:
+            return None
+        headers = response.headers
+        try:
+            if headers.get('retry-after-ms'):
+                return float(headers['retry-after-ms']) / 1000
+            if headers.get('retry-after'):
+                return float(headers['retry-after'])
+        except ValueError:
+            return None
+        return None
+    
+    def _create_completion(self, messages, max_tokens, temperature=0.7, kind='chat', prompt_info=None,
+                           response_format=None):
+        """
+        유량 제한, 재시도, 서킷 브레이커를 적용하여 채팅 완성 API를 호출합니다.
+        response_format을 주면 구조화된 출력(JSON 스키마)을 요청합니다.
+        
+        Raises:
+            GPTCallError: 제한 초과, 서킷 차단, 재시도 소진 시
+        """
+        allowed, retry_in = self.circuit_breaker.allow()
+        if not allowed:
+            raise GPTCallError(
+                'OpenAI API가 불안정하여 일시적으로 요청을 차단했습니다.',
+                error_type='circuit_open',
+                retry_after=retry_in
+            )
+        
+        token_count = self._estimate_tokens(messages, max_tokens)
+        acquired, wait = self.rate_limiter.acquire(token_count)
+        if not acquired:
+            # 아직 업스트림을 호출하지 않았으므로 시험 호출 슬롯만 반환
+            self.circuit_breaker.release()
+            raise GPTCallError(
+                '요청이 너무 많습니다. 잠시 후 다시 시도해주세요.',
+                error_type='rate_limited',
+                retry_after=wait
+            )
+        
+        self._count('calls')
+        extra = {'response_format': response_format} if response_format else {}
+        attempt = 0
+        # 서킷 결과(성공/실패)를 기록했는지 - 예상하지 못한 예외로 끝나도 시험 호출 슬롯이 남지 않도록
+        settled = False
+        try:
+            while True:
+                try:
+                    started = time.monotonic()
+                    response = self.client.chat.completions.create(
+                        model="gpt-4o-mini",
+                        messages=messages,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                        **extra
+                    )
+                    elapsed = time.monotonic() - started
+                    upstream_latency.observe(elapsed, 'openai', 'ok')
+                    self.circuit_breaker.record_success()
+                    settled = True
+                    self._count('succeeded')
+                    self._record_usage(kind, response, prompt_info, elapsed)
+                    return response
+                except (openai.RateLimitError, openai.InternalServerError, openai.APIConnectionError) as e:
+                    upstream_latency.observe(time.monotonic() - started, 'openai', 'error')
+                    upstream_errors.inc('openai', type(e).__name__)
+                    retry_after = self._retry_after(e)
+                    if isinstance(e, openai.RateLimitError):
+                        self._count('upstream_rate_limited')
+                        if retry_after:
+                            self.rate_limiter.pause(retry_after)
+                    
+                    error_type = 'rate_limited' if isinstance(e, openai.RateLimitError) else 'upstream_error'
+                    delay = retry_after if retry_after is not None else min(2 ** attempt, 8)
+                    if attempt >= self.max_retries or delay > self.max_retry_wait:
+                        self.circuit_breaker.record_failure()
+                        settled = True
+                        self._count('failed')
+                        raise GPTCallError(str(e), error_type=error_type, retry_after=retry_after) from e
+                    
+                    attempt += 1
+                    time.sleep(delay)
+                    # 재시도도 요청이므로 한도를 다시 확보 (업스트림이 이미 제한 중일 때 한도를 우회하지 않도록)
+                    acquired, wait = self.rate_limiter.acquire(token_count)
+                    if not acquired:
+                        self.circuit_breaker.record_failure()
+                        settled = True
+                        self._count('failed')
+                        raise GPTCallError(str(e), error_type=error_type, retry_after=wait) from e
+                    self._count('retries')
+                except openai.APIStatusError as e:
+                    upstream_latency.observe(time.monotonic() - started, 'openai', 'error')
+                    upstream_errors.inc('openai', type(e).__name__)
+                    # 4xx 요청 오류는 업스트림 장애가 아니므로 서킷에 반영하지 않음
+                    self.circuit_breaker.record_success()
+                    settled = True
+                    self._count('failed')
+                    raise GPTCallError(str(e), error_type='request_error') from e
+        finally:
+            if not settled:
+                # 응답 파싱 오류, 인터럽트 등 예상하지 못한 예외: 슬롯과 마지막으로 확보한 한도 반환
+                self.circuit_breaker.release()
+                self.rate_limiter.refund(token_count)
+                self._count('failed')
+    
+    def get_stats(self):
+        """유량 제한기, 서킷 브레이커, 호출 통계"""
+        with self._stats_lock:
+            calls = dict(self.stats)
+            usage = {kind: dict(totals) for kind, totals in self.usage.items()}
+            recent = list(self.recent_usage)
+        return {
+            'calls': calls,
+            'rate_limiter': self.rate_limiter.get_stats(),
+            'circuit_breaker': self.circuit_breaker.get_stats(),
+            'token_usage': {
+                'tokenizer': self.token_counter.backend,
+                'content_token_budget': self.content_token_budget,
+                'by_kind': usage,
+                'recent': recent
+            }
+        }
+        
+    def generate_instagram_content(self, title, content, category=None):
+        """
+        뉴스 기사를 바탕으로 인스타그램용 콘텐츠를 생성합니다.
+        
+        Args:
+            title (str): 뉴스 제목
+            content (str): 뉴스 본문
+            category (str): 뉴스 카테고리 (선택사항)
+            
+        Returns:
+            dict: 생성된 인스타그램 콘텐츠
+                - content: 제목, 핵심 포인트, 해시태그가 포함된 전체 텍스트
+                - usage: 프롬프트/응답 토큰 수
+        """
+        try:
+            # 카테고리 정보 포함 여부 확인
+            category_info = f"\n카테고리: {category}" if category else ""
+            
+            # GPT 프롬프트 구성 (본문은 토큰 예산에 맞춰 문장 단위로 자름)
+            messages, prompt_info = self.instagram_prompt.build(
+                header=f"\n다음 뉴스 기사를 바탕으로 매력적인 인스타그램 포스팅용 콘텐츠를 생성해주세요.\n\n제목: {title}\n본문: ",
+                body=content or '',
+                body_budget=self.content_token_budget,
+                footer=category_info
+            )
+            
             # GPT API 호출 (gpt-4o-mini 사용 - 가성비 좋음)
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "당신은 소셜미디어 마케팅 전문가입니다. 뉴스 기사를 매력적인 인스타그램 콘텐츠로 변환하는 것이 전문입니다."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
+            response = self._create_completion(
+                messages=messages,
                 max_tokens=1000,
-                temperature=0.7
+                temperature=0.7,
+                kind='instagram',
+                prompt_info=prompt_info
             )
             
             # 응답 파싱
@@ -120,9 +374,19 @@ class GPTClient:
             return {
                 'success': True,
                 'content': generated_content.strip(),
-                'raw_response': generated_content
+                'raw_response': generated_content,
+                'usage': self._usage_of(response, prompt_info)
             }
             
+        except GPTCallError as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'error_type': e.error_type,
+                'retry_after': e.retry_after,
+                'content': '',
+                'raw_response': ''
+            }
         except Exception as e:
             return {
                 'success': False,
@@ -145,33 +409,16 @@ class GPTClient:
         try:
             category_info = f" (카테고리: {category})" if category else ""
             
-            prompt = f"""
-다음 뉴스 제목에 적합한 인스타그램 해시태그 10개를 생성해주세요:
-
-제목: {title}{category_info}
-
-요구사항:
-- 한국어와 영어 해시태그 혼합
-- 트렌드 반영
-- 뉴스 내용과 관련성 높게
-
-응답 형식: #태그1 #태그2 #태그3 ...
-"""
-
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {
-                        "role": "system", 
-                        "content": "해시태그 생성 전문가입니다. 간결하고 효과적인 해시태그만 생성해주세요."
-                    },
-                    {
-                        "role": "user", 
-                        "content": prompt
-                    }
-                ],
+            messages, prompt_info = self.hashtag_prompt.build(
+                header=f"\n다음 뉴스 제목에 적합한 인스타그램 해시태그 10개를 생성해주세요:\n\n제목: {title}{category_info}\n"
+            )
+            
+            response = self._create_completion(
+                messages=messages,
                 max_tokens=200,
-                temperature=0.7
+                temperature=0.7,
+                kind='hashtags',
+                prompt_info=prompt_info
             )
             
             hashtags_text = response.choices[0].message.content
@@ -179,12 +426,136 @@ class GPTClient:
             
             return {
                 'success': True,
-                'hashtags': hashtag_list
+                'hashtags': hashtag_list,
+                'usage': self._usage_of(response, prompt_info)
             }
             
+        except GPTCallError as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'error_type': e.error_type,
+                'retry_after': e.retry_after,
+                'hashtags': []
+            }
         except Exception as e:
             return {
                 'success': False,
                 'error': str(e),
                 'hashtags': []
-            } 
\ No newline at end of file
+            }
+    
+    def generate_batch_hashtags(self, items):
+        """
+        여러 제목의 해시태그를 한 번(토큰 예산을 넘으면 몇 번)의 호출로 생성합니다.
+        제목에 번호를 붙여 구조화된 JSON 응답을 요청하고, 응답에서 빠진 제목은 한 번 더 묶어 요청합니다.
+        
+        Args:
+            items (list): {'title': 제목, 'category': 카테고리(선택)} 목록
+            
+        Returns:
+            dict: 일괄 생성 결과
+                - results: 입력 순서대로 {'success', 'hashtags'[, 'error', 'error_type', 'retry_after']}
+                - batches: 호출 수
+                - usage: 전체 프롬프트/응답 토큰 수
+        """
+        lines = [title_line(item.get('title', ''), item.get('category')) for item in items]
+        results = [None] * len(items)
+        usage = {'prompt_tokens': 0, 'completion_tokens': 0}
+        batches = 0
+        last_error = None
+        
+        pending = list(range(len(items)))
+        for _ in range(2):
+            missing = []
+            groups = [
+                [pending[i] for i in batch]
+                for batch in pack_batches([lines[i] for i in pending], self.token_counter,
+                                          self.hashtag_batch_prompt_budget, self.hashtag_batch_output_budget,
+                                          self.hashtag_item_tokens)
+            ]
+            batches += len(groups)
+            # 응답 시간은 응답 토큰 수에 비례하므로 묶음들은 동시에 요청
+            with ThreadPoolExecutor(max_workers=max(1, min(self.hashtag_batch_concurrency, len(groups)))) as pool:
+                outcomes = list(pool.map(self._try_hashtag_batch, [[lines[i] for i in indexes] for indexes in groups]))
+            for indexes, (parsed, batch_usage, error) in zip(groups, outcomes):
+                usage['prompt_tokens'] += batch_usage['prompt_tokens'] or 0
+                usage['completion_tokens'] += batch_usage['completion_tokens'] or 0
+                if error is not None:
+                    # 유량 제한/차단/업스트림 오류는 다시 묶어 보내도 같으므로 실패로 기록
+                    last_error = error
+                    for index in indexes:
+                        results[index] = {
+                            'success': False,
+                            'error': str(error),
+                            'error_type': error.error_type,
+                            'retry_after': error.retry_after,
+                            'hashtags': []
+                        }
+                    continue
+                for number, index in enumerate(indexes, 1):
+                    if number in parsed:
+                        results[index] = {'success': True, 'hashtags': parsed[number]}
+                    else:
+                        missing.append(index)
+            pending = missing
+            if not pending:
+                break
+        
+        for index in pending:
+            results[index] = {'success': False, 'error': '응답에 해당 제목의 해시태그가 없습니다.', 'hashtags': []}
+        
+        succeeded = sum(1 for result in results if result['success'])
+        result = {
+            'success': succeeded > 0 or not items,
+            'results': results,
+            'succeeded': succeeded,
+            'batches': batches,
+            'usage': usage
+        }
+        if not result['success'] and last_error is not None:
+            result.update(error=str(last_error), error_type=last_error.error_type, retry_after=last_error.retry_after)
+        elif not result['success']:
+            result['error'] = '응답에서 해시태그를 읽지 못했습니다.'
+        return result
+    
+    def _try_hashtag_batch(self, lines):
+        """묶음 하나 요청 -> (번호별 해시태그, 토큰 사용량, 호출 오류)"""
+        try:
+            parsed, usage = self._request_hashtag_batch(lines)
+            return parsed, usage, None
+        except GPTCallError as e:
+            return {}, {'prompt_tokens': 0, 'completion_tokens': 0}, e
+    
+    def _request_hashtag_batch(self, lines):
+        """
+        제목 줄 묶음 하나를 요청합니다.
+        
+        Returns:
+            tuple: (번호(1부터) -> 해시태그 목록, 토큰 사용량)
+        
+        Raises:
+            GPTCallError: 호출 실패 시
+        """
+        numbered = '\n'.join(f"{number}. {line}" for number, line in enumerate(lines, 1))
+        messages, prompt_info = self.hashtag_batch_prompt.build(
+            header=f"\n다음 뉴스 제목 {len(lines)}개 각각에 적합한 인스타그램 해시태그를 생성해주세요:\n\n{numbered}\n"
+        )
+        # 제목 수에 맞춘 응답 한도 (JSON 괄호 등 여유분 포함)
+        response = self._create_completion(
+            messages=messages,
+            max_tokens=len(lines) * self.hashtag_item_tokens + 50,
+            temperature=0.7,
+            kind='hashtags_batch',
+            prompt_info=prompt_info,
+            response_format=BATCH_RESPONSE_FORMAT
+        )
+        usage = self._usage_of(response, prompt_info)
+        
+        choice = response.choices[0]
+        if choice.finish_reason == 'length':
+            logger.warning("해시태그 일괄 응답이 최대 토큰에서 잘림 (제목 %d개)", len(lines))
+        return parse_batch_response(choice.message.content, len(lines)), {
+            'prompt_tokens': usage['prompt_tokens'],
+            'completion_tokens': usage['completion_tokens']
+        }
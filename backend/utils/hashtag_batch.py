@@ -0,0 +1,191 @@
+"""
+여러 제목 해시태그 일괄 생성 모듈입니다.
+제목마다 한 번씩 호출하면 시스템 메시지와 지시문이 매번 다시 전송되므로,
+제목 여러 개를 번호를 붙여 한 요청에 담고(토큰 예산을 넘으면 여러 요청으로 나눔)
+구조화된 JSON 응답에서 번호별 해시태그를 꺼냅니다.
+응답이 잘리거나 형식이 어긋나도 읽을 수 있는 항목은 최대한 살립니다.
+"""
+
+import json
+import re
+
+# 구조화 출력 스키마 - {"results": [{"id": 1, "hashtags": "#태그 #태그 ..."}, ...]}
+# 해시태그를 배열 대신 문자열 하나로 받아 태그마다 붙는 따옴표/쉼표 토큰을 줄임
+BATCH_RESPONSE_FORMAT = {
+    'type': 'json_schema',
+    'json_schema': {
+        'name': 'batch_hashtags',
+        'strict': True,
+        'schema': {
+            'type': 'object',
+            'properties': {
+                'results': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'object',
+                        'properties': {
+                            'id': {'type': 'integer'},
+                            'hashtags': {'type': 'string'}
+                        },
+                        'required': ['id', 'hashtags'],
+                        'additionalProperties': False
+                    }
+                }
+            },
+            'required': ['results'],
+            'additionalProperties': False
+        }
+    }
+}
+
+# JSON을 읽지 못했을 때 찾는 항목: {"id": 3, "hashtags": "..."} (또는 [...]) 조각, "3. #태그 #태그" 줄
+ITEM_OBJECT = re.compile(r'\{\s*"id"\s*:\s*(\d+)\s*,\s*"hashtags"\s*:\s*(\[[^\]]*\]|"(?:[^"\\]|\\.)*")')
+ITEM_LINE = re.compile(r'^\s*(\d+)\s*[.):]\s*(.+)$', re.MULTILINE)
+QUOTED = re.compile(r'"((?:[^"\\]|\\.)*)"')
+
+
+def title_line(title, category=None):
+    """프롬프트에 넣을 제목 한 줄 (줄바꿈이 번호 매김을 깨지 않도록 공백으로 바꿈)"""
+    category_info = f" (카테고리: {category})" if category else ""
+    return ' '.join(f"{title}{category_info}".split())
+
+
+def pack_batches(lines, counter, prompt_budget, output_budget, item_tokens):
+    """
+    제목 줄 목록을 토큰 예산에 맞는 묶음으로 나눕니다 (순서 유지).
+
+    Args:
+        lines (list): 제목 줄 목록
+        counter (TokenCounter): 토큰 계산기
+        prompt_budget (int): 묶음 하나의 제목 줄 토큰 합 상한
+        output_budget (int): 묶음 하나의 예상 응답 토큰 상한
+        item_tokens (int): 제목 하나당 예상 응답 토큰
+
+    Returns:
+        list: 묶음별 원래 위치(index) 목록
+    """
+    max_items = max(1, output_budget // max(1, item_tokens))
+    batches = []
+    current = []
+    used = 0
+    for index, line in enumerate(lines):
+        # 줄바꿈 구분자 토큰 1 포함
+        tokens = counter.count(line) + 1
+        if current and (len(current) >= max_items or used + tokens > prompt_budget):
+            batches.append(current)
+            current = []
+            used = 0
+        current.append(index)
+        used += tokens
+    if current:
+        batches.append(current)
+    return batches
+
+
+def normalize_hashtags(tags):
+    """
+    해시태그 문자열("#a #b", "a, b") 또는 목록을 '#' 없는 태그 목록으로 정리합니다
+    (태그 안 공백 제거, 중복 제거, 순서 유지).
+    """
+    split_words = isinstance(tags, str)
+    if split_words:
+        tags = [tags]
+    pieces = []
+    for tag in tags:
+        if not isinstance(tag, str):
+            continue
+        if '#' in tag:
+            pieces.extend(tag.split('#'))
+        elif split_words:
+            pieces.extend(tag.replace(',', ' ').split())
+        else:
+            pieces.append(tag)
+    seen = set()
+    normalized = []
+    for tag in pieces:
+        tag = ''.join(tag.replace(',', ' ').split())
+        if tag and tag not in seen:
+            seen.add(tag)
+            normalized.append(tag)
+    return normalized
+
+
+def parse_batch_response(text, count):
+    """
+    일괄 응답에서 번호별 해시태그를 꺼냅니다.
+    정상 JSON이면 그대로 읽고, 응답이 잘렸거나(최대 토큰 도달) 형식이 다르면
+    완성된 항목 조각과 "번호. #태그" 줄을 찾아 읽습니다. 범위를 벗어난 번호는 무시합니다.
+
+    Args:
+        text (str): 모델 응답 텍스트
+        count (int): 묶음의 제목 수 (번호는 1부터)
+
+    Returns:
+        dict: 번호(1부터) -> 해시태그 목록 (태그가 없는 항목은 제외)
+    """
+    results = {}
+    text = text or ''
+
+    def put(number, tags):
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            return
+        tags = normalize_hashtags(tags)
+        if 1 <= number <= count and tags and number not in results:
+            results[number] = tags
+
+    try:
+        data = json.loads(_strip_code_fence(text))
+    except ValueError:
+        data = None
+
+    if isinstance(data, dict):
+        items = data.get('results', data)
+        if isinstance(items, dict):
+            # {"1": [...], "2": [...]} 형태
+            for number, tags in items.items():
+                put(number, tags)
+        elif isinstance(items, list):
+            for item in items:
+                if isinstance(item, dict):
+                    put(item.get('id'), item.get('hashtags', []))
+        if results:
+            return results
+    elif isinstance(data, list):
+        for position, item in enumerate(data, 1):
+            if isinstance(item, dict):
+                put(item.get('id', position), item.get('hashtags', []))
+            else:
+                put(position, item)
+        if results:
+            return results
+
+    for match in ITEM_OBJECT.finditer(text):
+        value = match.group(2)
+        if value.startswith('"'):
+            put(match.group(1), _unquote(value[1:-1]))
+        else:
+            put(match.group(1), [_unquote(tag) for tag in QUOTED.findall(value)])
+    if not results:
+        for match in ITEM_LINE.finditer(text):
+            put(match.group(1), match.group(2))
+    return results
+
+
+def _unquote(value):
+    """JSON 문자열 이스케이프 해제 (잘못된 이스케이프는 그대로)"""
+    try:
+        return json.loads(f'"{value}"')
+    except ValueError:
+        return value
+
+
+def _strip_code_fence(text):
+    """```json ... ``` 으로 감싼 응답의 본문"""
+    text = text.strip()
+    if text.startswith('```'):
+        text = text.split('\n', 1)[1] if '\n' in text else ''
+        if text.rstrip().endswith('```'):
+            text = text.rstrip()[:-3]
+    return text
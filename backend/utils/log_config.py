@@ -0,0 +1,197 @@
+"""
+비동기 로깅 설정 모듈입니다.
+요청 스레드는 로그 레코드를 메모리 큐에 넣기만 하고, 별도 리스너 스레드가 포맷/출력(stdout)을 맡아
+출력이 느려도 요청 처리가 멈추지 않습니다. 큐가 가득 차면 기다리지 않고 버린 뒤 개수를 셉니다.
+
+환경변수:
+    LOG_LEVEL        기본 레벨 (기본 INFO)
+    LOG_LEVELS       로거별 레벨 (예: "app=DEBUG,werkzeug=WARNING,static_serve=WARNING")
+    LOG_FORMAT       json(한 줄 JSON, 기본) 또는 text
+    LOG_QUEUE_SIZE   큐 최대 레코드 수 (기본 10000)
+    LOG_RATE_LIMIT   같은 로거/메시지 형식이 LOG_RATE_WINDOW초 동안 이 횟수를 넘으면 생략 (0이면 제한 없음)
+    LOG_RATE_WINDOW  반복 메시지 집계 구간(초)
+"""
+
+import os
+import sys
+import copy
+import json
+import time
+import queue
+import atexit
+import logging
+import threading
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+# LogRecord 기본 속성 (그 외 속성은 extra로 넘긴 구조화 필드)
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime', 'suppressed'}
+
+_listener = None
+_handler = None
+
+
+class JSONFormatter(logging.Formatter):
+    """한 줄 JSON 로그 (시각, 레벨, 로거, 메시지, 스레드, extra 필드, 예외)"""
+
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'thread': record.threadName
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        suppressed = getattr(record, 'suppressed', 0)
+        if suppressed:
+            entry['suppressed'] = suppressed
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """사람이 읽는 한 줄 로그 (생략된 반복 횟수 표시)"""
+
+    def __init__(self):
+        super().__init__('%(asctime)s %(levelname)s [%(name)s] %(message)s')
+
+    def format(self, record):
+        text = super().format(record)
+        suppressed = getattr(record, 'suppressed', 0)
+        return f"{text} (같은 메시지 {suppressed}건 생략)" if suppressed else text
+
+
+class RateLimitFilter(logging.Filter):
+    """같은 로거/메시지 형식이 짧은 시간에 반복되면 생략하고, 다음에 기록될 때 생략 건수를 붙임"""
+
+    MAX_KEYS = 2000
+
+    def __init__(self, limit=20, window=60.0):
+        super().__init__()
+        self.limit = limit
+        self.window = window
+        self._lock = threading.Lock()
+        # (로거, 메시지 형식) -> [구간 시작, 구간 내 기록 수, 생략 수]
+        self._counts = {}
+        self.suppressed = 0
+
+    def filter(self, record):
+        if self.limit <= 0 or record.levelno >= logging.CRITICAL:
+            return True
+        key = (record.name, record.msg if isinstance(record.msg, str) else type(record.msg))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._counts.get(key)
+            if entry is None:
+                if len(self._counts) >= self.MAX_KEYS:
+                    # f-string 메시지처럼 형식이 매번 다르면 키가 계속 늘어나므로 주기적으로 비움
+                    self._counts.clear()
+                entry = self._counts[key] = [now, 0, 0]
+            elif now - entry[0] >= self.window:
+                entry[0] = now
+                entry[1] = 0
+            if entry[1] >= self.limit:
+                entry[2] += 1
+                self.suppressed += 1
+                return False
+            entry[1] += 1
+            if entry[2]:
+                record.suppressed = entry[2]
+                entry[2] = 0
+        return True
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """큐에 넣기만 하는 핸들러 (큐가 가득 차면 버림, 포맷은 리스너 스레드에서)"""
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # 기본 구현은 요청 스레드에서 예외 스택까지 포맷하므로, 메시지 문자열만 확정하고 나머지는 리스너에 맡김
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def parse_levels(value):
+    """'app=DEBUG,werkzeug=WARNING' -> {'app': 'DEBUG', 'werkzeug': 'WARNING'}"""
+    levels = {}
+    for item in (value or '').split(','):
+        name, sep, level = item.partition('=')
+        if sep and name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+def configure_logging(stream=None):
+    """
+    루트 로거를 큐 기반 비동기 파이프라인으로 설정합니다 (한 번만 적용).
+
+    Args:
+        stream: 출력 스트림 (기본 stdout)
+
+    Returns:
+        NonBlockingQueueHandler: 요청 스레드가 쓰는 핸들러 (통계 확인용)
+    """
+    global _listener, _handler
+    if _handler is not None:
+        return _handler
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(TextFormatter() if os.getenv('LOG_FORMAT', 'json') == 'text' else JSONFormatter())
+
+    log_queue = queue.Queue(maxsize=int(os.getenv('LOG_QUEUE_SIZE', '10000')))
+    _handler = NonBlockingQueueHandler(log_queue)
+    _handler.addFilter(RateLimitFilter(
+        limit=int(os.getenv('LOG_RATE_LIMIT', '20')),
+        window=float(os.getenv('LOG_RATE_WINDOW', '60'))
+    ))
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_handler)
+    root.setLevel(os.getenv('LOG_LEVEL', 'INFO').upper())
+    for name, level in parse_levels(os.getenv('LOG_LEVELS')).items():
+        logging.getLogger(name).setLevel(level)
+
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+    return _handler
+
+
+def stop_logging():
+    """남은 로그를 모두 출력하고 리스너 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_logging_stats():
+    """로깅 파이프라인 통계 (큐 적체, 버린 수, 반복 생략 수)"""
+    if _handler is None:
+        return {'configured': False}
+    rate_filter = next((f for f in _handler.filters if isinstance(f, RateLimitFilter)), None)
+    return {
+        'configured': True,
+        'queued': _handler.queue.qsize(),
+        'dropped': _handler.dropped,
+        'suppressed': rate_filter.suppressed if rate_filter else 0
+    }
@@ -0,0 +1,200 @@
+"""
+프로세스 내부 지표 수집 모듈입니다.
+외부 서비스 없이 카운터/히스토그램을 메모리에 누적하고,
+/metrics 요청 시 Prometheus 텍스트 형식으로 내보냅니다.
+값 기록은 잠금 한 번과 정수 증가 정도로 끝나므로 요청 경로에 두어도 부담이 없습니다.
+"""
+
+import bisect
+import threading
+
+# 지연 시간(초) 기본 구간
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# 응답 크기(바이트) 구간
+SIZE_BUCKETS = (1024, 10240, 102400, 1048576, 5242880, 20971520, 52428800)
+
+
+def _escape(value):
+    """레이블 값 이스케이프"""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=None):
+    """{name="value",...} 형식 레이블 문자열"""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value):
+    """지표 값 문자열 (정수는 소수점 없이)"""
+    if isinstance(value, float) and not value.is_integer():
+        return repr(value)
+    return str(int(value))
+
+
+class Counter:
+    """레이블별 누적 카운터"""
+
+    kind = 'counter'
+
+    def __init__(self, name, help_text, labels=()):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount=1):
+        """카운터 증가 (레이블 값은 선언 순서대로)"""
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def value(self, *label_values):
+        """현재 값"""
+        with self._lock:
+            return self._values.get(label_values, 0)
+
+    def render(self):
+        """Prometheus 텍스트 줄 목록"""
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}" for key, value in items]
+
+
+class Histogram:
+    """레이블별 누적 구간 히스토그램 (합계/개수 포함)"""
+
+    kind = 'histogram'
+
+    def __init__(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블 값 -> [구간별 개수..., +Inf 개수, 합계]
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value, *label_values):
+        """값 하나 기록"""
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [0] * (len(self.buckets) + 2)
+            series[index] += 1
+            series[-1] += value
+
+    def count(self, *label_values):
+        """기록된 값 개수"""
+        with self._lock:
+            series = self._series.get(label_values)
+            return sum(series[:-1]) if series else 0
+
+    def render(self):
+        """Prometheus 텍스트 줄 목록 (구간 값은 누적)"""
+        with self._lock:
+            items = sorted((key, list(series)) for key, series in self._series.items())
+        lines = []
+        for key, series in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + ('+Inf',), series[:-1]):
+                cumulative += count
+                le = bound if bound == '+Inf' else _format_value(float(bound))
+                labels = _format_labels(self.labels, key, 'le="%s"' % le)
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labels, key)
+            lines.append(f"{self.name}_sum{labels} {round(series[-1], 6)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class GaugeCollector:
+    """내보낼 때 함수를 호출해 값을 읽는 게이지 (다른 모듈의 통계를 그대로 노출)"""
+
+    kind = 'gauge'
+
+    def __init__(self, name, help_text, collect, labels=()):
+        """
+        Args:
+            collect (callable): 값 하나, 또는 {레이블 값 튜플: 값} dict를 반환하는 함수
+        """
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self.collect = collect
+
+    def render(self):
+        """Prometheus 텍스트 줄 목록 (수집 중 오류가 나면 생략)"""
+        try:
+            values = self.collect()
+        except Exception:
+            return []
+        if values is None:
+            return []
+        if not isinstance(values, dict):
+            values = {(): values}
+        return [
+            f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"
+            for key, value in sorted(values.items()) if value is not None
+        ]
+
+
+class MetricsRegistry:
+    """지표 모음 (이름별 하나)"""
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name, help_text, labels=()):
+        """카운터 등록 (같은 이름이 있으면 기존 것 반환)"""
+        return self._register(Counter(name, help_text, labels))
+
+    def histogram(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        """히스토그램 등록 (같은 이름이 있으면 기존 것 반환)"""
+        return self._register(Histogram(name, help_text, labels, buckets))
+
+    def gauge(self, name, help_text, collect, labels=()):
+        """수집 함수 게이지 등록 (같은 이름이면 함수 교체)"""
+        with self._lock:
+            self._metrics[name] = GaugeCollector(name, help_text, collect, labels)
+            return self._metrics[name]
+
+    def render(self):
+        """Prometheus 텍스트 형식 전체"""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+# 프로세스 공용 지표 모음
+registry = MetricsRegistry()
+
+# 업스트림 호출 (빅카인즈, OpenAI)
+upstream_latency = registry.histogram(
+    'upstream_request_duration_seconds', '업스트림 API 호출 시간(초)', labels=('upstream', 'outcome'))
+upstream_response_bytes = registry.histogram(
+    'upstream_response_bytes', '업스트림 API 응답 크기(바이트)', labels=('upstream',), buckets=SIZE_BUCKETS)
+upstream_errors = registry.counter(
+    'upstream_errors_total', '업스트림 API 호출 오류 수', labels=('upstream', 'error'))
+
+# 상태 스냅샷 저장
+status_save_duration = registry.histogram(
+    'status_save_duration_seconds', '뉴스 상태 스냅샷 저장 시간(초)')
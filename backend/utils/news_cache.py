@@ -0,0 +1,231 @@
+"""
+빅카인즈 일자별 검색 결과 캐시 모듈입니다.
+하루치 기사(수천~1만 건)를 여러 날 보관해도 메모리가 커지지 않도록,
+기사를 키 문자열을 반복 보관하는 dict 대신 __slots__ 레코드로 저장하고
+언론사/분류처럼 반복되는 문자열은 하나의 객체를 공유(intern)합니다.
+기존 JSON 형태(dict)로는 응답을 만들 때만 변환합니다.
+"""
+
+import sys
+import time
+import threading
+from collections import OrderedDict
+
+from utils.facets import DayFacets
+
+# 빅카인즈 요청 필드 (응답 dict의 키 순서)
+ARTICLE_FIELDS = (
+    'title', 'news_id', 'published_at', 'content', 'provider',
+    'byline', 'provider_link_page', 'dateline', 'enveloped_at', 'hilight',
+    'category', 'category_incident', 'provider_subject', 'subject_info'
+)
+
+# 같은 값이 반복되는 문자열 필드 (공유 객체로 보관)
+INTERNED_FIELDS = frozenset(['provider', 'byline'])
+
+# 목록 필드 (튜플로 보관, 항목 문자열은 공유 객체)
+LIST_FIELDS = frozenset(['category', 'category_incident', 'provider_subject', 'subject_info'])
+
+# 응답에 없던 필드 표시 (None과 구분)
+_MISSING = object()
+
+
+def _intern(value):
+    """문자열이면 공유 객체로, 아니면 그대로"""
+    return sys.intern(value) if type(value) is str else value
+
+
+class ArticleRecord:
+    """캐시용 기사 레코드 (필드별 슬롯, 목록은 튜플)"""
+
+    __slots__ = ARTICLE_FIELDS + ('extra',)
+
+    @classmethod
+    def from_document(cls, document):
+        """빅카인즈 응답 문서(dict)를 레코드로 변환"""
+        record = cls.__new__(cls)
+        for field in ARTICLE_FIELDS:
+            value = document.get(field, _MISSING)
+            if field in LIST_FIELDS and type(value) is list:
+                value = tuple(_intern(item) for item in value)
+            elif field in INTERNED_FIELDS:
+                value = _intern(value)
+            setattr(record, field, value)
+        extra = {key: value for key, value in document.items() if key not in ARTICLE_FIELDS}
+        record.extra = extra or None
+        return record
+
+    def to_dict(self):
+        """응답용 dict로 변환 (원래 문서와 같은 키/목록 형태)"""
+        document = {}
+        for field in ARTICLE_FIELDS:
+            value = getattr(self, field)
+            if value is _MISSING:
+                continue
+            document[field] = list(value) if type(value) is tuple else value
+        if self.extra:
+            document.update(self.extra)
+        return document
+
+
+class DaySnapshot:
+    """한 번의 일자별 검색 결과"""
+
+    __slots__ = ('articles', 'fetched_at', 'facets')
+
+    def __init__(self, documents, fetched_at=None):
+        self.articles = tuple(ArticleRecord.from_document(document) for document in documents)
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+        # 집계 (처음 요청될 때 생성)
+        self.facets = None
+
+    def age(self):
+        """조회 후 지난 시간(초)"""
+        return time.time() - self.fetched_at
+
+    def to_dicts(self):
+        """응답용 기사 dict 목록 (호출할 때마다 새 dict - 호출자가 수정해도 캐시에 영향 없음)"""
+        return [article.to_dict() for article in self.articles]
+
+    def iter_dicts(self):
+        """응답용 기사 dict를 하나씩 생성 (스트리밍 응답에서 목록 전체를 만들지 않도록)"""
+        for article in self.articles:
+            yield article.to_dict()
+
+
+class NewsDayCache:
+    """(날짜, 검색어, 개수)별 검색 결과 LRU 캐시"""
+
+    def __init__(self, max_entries=16, today_ttl=60.0, past_ttl=3600.0, status_lookup=None, max_stale=86400.0):
+        """
+        Args:
+            max_entries (int): 보관할 최대 검색 결과 수
+            today_ttl (float): 오늘 날짜 결과 유효 시간(초) - 새 기사가 계속 들어옴
+            past_ttl (float): 지난 날짜 결과 유효 시간(초)
+            status_lookup (callable): news_id -> 상태 (집계의 상태별 수에 사용)
+            max_stale (float): 유효 시간이 지난 결과를 갱신 중에 대신 내줄 수 있는 최대 경과 시간(초)
+        """
+        self.max_entries = max_entries
+        self.today_ttl = today_ttl
+        self.past_ttl = past_ttl
+        self.max_stale = max_stale
+        self.status_lookup = status_lookup or (lambda news_id: None)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._facets_lock = threading.Lock()
+
+        # 통계
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def ttl_for(self, date, today):
+        """날짜별 유효 시간"""
+        return self.today_ttl if date >= today else self.past_ttl
+
+    def get(self, date, query, limit, today):
+        """
+        유효한 캐시 결과 조회
+
+        Returns:
+            DaySnapshot: 유효한 결과 (없거나 만료되면 None)
+        """
+        key = (date, query, limit)
+        with self._lock:
+            snapshot = self._entries.get(key)
+            if snapshot is None or snapshot.age() > self.ttl_for(date, today):
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return snapshot
+
+    def lookup(self, date, query, limit, today):
+        """
+        유효 시간이 지났어도 max_stale 이내면 함께 반환하는 조회 (stale-while-revalidate용)
+
+        Returns:
+            tuple: (DaySnapshot, 'fresh' | 'stale') - 없으면 (None, None)
+        """
+        key = (date, query, limit)
+        with self._lock:
+            snapshot = self._entries.get(key)
+            if snapshot is not None:
+                age = snapshot.age()
+                if age <= self.ttl_for(date, today):
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return snapshot, 'fresh'
+                if age <= self.max_stale:
+                    self._entries.move_to_end(key)
+                    self.stale_hits += 1
+                    return snapshot, 'stale'
+            self.misses += 1
+            return None, None
+
+    def closest(self, date, query, limit):
+        """같은 날짜/검색어의 더 적은 개수 결과 중 가장 큰 것 (전체 결과가 없을 때 일부라도 내주기 위함)"""
+        with self._lock:
+            candidates = [(entry_limit, snapshot) for (entry_date, entry_query, entry_limit), snapshot
+                          in self._entries.items()
+                          if entry_date == date and entry_query == query and entry_limit < limit]
+        return max(candidates, key=lambda item: item[0])[1] if candidates else None
+
+    def age_of(self, date, query, limit):
+        """캐시된 결과의 경과 시간(초) - 통계에 세지 않는 조회 (없으면 None)"""
+        with self._lock:
+            snapshot = self._entries.get((date, query, limit))
+        return snapshot.age() if snapshot is not None else None
+
+    def put(self, date, query, limit, documents):
+        """검색 결과를 압축 레코드로 저장하고 반환"""
+        snapshot = DaySnapshot(documents)
+        key = (date, query, limit)
+        # 이어받기와 교체를 한 번에 - 그 사이 상태 변경이 이전 집계에만 반영되고 새 집계에서 빠지지 않도록
+        with self._lock:
+            previous = self._entries.get(key)
+            if previous is not None and previous.facets is not None:
+                # 같은 검색의 이전 결과 집계가 있으면 달라진 기사만 반영해 이어받음
+                snapshot.facets = previous.facets.rebase(snapshot.articles)
+            self._entries[key] = snapshot
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return snapshot
+
+    def facets_for(self, snapshot):
+        """검색 결과의 집계 (처음이면 한 번 세어 두고 이후에는 그대로 반환)"""
+        if snapshot.facets is None:
+            with self._facets_lock:
+                if snapshot.facets is None:
+                    snapshot.facets = DayFacets.build(snapshot.articles, self.status_lookup)
+        return snapshot.facets
+
+    def status_changed(self, news_id, status):
+        """
+        상태 변경을 보관 중인 집계에 반영 (반영한 집계 수 반환)
+        집계 생성(facets_for)과 결과 교체(put)가 끝난 뒤 반영하므로 새로 생긴 집계에서도 빠지지 않습니다.
+        """
+        with self._facets_lock, self._lock:
+            return sum(1 for snapshot in self._entries.values()
+                       if snapshot.facets is not None and snapshot.facets.set_status(news_id, status))
+
+    def get_stats(self):
+        """캐시 통계"""
+        with self._lock:
+            entries = [
+                {'date': date, 'query': query, 'limit': limit,
+                 'articles': len(snapshot.articles), 'age_seconds': round(snapshot.age(), 1)}
+                for (date, query, limit), snapshot in self._entries.items()
+            ]
+        return {
+            'entries': entries,
+            'articles': sum(entry['articles'] for entry in entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'stale_hits': self.stale_hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
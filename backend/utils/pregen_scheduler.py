@@ -0,0 +1,292 @@
+"""
+우선순위 기사 콘텐츠 사전 생성 스케줄러 모듈입니다.
+오늘 조회된 기사 중 언론사, 카테고리, 최신성 규칙으로 점수가 높은 기사를 골라
+일일 예산 안에서 백그라운드로 인스타그램 콘텐츠를 미리 생성합니다.
+여러 워커가 함께 쓸 때는 생성 전에 공유 저장소에서 대상을 선점하여 예산과 생성 대상을 나눠 씁니다.
+"""
+
+import heapq
+import logging
+import threading
+import time
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+def parse_weights(value):
+    """
+    "서울경제:3,한국경제:2" 형식의 가중치 설정을 dict로 변환합니다.
+
+    Args:
+        value (str): 쉼표로 구분된 "이름:가중치" 목록 (가중치 생략 시 1)
+
+    Returns:
+        dict: {이름: 가중치}
+    """
+    weights = {}
+    for item in (value or '').split(','):
+        item = item.strip()
+        if not item:
+            continue
+        name, _, weight = item.partition(':')
+        try:
+            weights[name.strip()] = float(weight) if weight else 1.0
+        except ValueError:
+            logger.warning("잘못된 가중치 설정 무시: %s", item)
+    return weights
+
+
+class PriorityRules:
+    """사전 생성 대상 기사의 우선순위 점수 규칙"""
+
+    def __init__(self, provider_weights=None, category_weights=None,
+                 recency_hours=3.0, recency_weight=1.0, min_score=1.0):
+        """
+        Args:
+            provider_weights (dict): 언론사별 가중치
+            category_weights (dict): 카테고리(접두어 일치)별 가중치
+            recency_hours (float): 최신성 가산점이 0이 되는 기사 경과 시간
+            recency_weight (float): 방금 나온 기사에 주는 최대 가산점
+            min_score (float): 사전 생성 대상이 되기 위한 최소 점수
+        """
+        self.provider_weights = provider_weights or {}
+        self.category_weights = category_weights or {}
+        self.recency_hours = recency_hours
+        self.recency_weight = recency_weight
+        self.min_score = min_score
+
+    def score(self, article, now=None):
+        """기사 우선순위 점수 계산"""
+        score = self.provider_weights.get(article.get('provider') or '', 0.0)
+
+        category = article.get('category') or ''
+        for prefix, weight in self.category_weights.items():
+            if category.startswith(prefix):
+                score += weight
+                break
+
+        published = article.get('published_at') or article.get('dateline')
+        if published and self.recency_hours > 0:
+            try:
+                published_at = datetime.fromisoformat(published.replace('Z', '+00:00'))
+                current = now or datetime.now(published_at.tzinfo)
+                age_hours = (current - published_at).total_seconds() / 3600
+                score += self.recency_weight * max(0.0, 1 - max(age_hours, 0) / self.recency_hours)
+            except (ValueError, TypeError):
+                pass
+
+        return score
+
+
+class PregenScheduler:
+    """일일 예산 안에서 우선순위 기사 콘텐츠를 미리 생성하는 백그라운드 스케줄러"""
+
+    def __init__(self, generate_fn, has_content_fn, rules, daily_budget=50,
+                 max_queue=200, idle_interval=5.0, claim_fn=None, release_fn=None):
+        """
+        Args:
+            generate_fn (callable): 기사 dict를 받아 생성 결과 dict를 반환하는 함수
+            has_content_fn (callable): 뉴스 ID의 콘텐츠 존재 여부를 반환하는 함수
+            rules (PriorityRules): 우선순위 규칙
+            daily_budget (int): 하루 최대 사전 생성 호출 수
+            max_queue (int): 대기열 최대 길이 (초과 시 점수 낮은 기사부터 제외)
+            idle_interval (float): 대기열이 비었을 때 재확인 주기(초)
+            claim_fn (callable): (날짜, 뉴스 ID) -> 'claimed' | 'duplicate' | 'exhausted'
+                여러 워커가 예산과 생성 대상을 나눠 쓸 때 생성 전에 선점 (없으면 이 워커 안에서만 확인)
+            release_fn (callable): (날짜, 뉴스 ID) - 생성을 미룰 때 선점 취소
+        """
+        self.generate_fn = generate_fn
+        self.has_content_fn = has_content_fn
+        self.claim_fn = claim_fn
+        self.release_fn = release_fn
+        self.rules = rules
+        self.daily_budget = daily_budget
+        self.max_queue = max_queue
+        self.idle_interval = idle_interval
+
+        self._heap = []
+        self._queued = set()
+        self._seen = set()
+        self._seq = 0
+        self._day = datetime.now().strftime('%Y-%m-%d')
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._paused_until = 0.0
+        # 다른 워커와 함께 쓰는 예산이 소진됨 (날짜가 바뀌면 초기화)
+        self._exhausted = False
+        self._thread = None
+
+        # 통계
+        self.used_today = 0
+        self.generated = 0
+        self.failed = 0
+        self.skipped = 0
+        self.deferred = 0
+
+    def _roll_day(self):
+        """날짜가 바뀌면 예산과 중복 확인 목록 초기화 (_cond 보유 상태에서 호출)"""
+        today = datetime.now().strftime('%Y-%m-%d')
+        if today != self._day:
+            self._day = today
+            self.used_today = 0
+            self._exhausted = False
+            self._seen.clear()
+            self._heap = []
+            self._queued.clear()
+
+    def _out_of_budget(self):
+        """오늘 예산 소진 여부 (_cond 보유 상태에서 호출)"""
+        return self._exhausted or self.used_today >= self.daily_budget
+
+    def submit(self, articles, date_str):
+        """
+        새로 조회된 기사 목록을 후보로 등록합니다. 오늘 날짜 기사만 대상입니다.
+
+        Args:
+            articles (list): 상태 정보가 추가된 기사 목록
+            date_str (str): 조회 날짜 (YYYY-MM-DD)
+
+        Returns:
+            int: 새로 대기열에 추가된 기사 수
+        """
+        added = 0
+        with self._cond:
+            self._roll_day()
+            if date_str != self._day or self._out_of_budget():
+                return 0
+
+            for article in articles:
+                news_id = article.get('news_id')
+                if not news_id or news_id in self._seen or article.get('has_content'):
+                    continue
+                self._seen.add(news_id)
+
+                score = self.rules.score(article)
+                if score < self.rules.min_score:
+                    continue
+
+                self._seq += 1
+                heapq.heappush(self._heap, (-score, self._seq, {
+                    'news_id': news_id,
+                    'title': article.get('title', ''),
+                    'content': article.get('content', ''),
+                    'category': article.get('category') or '',
+                    'score': round(score, 3),
+                    'day': self._day
+                }))
+                self._queued.add(news_id)
+                added += 1
+
+            if len(self._heap) > self.max_queue:
+                self._heap = heapq.nsmallest(self.max_queue, self._heap)
+                heapq.heapify(self._heap)
+                self._queued = {item[2]['news_id'] for item in self._heap}
+
+            if added:
+                self._cond.notify()
+        return added
+
+    def _next(self):
+        """다음 생성 대상 (예산 소진 또는 대기 중이면 None)"""
+        with self._cond:
+            self._roll_day()
+            wait = self._paused_until - time.monotonic()
+            if wait > 0:
+                self._cond.wait(timeout=wait)
+                return None
+            if not self._heap or self._out_of_budget():
+                self._cond.wait(timeout=self.idle_interval)
+                return None
+            _, _, article = heapq.heappop(self._heap)
+            self._queued.discard(article['news_id'])
+            return article
+
+    def _run(self):
+        """백그라운드 생성 루프"""
+        logger.info("콘텐츠 사전 생성 스케줄러 시작 (일일 예산 %d건)", self.daily_budget)
+        while not self._stop.is_set():
+            article = self._next()
+            if article is None:
+                continue
+
+            # 사용자가 그 사이 직접 생성한 경우 건너뜀
+            if self.has_content_fn(article['news_id']):
+                self.skipped += 1
+                continue
+
+            # 다른 워커가 이미 생성 중이거나 함께 쓰는 예산이 소진되었으면 건너뜀
+            if self.claim_fn:
+                try:
+                    claim = self.claim_fn(article['day'], article['news_id'])
+                except Exception as e:
+                    logger.error("사전 생성 대상 선점 중 오류 (%s): %s", article['news_id'], e)
+                    claim = 'error'
+                if claim != 'claimed':
+                    with self._cond:
+                        if claim == 'exhausted':
+                            self._exhausted = True
+                        else:
+                            self.skipped += 1
+                    continue
+
+            try:
+                result = self.generate_fn(article)
+            except Exception as e:
+                logger.error("사전 생성 중 오류 (%s): %s", article['news_id'], e)
+                result = {'success': False, 'error': str(e)}
+
+            deferred = not result.get('success') and result.get('error_type') in ('rate_limited', 'circuit_open')
+            if deferred and self.release_fn:
+                # 미룬 기사는 예산을 쓰지 않으므로 선점도 돌려줌
+                self.release_fn(article['day'], article['news_id'])
+
+            with self._cond:
+                if result.get('success'):
+                    self.used_today += 1
+                    self.generated += 1
+                elif deferred:
+                    # 사용자 요청에 양보: 대기 후 다시 시도하도록 대기열에 되돌림
+                    self.deferred += 1
+                    self._paused_until = time.monotonic() + max(result.get('retry_after') or 0, self.idle_interval)
+                    self._seq += 1
+                    heapq.heappush(self._heap, (-article['score'], self._seq, article))
+                    self._queued.add(article['news_id'])
+                else:
+                    self.used_today += 1
+                    self.failed += 1
+        logger.info("콘텐츠 사전 생성 스케줄러 종료")
+
+    def start(self):
+        """백그라운드 스레드 시작"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='pregen-scheduler', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=5.0):
+        """백그라운드 스레드 종료"""
+        self._stop.set()
+        with self._cond:
+            self._cond.notify_all()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def get_stats(self):
+        """스케줄러 상태 및 통계"""
+        with self._cond:
+            return {
+                'running': bool(self._thread and self._thread.is_alive()),
+                'day': self._day,
+                'daily_budget': self.daily_budget,
+                'used_today': self.used_today,
+                'budget_exhausted': self._out_of_budget(),
+                'shared_budget': self.claim_fn is not None,
+                'queued': len(self._heap),
+                'generated': self.generated,
+                'failed': self.failed,
+                'skipped': self.skipped,
+                'deferred': self.deferred,
+                'paused_for': round(max(0.0, self._paused_until - time.monotonic()), 2)
+            }
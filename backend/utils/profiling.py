@@ -0,0 +1,186 @@
+"""
+요청 단위 프로파일링 모듈입니다.
+- 이름 붙인 구간(span): 업스트림 조회/가공/저장/직렬화 등 단계별 시간을 요청마다 모으고 지표로도 기록
+- 스택 샘플러: 대상 스레드(또는 전체 스레드)의 호출 스택을 일정 간격으로 채집해
+  flamegraph.pl / speedscope에서 바로 읽을 수 있는 folded 형식(한 줄에 "a;b;c 개수")으로 만듦
+샘플러는 요청 스레드를 멈추거나 추적 훅을 걸지 않으므로 켜 둔 동안에도 부담이 작고, 꺼져 있으면 비용이 없습니다.
+"""
+
+import os
+import re
+import sys
+import time
+import threading
+import contextvars
+from collections import Counter
+from contextlib import contextmanager
+
+from utils.metrics import registry
+
+span_duration = registry.histogram(
+    'app_span_duration_seconds', '요청 처리 단계별 시간(초)', labels=('span',))
+
+# 현재 요청의 구간 기록 목록 (기록 중이 아니면 None)
+_spans = contextvars.ContextVar('profiling_spans', default=None)
+
+
+@contextmanager
+def span(name):
+    """
+    이름 붙인 처리 구간 측정 (항상 지표에 기록하고, 요청 기록 중이면 요청별 목록에도 추가)
+
+    사용 예:
+        with span('upstream'):
+            news_list = fetch_day_articles(...)
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        span_duration.observe(elapsed, name)
+        spans = _spans.get()
+        if spans is not None:
+            spans.append((name, elapsed))
+
+
+def begin_spans():
+    """현재 요청의 구간 기록 시작 (end_spans에 넘길 토큰 반환)"""
+    return _spans.set([])
+
+
+def end_spans(token):
+    """구간 기록을 끝내고 [(이름, 초), ...] 반환"""
+    spans = _spans.get() or []
+    _spans.reset(token)
+    return spans
+
+
+def server_timing(spans):
+    """구간 목록을 Server-Timing 헤더 값으로 (같은 이름은 합산, 브라우저 개발자 도구에 표시됨)"""
+    totals = {}
+    for name, elapsed in spans:
+        totals[name] = totals.get(name, 0.0) + elapsed
+    return ', '.join(f"{name};dur={elapsed * 1000:.1f}" for name, elapsed in totals.items())
+
+
+def _frame_label(frame):
+    """스택 프레임 표시 이름 (파일명:함수명)"""
+    code = frame.f_code
+    return f"{os.path.basename(code.co_filename)}:{code.co_name}"
+
+
+def _folded_stack(frame):
+    """가장 바깥 호출부터 현재 프레임까지 ';'로 이은 스택"""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    labels.reverse()
+    return ';'.join(labels)
+
+
+class StackSampler:
+    """백그라운드 스레드에서 호출 스택을 주기적으로 채집하는 샘플링 프로파일러"""
+
+    def __init__(self, thread_ids=None, interval=0.005):
+        """
+        Args:
+            thread_ids (iterable): 채집할 스레드 ID (None이면 샘플러 자신을 뺀 전체 스레드)
+            interval (float): 채집 간격(초)
+        """
+        self.thread_ids = set(thread_ids) if thread_ids is not None else None
+        self.interval = interval
+        self.samples = Counter()
+        self.sample_count = 0
+        self.started_at = None
+        self.duration = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        own_id = threading.get_ident()
+        while not self._stop.is_set():
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                if self.thread_ids is not None and thread_id not in self.thread_ids:
+                    continue
+                self.samples[_folded_stack(frame)] += 1
+            self.sample_count += 1
+            self._stop.wait(self.interval)
+
+    def start(self):
+        """채집 시작"""
+        self.started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name='stack-sampler', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """채집 종료"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        self.duration = time.perf_counter() - self.started_at
+        return self
+
+    def folded(self):
+        """folded 형식 보고서 (많이 채집된 스택부터)"""
+        return ''.join(f"{stack} {count}\n" for stack, count in self.samples.most_common())
+
+
+class ProfileStore:
+    """프로파일 보고서를 디렉토리에 보관 (최근 것만 유지)"""
+
+    NAME_PATTERN = re.compile(r'^[\w.-]+\.folded$')
+
+    def __init__(self, base_dir, keep=50):
+        self.base_dir = base_dir
+        self.keep = keep
+        self._lock = threading.Lock()
+
+    def save(self, label, report, spans=None):
+        """
+        보고서 저장
+
+        Returns:
+            str: 저장한 파일 이름
+        """
+        safe_label = re.sub(r'[^\w-]+', '_', label).strip('_') or 'request'
+        # 이름순 = 시간순이 되도록 같은 시각(초와 나노초)에서 만든 이름
+        now_ns = time.time_ns()
+        stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(now_ns // 1000000000))
+        name = f"{stamp}-{now_ns % 1000000000:09d}-{safe_label}.folded"
+        header = ''.join(f"# span {span_name} {elapsed * 1000:.1f}ms\n" for span_name, elapsed in spans or [])
+        with self._lock:
+            os.makedirs(self.base_dir, exist_ok=True)
+            with open(os.path.join(self.base_dir, name), 'w', encoding='utf-8') as f:
+                f.write(header + report)
+            self._prune()
+        return name
+
+    def _prune(self):
+        """오래된 보고서 삭제"""
+        names = sorted(name for name in os.listdir(self.base_dir) if name.endswith('.folded'))
+        for name in names[:-self.keep]:
+            try:
+                os.remove(os.path.join(self.base_dir, name))
+            except OSError:
+                pass
+
+    def list(self):
+        """저장된 보고서 이름 (최신순)"""
+        if not os.path.isdir(self.base_dir):
+            return []
+        return sorted((name for name in os.listdir(self.base_dir) if name.endswith('.folded')), reverse=True)
+
+    def read(self, name):
+        """보고서 내용 (이름이 올바르지 않거나 없으면 None)"""
+        if not self.NAME_PATTERN.match(name):
+            return None
+        try:
+            with open(os.path.join(self.base_dir, name), 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
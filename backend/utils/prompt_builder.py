@@ -0,0 +1,188 @@
+"""
+토큰 기준 프롬프트 구성 모듈입니다.
+로컬 토크나이저로 토큰 수를 세고, 기사 본문을 문장 단위로 토큰 예산에 맞춰 자르며,
+매 호출마다 동일한 고정 템플릿 부분은 한 번만 만들어 재사용합니다.
+"""
+
+import re
+import math
+import threading
+
+try:
+    import tiktoken
+except ImportError:  # 선택 의존성: 없으면 근사 토큰 계산 사용
+    tiktoken = None
+
+
+# 문장 경계: 마침표/물음표/느낌표(및 닫는 따옴표) 뒤 공백 또는 줄바꿈
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?。])["\'”’)]*\s+|\n+')
+
+# 근사 계산용: ASCII 연속 구간과 그 외 문자
+ASCII_RUN = re.compile(r'[\x00-\x7f]+')
+
+
+class TokenCounter:
+    """모델 토크나이저 기반 토큰 계산기 (tiktoken이 없으면 근사치 사용)"""
+
+    def __init__(self, model="gpt-4o-mini"):
+        self.model = model
+        self._encoding = None
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    @property
+    def encoding(self):
+        """토크나이저 지연 로딩 (인코딩 파일 로드 실패 시 근사 계산으로 대체)"""
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    if tiktoken is not None:
+                        try:
+                            self._encoding = tiktoken.encoding_for_model(self.model)
+                        except Exception:
+                            try:
+                                self._encoding = tiktoken.get_encoding("o200k_base")
+                            except Exception:
+                                self._encoding = None
+                    self._loaded = True
+        return self._encoding
+
+    @property
+    def backend(self):
+        """사용 중인 토큰 계산 방식"""
+        return 'tiktoken' if self.encoding is not None else 'approximate'
+
+    def count(self, text):
+        """텍스트의 토큰 수"""
+        if not text:
+            return 0
+        if self.encoding is not None:
+            return len(self.encoding.encode(text))
+        return self._approximate(text)
+
+    @staticmethod
+    def _approximate(text):
+        """근사 토큰 수: ASCII는 4자당 1토큰, 한글 등 그 외 문자는 1자당 1토큰"""
+        ascii_chars = 0
+        for run in ASCII_RUN.findall(text):
+            ascii_chars += len(run)
+        return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+    def truncate(self, text, budget):
+        """토큰 예산에 맞게 텍스트 앞부분만 남김 (문장 경계와 무관한 강제 절단)"""
+        if budget <= 0:
+            return ''
+        if self.encoding is not None:
+            tokens = self.encoding.encode(text)
+            if len(tokens) <= budget:
+                return text
+            return self.encoding.decode(tokens[:budget])
+
+        # 근사 계산: 예산을 넘지 않는 최대 길이를 이진 탐색
+        low, high = 0, len(text)
+        while low < high:
+            mid = (low + high + 1) // 2
+            if self._approximate(text[:mid]) <= budget:
+                low = mid
+            else:
+                high = mid - 1
+        return text[:low]
+
+
+def split_sentences(text):
+    """본문을 문장 단위로 분리"""
+    return [sentence.strip() for sentence in SENTENCE_BOUNDARY.split(text) if sentence and sentence.strip()]
+
+
+def trim_to_token_budget(text, budget, counter):
+    """
+    본문을 문장 경계 기준으로 토큰 예산 이내로 자릅니다.
+
+    Args:
+        text (str): 기사 본문
+        budget (int): 허용 토큰 수
+        counter (TokenCounter): 토큰 계산기
+
+    Returns:
+        tuple: (잘린 본문, 토큰 수, 잘렸는지 여부)
+    """
+    if not text:
+        return '', 0, False
+
+    total = counter.count(text)
+    if total <= budget:
+        return text, total, False
+
+    kept = []
+    used = 0
+    for sentence in split_sentences(text):
+        # 공백 한 칸으로 이어붙이므로 구분자 토큰을 여유분으로 1 추가
+        sentence_tokens = counter.count(sentence) + 1
+        if used + sentence_tokens > budget:
+            break
+        kept.append(sentence)
+        used += sentence_tokens
+
+    if not kept:
+        # 첫 문장부터 예산을 넘으면 문장 중간에서 자름
+        trimmed = counter.truncate(text, budget)
+        return trimmed, counter.count(trimmed), True
+
+    trimmed = ' '.join(kept)
+    return trimmed, counter.count(trimmed), True
+
+
+class PromptBuilder:
+    """고정 템플릿을 캐시하고 가변 부분만 조립하는 프롬프트 빌더"""
+
+    def __init__(self, system_prompt, template, counter):
+        """
+        Args:
+            system_prompt (str): 시스템 메시지
+            template (str): 고정 지시문/예시 (호출마다 동일한 부분)
+            counter (TokenCounter): 토큰 계산기
+        """
+        self.system_prompt = system_prompt
+        self.template = template
+        self.counter = counter
+        self._static_tokens = None
+
+    @property
+    def static_tokens(self):
+        """고정 부분(시스템 메시지 + 템플릿) 토큰 수 - 최초 1회만 계산"""
+        if self._static_tokens is None:
+            self._static_tokens = self.counter.count(self.system_prompt) + self.counter.count(self.template)
+        return self._static_tokens
+
+    def build(self, header, body='', body_budget=None, footer=''):
+        """
+        메시지 목록을 만듭니다.
+
+        Args:
+            header (str): 본문 앞에 들어갈 가변 텍스트 (제목 등)
+            body (str): 토큰 예산에 맞춰 자를 본문
+            body_budget (int): 본문 토큰 예산 (None이면 자르지 않음)
+            footer (str): 본문 뒤에 들어갈 가변 텍스트 (카테고리 등)
+
+        Returns:
+            tuple: (messages, 프롬프트 정보 dict)
+        """
+        truncated = False
+        body_tokens = 0
+        if body and body_budget is not None:
+            body, body_tokens, truncated = trim_to_token_budget(body, body_budget, self.counter)
+        elif body:
+            body_tokens = self.counter.count(body)
+
+        dynamic = f"{header}{body}{'...' if truncated else ''}{footer}"
+        messages = [
+            {"role": "system", "content": self.system_prompt},
+            # 고정 부분을 앞에 두어 호출 간 같은 접두부가 유지되도록 (업스트림 프롬프트 캐시 재사용)
+            {"role": "user", "content": f"{self.template}\n{dynamic}"}
+        ]
+        info = {
+            'estimated_prompt_tokens': self.static_tokens + self.counter.count(dynamic),
+            'body_tokens': body_tokens,
+            'body_truncated': truncated
+        }
+        return messages, info
@@ -0,0 +1,222 @@
+"""
+외부 API 호출 보호를 위한 유량 제어 모듈입니다.
+분당 요청 수/토큰 수를 제한하는 토큰 버킷과,
+업스트림 장애 시 빠르게 실패시키는 서킷 브레이커를 제공합니다.
+"""
+
+import time
+import threading
+
+
+class TokenBucket:
+    """분 단위 한도를 초 단위로 보충하는 토큰 버킷"""
+
+    def __init__(self, per_minute):
+        """
+        Args:
+            per_minute (int): 분당 허용량 (버킷 최대 용량)
+        """
+        self.capacity = float(per_minute)
+        self.refill_rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now):
+        """경과 시간만큼 토큰 보충"""
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+            self.updated_at = now
+
+    def wait_time(self, amount, now):
+        """amount 만큼 사용하기 위해 기다려야 하는 시간(초)"""
+        self._refill(now)
+        # 버킷 용량보다 큰 요청은 가득 찼을 때 한 번에 소비하도록 허용
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.refill_rate
+
+    def consume(self, amount):
+        """토큰 차감 (부족하면 음수가 되어 이후 요청이 그만큼 대기)"""
+        self.tokens -= min(amount, self.capacity)
+
+
+class RateLimiter:
+    """분당 요청 수(RPM)와 분당 토큰 수(TPM)를 함께 제한하는 클라이언트 측 제한기"""
+
+    def __init__(self, requests_per_minute, tokens_per_minute, max_wait=10.0):
+        """
+        Args:
+            requests_per_minute (int): 분당 최대 요청 수
+            tokens_per_minute (int): 분당 최대 토큰 수
+            max_wait (float): 한도 초과 시 대기할 최대 시간(초), 넘으면 거절
+        """
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.max_wait = max_wait
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+        # 통계
+        self.acquired = 0
+        self.rejected = 0
+        self.waited = 0
+        self.total_wait_seconds = 0.0
+
+    def pause(self, seconds):
+        """업스트림이 Retry-After를 알려준 경우 해당 시간 동안 모든 요청 보류"""
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def acquire(self, token_count, max_wait=None):
+        """
+        요청 1건과 token_count 만큼의 토큰을 확보합니다.
+
+        Args:
+            token_count (int): 예상 사용 토큰 수 (프롬프트 + 최대 응답)
+            max_wait (float): 이번 호출의 최대 대기 시간(초)
+
+        Returns:
+            tuple: (확보 성공 여부, 거절 시 권장 재시도 대기 시간)
+        """
+        max_wait = self.max_wait if max_wait is None else max_wait
+
+        with self._lock:
+            now = time.monotonic()
+            wait = max(
+                self.paused_until - now,
+                self.requests.wait_time(1, now),
+                self.tokens.wait_time(token_count, now)
+            )
+            if wait > max_wait:
+                self.rejected += 1
+                return False, wait
+
+            # 대기가 필요한 만큼 미리 차감하여 다른 스레드와 순서를 보장
+            self.requests.consume(1)
+            self.tokens.consume(token_count)
+            self.acquired += 1
+            if wait > 0:
+                self.waited += 1
+                self.total_wait_seconds += wait
+
+        if wait > 0:
+            time.sleep(wait)
+        return True, 0.0
+
+    def refund(self, token_count):
+        """확보했지만 업스트림 호출 결과 없이 끝난 요청 1건과 토큰을 되돌림"""
+        with self._lock:
+            now = time.monotonic()
+            for bucket, amount in ((self.requests, 1), (self.tokens, token_count)):
+                bucket._refill(now)
+                bucket.tokens = min(bucket.capacity, bucket.tokens + min(amount, bucket.capacity))
+
+    def get_stats(self):
+        """현재 제한기 상태 및 누적 통계"""
+        with self._lock:
+            now = time.monotonic()
+            self.requests._refill(now)
+            self.tokens._refill(now)
+            return {
+                'requests_per_minute': int(self.requests.capacity),
+                'tokens_per_minute': int(self.tokens.capacity),
+                'available_requests': round(self.requests.tokens, 2),
+                'available_tokens': round(self.tokens.tokens, 2),
+                'paused_for': round(max(0.0, self.paused_until - now), 2),
+                'acquired': self.acquired,
+                'rejected': self.rejected,
+                'waited': self.waited,
+                'total_wait_seconds': round(self.total_wait_seconds, 3)
+            }
+
+
+class CircuitBreaker:
+    """연속 실패 시 일정 시간 동안 호출을 차단하는 서킷 브레이커"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold=5, recovery_timeout=30.0):
+        """
+        Args:
+            failure_threshold (int): 차단으로 전환할 연속 실패 횟수
+            recovery_timeout (float): 차단 후 시험 호출을 허용하기까지의 시간(초)
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+        # 통계
+        self.short_circuited = 0
+        self.times_opened = 0
+
+    def allow(self):
+        """
+        호출 허용 여부를 확인합니다.
+
+        Returns:
+            tuple: (허용 여부, 차단 시 남은 대기 시간)
+        """
+        with self._lock:
+            if self.state == self.OPEN:
+                remaining = self.opened_at + self.recovery_timeout - time.monotonic()
+                if remaining > 0:
+                    self.short_circuited += 1
+                    return False, remaining
+                self.state = self.HALF_OPEN
+                self._trial_in_flight = False
+
+            if self.state == self.HALF_OPEN:
+                # 반개방 상태에서는 시험 호출 1건만 통과
+                if self._trial_in_flight:
+                    self.short_circuited += 1
+                    return False, self.recovery_timeout
+                self._trial_in_flight = True
+
+            return True, 0.0
+
+    def release(self):
+        """호출하지 않고 끝난 경우 시험 호출 슬롯 반환"""
+        with self._lock:
+            self._trial_in_flight = False
+
+    def record_success(self):
+        """호출 성공 기록 - 차단 해제"""
+        with self._lock:
+            self.failures = 0
+            self.state = self.CLOSED
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        """호출 실패 기록 - 임계치 도달 또는 시험 호출 실패 시 차단"""
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.times_opened += 1
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def get_stats(self):
+        """서킷 브레이커 상태"""
+        with self._lock:
+            retry_in = 0.0
+            if self.state == self.OPEN:
+                retry_in = max(0.0, self.opened_at + self.recovery_timeout - time.monotonic())
+            return {
+                'state': self.state,
+                'consecutive_failures': self.failures,
+                'failure_threshold': self.failure_threshold,
+                'recovery_timeout': self.recovery_timeout,
+                'retry_in': round(retry_in, 2),
+                'times_opened': self.times_opened,
+                'short_circuited': self.short_circuited
+            }
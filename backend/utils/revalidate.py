@@ -0,0 +1,100 @@
+"""
+업스트림 재조회 모듈입니다.
+같은 검색(날짜, 검색어, 개수)의 빅카인즈 조회가 동시에 여러 번 필요해도 한 번만 실행하고(single-flight),
+요청 스레드 대신 작은 스레드 풀에서 실행하여 요청은 정해진 시간까지만 기다리거나(마감 시간)
+캐시된 이전 결과를 바로 내주고 갱신은 뒤에서 끝나게 할 수 있습니다 (stale-while-revalidate).
+"""
+
+import atexit
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+
+def register_exit_hook(fn):
+    """
+    인터프리터 종료 시 스레드 풀 정리보다 먼저 실행할 함수 등록
+    concurrent.futures는 종료 시 모든 풀 스레드를 join하는데 이는 atexit 함수보다 먼저 실행되므로,
+    atexit에서 대기 중인 작업을 취소하면 이미 다 실행된 뒤입니다.
+    threading의 종료 훅은 등록 역순으로 실행되어 concurrent.futures 이후에 등록한 함수가 먼저 실행됩니다.
+    """
+    register = getattr(threading, '_register_atexit', None)
+    if register is None:
+        atexit.register(fn)
+    else:
+        register(fn)
+
+
+class Revalidator:
+    """키별로 하나만 실행되는 백그라운드 재조회"""
+
+    def __init__(self, fetch_fn, max_workers=2):
+        """
+        Args:
+            fetch_fn (callable): (날짜, 검색어, 개수) -> 조회 후 캐시에 저장한 결과
+            max_workers (int): 동시에 실행할 최대 재조회 수
+        """
+        self.fetch_fn = fetch_fn
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='news-refresh')
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+        # 통계
+        self.started = 0
+        self.joined = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.last_error = None
+
+    def submit(self, date, query, limit):
+        """
+        재조회 시작 (같은 키가 이미 실행 중이면 그 결과를 함께 기다림)
+
+        Returns:
+            Future: DaySnapshot 결과 (실패 시 예외)
+        """
+        key = (date, query, limit)
+        with self._lock:
+            future = self._in_flight.get(key)
+            if future is not None:
+                self.joined += 1
+                return future
+            future = self._executor.submit(self._run, key)
+            self._in_flight[key] = future
+            self.started += 1
+            return future
+
+    def _run(self, key):
+        try:
+            result = self.fetch_fn(*key)
+        except Exception as e:
+            with self._lock:
+                self.failed += 1
+                self.last_error = str(e)[:200]
+            logger.warning("빅카인즈 재조회 실패 %s: %s", key, e)
+            raise
+        else:
+            with self._lock:
+                self.succeeded += 1
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def shutdown(self):
+        """대기 중인 재조회 취소 (실행 중인 조회는 끝나는 대로 종료)"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def get_stats(self):
+        """재조회 통계"""
+        with self._lock:
+            return {
+                'in_flight': len(self._in_flight),
+                'started': self.started,
+                'joined': self.joined,
+                'succeeded': self.succeeded,
+                'failed': self.failed,
+                'last_error': self.last_error
+            }
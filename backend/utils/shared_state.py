@@ -0,0 +1,283 @@
+"""
+프로세스 간 상태/이벤트 공유 모듈입니다.
+외부 서비스 없이 SQLite 파일 하나에 뉴스 상태 테이블과 변경 로그 테이블을 두고,
+각 워커는 변경 로그를 짧은 주기로 따라 읽어 자기 메모리의 상태와 SSE 브로커에 반영합니다.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS news_status (
+    news_id TEXT PRIMARY KEY,
+    record TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS changes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    origin TEXT NOT NULL,
+    news_id TEXT,
+    record TEXT,
+    event_type TEXT,
+    event_data TEXT,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pregen_claims (
+    day TEXT NOT NULL,
+    news_id TEXT NOT NULL,
+    origin TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (day, news_id)
+);
+"""
+
+
+class SharedStateBus:
+    """SQLite 변경 로그 기반 워커 간 상태/이벤트 버스"""
+
+    def __init__(self, db_path, poll_interval=0.1, retention_seconds=600):
+        """
+        Args:
+            db_path (str): SQLite 파일 경로 (모든 워커가 같은 파일 사용)
+            poll_interval (float): 변경 로그 확인 주기(초) - 다른 워커 변경 반영 지연의 상한
+            retention_seconds (float): 변경 로그 보관 시간(초)
+        """
+        self.db_path = db_path
+        self.poll_interval = poll_interval
+        self.retention_seconds = retention_seconds
+        self.origin = f"{os.getpid()}-{id(self)}"
+        self._local = threading.local()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._last_change_id = 0
+
+        # 통계
+        self.applied_remote = 0
+        self.delivered = 0
+
+        self._connection(write=False).conn.executescript(SCHEMA)
+
+    def _connection(self, write=True):
+        """스레드별 SQLite 연결 트랜잭션 (WAL 모드로 읽기와 쓰기가 서로 막지 않음)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return _Transaction(conn, write)
+
+    @property
+    def last_change_id(self):
+        """마지막으로 읽은 변경 로그 ID"""
+        return self._last_change_id
+
+    def load_status(self):
+        """저장된 전체 상태 조회"""
+        with self._connection(write=False) as conn:
+            rows = conn.execute('SELECT news_id, record FROM news_status').fetchall()
+            last = conn.execute('SELECT COALESCE(MAX(id), 0) FROM changes').fetchone()[0]
+        # 이미 반영된 상태이므로 로드 시점 이후의 변경만 따라 읽음
+        self._last_change_id = last
+        return {news_id: json.loads(record) for news_id, record in rows}
+
+    def import_status(self, status):
+        """JSON 상태 파일 내용을 가져옴 (이미 있는 뉴스 ID는 유지)"""
+        with self._connection() as conn:
+            conn.executemany(
+                'INSERT OR IGNORE INTO news_status (news_id, record) VALUES (?, ?)',
+                [(news_id, json.dumps(record, ensure_ascii=False)) for news_id, record in status.items()]
+            )
+
+    def insert_missing(self, records):
+        """
+        새로 본 뉴스의 기본 상태를 추가하고 다른 워커에도 알립니다.
+
+        Args:
+            records (dict): {news_id: 상태 레코드}
+        """
+        if not records:
+            return
+        now = time.time()
+        with self._connection() as conn:
+            for news_id, record in records.items():
+                encoded = json.dumps(record, ensure_ascii=False)
+                cursor = conn.execute(
+                    'INSERT OR IGNORE INTO news_status (news_id, record) VALUES (?, ?)',
+                    (news_id, encoded)
+                )
+                if cursor.rowcount:
+                    conn.execute(
+                        'INSERT INTO changes (origin, news_id, record, created_at) VALUES (?, ?, ?, ?)',
+                        (self.origin, news_id, encoded, now)
+                    )
+
+    def publish(self, event_type, data, news_id=None, fields=None, default=None):
+        """
+        상태 변경과 이벤트를 한 트랜잭션으로 기록합니다.
+        바뀐 필드만 저장된 레코드에 합치므로(쓰기 잠금 안에서 읽고 씀), 다른 워커가 같은 뉴스의
+        다른 필드를 그 사이에 바꿨어도 덮어쓰지 않습니다.
+        이벤트는 이 워커를 포함한 모든 워커가 변경 로그에서 읽어 SSE로 전달합니다.
+
+        Args:
+            event_type (str): 이벤트 종류
+            data (dict): 이벤트 데이터
+            news_id (str): 상태가 바뀐 뉴스 ID
+            fields (dict): 바뀐 상태 필드
+            default (dict): 저장된 레코드가 없을 때 시작 레코드
+
+        Returns:
+            dict: 합쳐진 상태 레코드 (상태 변경이 없으면 None)
+        """
+        record = None
+        encoded = None
+        with self._connection() as conn:
+            if news_id and fields:
+                row = conn.execute('SELECT record FROM news_status WHERE news_id = ?', (news_id,)).fetchone()
+                record = json.loads(row[0]) if row else dict(default or {})
+                record.update(fields)
+                encoded = json.dumps(record, ensure_ascii=False)
+                conn.execute(
+                    'INSERT OR REPLACE INTO news_status (news_id, record) VALUES (?, ?)',
+                    (news_id, encoded)
+                )
+            conn.execute(
+                'INSERT INTO changes (origin, news_id, record, event_type, event_data, created_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (self.origin, news_id, encoded, event_type, json.dumps(data, ensure_ascii=False), time.time())
+            )
+        # 같은 워커의 SSE 연결은 다음 주기를 기다리지 않도록 즉시 확인
+        self._wakeup.set()
+        return record
+
+    def poll(self, apply_record, deliver_event):
+        """
+        마지막으로 읽은 이후의 변경을 반영합니다.
+
+        상태 레코드는 이 워커가 쓴 것도 변경 로그 순서대로 반영하여, 그 사이 다른 워커 변경을 합친
+        최신 레코드가 더 오래된 다른 워커 레코드에 덮이지 않게 합니다.
+
+        Args:
+            apply_record (callable): (news_id, record) - 저장된 상태 레코드 반영
+            deliver_event (callable): (event_id, event_type, data, timestamp) - SSE 브로커로 전달
+
+        Returns:
+            int: 처리한 변경 수
+        """
+        with self._connection(write=False) as conn:
+            rows = conn.execute(
+                'SELECT id, origin, news_id, record, event_type, event_data, created_at '
+                'FROM changes WHERE id > ? ORDER BY id',
+                (self._last_change_id,)
+            ).fetchall()
+
+        for change_id, origin, news_id, record, event_type, event_data, created_at in rows:
+            if news_id and record is not None:
+                apply_record(news_id, json.loads(record))
+                if origin != self.origin:
+                    self.applied_remote += 1
+            if event_type:
+                deliver_event(change_id, event_type, json.loads(event_data),
+                              time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(created_at)))
+                self.delivered += 1
+            self._last_change_id = change_id
+        return len(rows)
+
+    def claim_pregen(self, day, news_id, daily_budget):
+        """
+        콘텐츠 사전 생성 대상을 선점합니다 (모든 워커가 하루 예산과 생성 대상을 함께 씀).
+        선점은 쓰기 잠금 안에서 확인하고 기록하므로 같은 기사를 두 워커가 생성하지 않습니다.
+
+        Args:
+            day (str): 예산 날짜 (YYYY-MM-DD)
+            news_id (str): 생성할 뉴스 ID
+            daily_budget (int): 하루 최대 사전 생성 수 (모든 워커 합계)
+
+        Returns:
+            str: 'claimed' (선점함) | 'duplicate' (이미 다른 선점 있음) | 'exhausted' (예산 소진)
+        """
+        with self._connection() as conn:
+            if conn.execute('SELECT 1 FROM pregen_claims WHERE day = ? AND news_id = ?',
+                            (day, news_id)).fetchone():
+                return 'duplicate'
+            used = conn.execute('SELECT COUNT(*) FROM pregen_claims WHERE day = ?', (day,)).fetchone()[0]
+            if used >= daily_budget:
+                return 'exhausted'
+            conn.execute('INSERT INTO pregen_claims (day, news_id, origin, created_at) VALUES (?, ?, ?, ?)',
+                         (day, news_id, self.origin, time.time()))
+        return 'claimed'
+
+    def release_pregen(self, day, news_id):
+        """선점 취소 (생성을 미룬 경우 - 예산을 돌려주고 다른 워커도 다시 선점 가능)"""
+        with self._connection() as conn:
+            conn.execute('DELETE FROM pregen_claims WHERE day = ? AND news_id = ?', (day, news_id))
+
+    def prune(self):
+        """보관 시간이 지난 변경 로그와 지난 날짜의 사전 생성 선점 삭제"""
+        now = time.time()
+        with self._connection() as conn:
+            conn.execute('DELETE FROM changes WHERE created_at < ?', (now - self.retention_seconds,))
+            conn.execute('DELETE FROM pregen_claims WHERE created_at < ?', (now - 2 * 86400,))
+
+    def _run(self, apply_record, deliver_event):
+        """변경 로그 추적 루프"""
+        last_prune = time.monotonic()
+        while not self._stop.is_set():
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+            try:
+                self.poll(apply_record, deliver_event)
+                if time.monotonic() - last_prune > 60:
+                    self.prune()
+                    last_prune = time.monotonic()
+            except sqlite3.Error as e:
+                logger.error("공유 상태 변경 로그 읽기 오류: %s", e)
+                time.sleep(self.poll_interval)
+
+    def start(self, apply_record, deliver_event):
+        """변경 로그 추적 스레드 시작"""
+        self._thread = threading.Thread(
+            target=self._run, args=(apply_record, deliver_event),
+            name='shared-state-poller', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout=5.0):
+        """변경 로그 추적 스레드 종료"""
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def get_stats(self):
+        """공유 상태 버스 통계"""
+        return {
+            'db_path': self.db_path,
+            'origin': self.origin,
+            'last_change_id': self._last_change_id,
+            'poll_interval': self.poll_interval,
+            'applied_remote': self.applied_remote,
+            'delivered': self.delivered
+        }
+
+
+class _Transaction:
+    """BEGIN ~ COMMIT/ROLLBACK 컨텍스트 (쓰기는 IMMEDIATE로 시작하여 잠금 경합 시 대기)"""
+
+    def __init__(self, conn, write=True):
+        self.conn = conn
+        self.write = write
+
+    def __enter__(self):
+        self.conn.execute('BEGIN IMMEDIATE' if self.write else 'BEGIN')
+        return self.conn
+
+    def __exit__(self, exc_type, exc, tb):
+        self.conn.execute('ROLLBACK' if exc_type else 'COMMIT')
+        return False
@@ -0,0 +1,278 @@
+"""
+뉴스 상태 보관(아카이브) 모듈입니다.
+발행일이 보관 기간보다 오래된 뉴스의 상태를 메모리(핫)에서 날짜별 스냅샷 파일(콜드)로 옮기고,
+오래된 날짜를 다시 조회하면 해당 날짜 파일을 메모리로 불러옵니다.
+"""
+
+import os
+import re
+import sys
+import time
+import logging
+import threading
+from datetime import datetime, timedelta
+
+from utils.status_snapshot import HEADER, SnapshotError, read_snapshot, write_snapshot
+
+logger = logging.getLogger(__name__)
+
+# 빅카인즈 뉴스 ID: 언론사 코드.발행 일시(YYYYMMDDhhmmss...)
+NEWS_ID_DATE = re.compile(r'\.(\d{4})(\d{2})(\d{2})')
+
+PARTITION_SUFFIX = '.snapshot'
+
+
+def published_date_of(news_id, record=None):
+    """
+    뉴스의 발행일(YYYY-MM-DD)을 구합니다.
+    레코드에 published_at이 있으면 그 값을, 없으면 뉴스 ID에 들어 있는 발행 일시를 사용합니다.
+
+    Returns:
+        str: 발행일 (알 수 없으면 None)
+    """
+    published_at = record.get('published_at') if record else None
+    if isinstance(published_at, str) and len(published_at) >= 10:
+        return published_at[:10]
+    match = NEWS_ID_DATE.search(news_id or '')
+    if not match:
+        return None
+    return f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
+
+
+class StatusArchive:
+    """날짜별 파티션 파일로 오래된 뉴스 상태를 보관하는 콜드 저장소"""
+
+    def __init__(self, base_dir, hot_days=14, idle_seconds=3600):
+        """
+        Args:
+            base_dir (str): 날짜별 파티션 파일을 둘 디렉토리
+            hot_days (int): 메모리에 유지할 발행일 기준 기간(일)
+            idle_seconds (float): 다시 불러온 날짜를 마지막 조회 후 이 시간 동안은 보관하지 않음
+        """
+        self.base_dir = base_dir
+        self.hot_days = hot_days
+        self.idle_seconds = idle_seconds
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        # 메모리로 불러온 날짜 -> 마지막 조회 시각
+        self._resident = {}
+        # 파티션별 보관 항목 수 (파일 헤더만 읽어 계산)
+        self._partitions = self._scan_partitions()
+
+        # 통계
+        self.archived = 0
+        self.faults = 0
+        self.faulted_entries = 0
+        self.runs = 0
+        self.last_run_seconds = None
+
+    def _scan_partitions(self):
+        """기존 파티션 파일의 항목 수 조회"""
+        partitions = {}
+        # 디렉토리는 첫 보관 때 생성 (앱 import 시 작업 디렉토리에 만들지 않도록)
+        if not os.path.isdir(self.base_dir):
+            return partitions
+        for filename in os.listdir(self.base_dir):
+            if not filename.endswith(PARTITION_SUFFIX):
+                continue
+            try:
+                with open(os.path.join(self.base_dir, filename), 'rb') as f:
+                    header = f.read(HEADER.size)
+                partitions[filename[:-len(PARTITION_SUFFIX)]] = HEADER.unpack(header)[3]
+            except (OSError, ValueError) as e:
+                logger.warning("상태 보관 파일을 읽을 수 없습니다: %s (%s)", filename, e)
+        return partitions
+
+    def _path(self, date):
+        """날짜 파티션 파일 경로"""
+        return os.path.join(self.base_dir, f"{date}{PARTITION_SUFFIX}")
+
+    def _read(self, date):
+        """날짜 파티션 내용 (없거나 손상되었으면 빈 dict)"""
+        try:
+            return read_snapshot(self._path(date)) or {}
+        except SnapshotError as e:
+            logger.error("상태 보관 파일 손상: %s (%s)", date, e)
+            return {}
+
+    def cutoff_date(self, today=None):
+        """이 날짜보다 이전에 발행된 뉴스는 보관 대상"""
+        today = today or datetime.now()
+        return (today - timedelta(days=self.hot_days)).strftime('%Y-%m-%d')
+
+    def is_cold(self, date, today=None):
+        """보관 대상 날짜인지 여부"""
+        return bool(date) and date < self.cutoff_date(today)
+
+    def fault_in(self, status, dates, today=None):
+        """
+        보관된 날짜의 상태를 메모리로 불러옵니다 (이미 메모리에 있는 레코드가 우선).
+
+        Args:
+            status (dict): 메모리 상태 맵
+            dates (iterable): 조회하려는 발행일 목록 (YYYY-MM-DD)
+
+        Returns:
+            int: 불러온 레코드 수
+        """
+        loaded = 0
+        now = time.monotonic()
+        for date in set(dates):
+            if not self.is_cold(date, today):
+                continue
+            with self._lock:
+                if date in self._resident:
+                    self._resident[date] = now
+                    continue
+                if date not in self._partitions:
+                    continue
+                count = 0
+                for news_id, record in self._read(date).items():
+                    if status.setdefault(news_id, record) is record:
+                        count += 1
+                self._resident[date] = now
+                self.faults += 1
+                self.faulted_entries += count
+                loaded += count
+        return loaded
+
+    def fault_in_news(self, status, news_id):
+        """뉴스 ID 하나에 대해 메모리에 없으면 해당 발행일 파티션을 불러옴"""
+        if news_id in status:
+            return 0
+        date = published_date_of(news_id)
+        return self.fault_in(status, [date]) if date else 0
+
+    def archive(self, status, today=None):
+        """
+        보관 기간이 지난 뉴스 상태를 날짜별 파티션 파일로 옮기고 메모리에서 제거합니다.
+        최근에 다시 불러와 조회 중인 날짜는 건너뜁니다.
+
+        Returns:
+            int: 메모리에서 제거한 레코드 수
+        """
+        started = time.monotonic()
+        cutoff = self.cutoff_date(today)
+        by_date = {}
+        # 요청 스레드가 계속 수정하므로 항목 목록을 복사해서 순회
+        for news_id, record in list(status.items()):
+            date = published_date_of(news_id, record)
+            if date and date < cutoff:
+                by_date.setdefault(date, {})[news_id] = record
+
+        moved = 0
+        now = time.monotonic()
+        with self._lock:
+            for date, records in by_date.items():
+                last_access = self._resident.get(date)
+                if last_access is not None and now - last_access < self.idle_seconds:
+                    continue
+                partition = self._read(date) if date in self._partitions else {}
+                partition.update(records)
+                os.makedirs(self.base_dir, exist_ok=True)
+                write_snapshot(self._path(date), partition)
+                self._partitions[date] = len(partition)
+                remove_if = getattr(status, 'remove_if', None)
+                for news_id, record in records.items():
+                    # 그 사이 새 레코드로 바뀌었으면 남겨 둠 (다음 주기에 보관)
+                    if remove_if is not None:
+                        moved += remove_if(news_id, record)
+                    elif status.get(news_id) is record:
+                        del status[news_id]
+                        moved += 1
+                self._resident.pop(date, None)
+            self.archived += moved
+            self.runs += 1
+            self.last_run_seconds = round(time.monotonic() - started, 4)
+        if moved:
+            logger.info("상태 보관: %d개 레코드를 %d개 날짜 파일로 이동", moved, len(by_date))
+        return moved
+
+    def export(self, status):
+        """보관된 상태와 메모리 상태를 합친 전체 상태 (메모리 레코드가 우선)"""
+        with self._lock:
+            dates = sorted(self._partitions)
+        merged = {}
+        for date in dates:
+            merged.update(self._read(date))
+        merged.update(status)
+        return merged
+
+    def _run(self, get_status, on_archived, interval):
+        """주기적 보관 루프"""
+        while not self._stop.wait(interval):
+            try:
+                if self.archive(get_status()):
+                    on_archived()
+            except OSError as e:
+                logger.error("상태 보관 실패: %s", e)
+
+    def start(self, get_status, on_archived, interval=3600.0):
+        """
+        주기적 보관 스레드 시작
+
+        Args:
+            get_status (callable): 메모리 상태 맵을 반환하는 함수
+            on_archived (callable): 레코드를 옮긴 뒤 호출 (상태 스냅샷 저장 표시 등)
+            interval (float): 보관 주기(초)
+        """
+        self._thread = threading.Thread(
+            target=self._run, args=(get_status, on_archived, interval),
+            name='status-archive', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """주기적 보관 스레드 종료"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(5)
+
+    def get_stats(self, status=None):
+        """
+        핫(메모리)/콜드(파일) 분포 통계
+
+        Args:
+            status (dict): 메모리 상태 맵 (주면 핫 레코드 수와 대략적인 메모리 사용량 포함)
+        """
+        with self._lock:
+            stats = {
+                'hot_days': self.hot_days,
+                'cutoff_date': self.cutoff_date(),
+                'cold': {
+                    'partitions': len(self._partitions),
+                    'entries': sum(self._partitions.values()),
+                    'disk_bytes': sum(
+                        os.path.getsize(self._path(date)) for date in self._partitions
+                        if os.path.exists(self._path(date))
+                    )
+                },
+                'resident_partitions': sorted(self._resident),
+                'archived': self.archived,
+                'faults': self.faults,
+                'faulted_entries': self.faulted_entries,
+                'runs': self.runs,
+                'last_run_seconds': self.last_run_seconds
+            }
+        if status is not None:
+            stats['hot'] = {
+                'entries': len(status),
+                'approx_bytes': estimate_status_bytes(status)
+            }
+        return stats
+
+
+def estimate_status_bytes(status, sample_size=1000):
+    """상태 맵의 대략적인 메모리 사용량 (표본 레코드 크기로 추정)"""
+    if not status:
+        return sys.getsizeof(status)
+    items = list(status.items())
+    step = max(1, len(items) // sample_size)
+    sample = items[::step]
+    per_entry = sum(
+        sys.getsizeof(news_id) + sys.getsizeof(record)
+        + sum(sys.getsizeof(value) for value in record.values())
+        for news_id, record in sample
+    ) / len(sample)
+    return int(sys.getsizeof(status) + per_entry * len(items))
@@ -0,0 +1,311 @@
+"""
+뉴스 상태 바이너리 스냅샷 모듈입니다.
+상태 맵을 버전 헤더가 붙은 길이 접두 바이너리(열 단위 구역)로 저장하여,
+들여쓰기된 JSON을 통째로 파싱하는 것보다 빠르게 읽고 작게 저장합니다.
+JSON 상태 파일은 가져오기/내보내기 용도로만 사용합니다.
+
+파일 구조:
+    헤더: MAGIC(4) | 버전(u16) | 예약(u16) | 항목 수(u32) | 구역 수(u32)
+    구역: 길이(u32) | 내용 - 순서대로 아래 구역이 이어짐
+        ids        뉴스 ID들을 \\x00으로 이은 UTF-8
+        statuses   항목별 상태 코드 1바이트 (STATUS_CODES 인덱스, 255는 custom 구역 참조)
+        custom     코드 표에 없는 상태 문자열들 (\\x00 구분, 등장 순서)
+        flags      항목별 플래그 1바이트 (FLAG_*)
+        generated  ai_generated_at 값들 (플래그가 있는 항목만, \\x00 구분)
+        updated    updated_at 값들 (플래그가 있는 항목만, \\x00 구분)
+        extras     그 외 필드 {news_id: {...}} JSON (없으면 빈 구역)
+"""
+
+import os
+import json
+import time
+import struct
+import logging
+import threading
+
+from utils.metrics import status_save_duration
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'NSTS'
+VERSION = 1
+HEADER = struct.Struct('<4sHHII')
+SECTION_LENGTH = struct.Struct('<I')
+SECTION_COUNT = 7
+
+# 자주 쓰는 상태는 1바이트 코드로 저장
+STATUS_CODES = ['미진행', '작업중', '작업완료']
+CUSTOM_STATUS = 255
+
+FLAG_HAS_CONTENT = 1
+FLAG_GENERATED_AT = 2
+FLAG_UPDATED_AT = 4
+FLAG_EXTRAS = 8
+FLAG_NO_STATUS = 16
+FLAG_NO_HAS_CONTENT = 32
+
+KNOWN_FIELDS = ('status', 'has_content', 'ai_generated_at', 'updated_at')
+TIMESTAMP_FIELDS = ('ai_generated_at', 'updated_at')
+
+SEPARATOR = '\x00'
+
+
+class SnapshotError(ValueError):
+    """스냅샷 파일 형식 오류 (손상되었거나 지원하지 않는 버전)"""
+
+
+def _join(values):
+    """문자열 목록을 구분자로 이은 UTF-8 바이트 (목록이 비면 빈 바이트)"""
+    return SEPARATOR.join(values).encode('utf-8')
+
+
+def _split(buffer, count):
+    """구분자로 이은 UTF-8 구역을 문자열 목록으로 (개수 검증 포함)"""
+    if count == 0:
+        return []
+    values = str(buffer, 'utf-8').split(SEPARATOR)
+    if len(values) != count:
+        raise SnapshotError(f"구역 항목 수 불일치: {len(values)} != {count}")
+    return values
+
+
+def encode_snapshot(status):
+    """
+    상태 맵을 스냅샷 바이트로 변환합니다.
+
+    Args:
+        status (dict): {news_id: 상태 레코드}
+
+    Returns:
+        bytes: 스냅샷 내용
+    """
+    code_of = {name: code for code, name in enumerate(STATUS_CODES)}
+    ids = []
+    codes = bytearray()
+    custom = []
+    flags = bytearray()
+    generated = []
+    updated = []
+    extras = {}
+
+    for news_id, record in status.items():
+        ids.append(news_id)
+        if 'has_content' not in record:
+            flag = FLAG_NO_HAS_CONTENT
+        else:
+            flag = FLAG_HAS_CONTENT if record['has_content'] else 0
+
+        name = record.get('status')
+        code = code_of.get(name)
+        if code is None:
+            code = CUSTOM_STATUS
+            if name is None:
+                flag |= FLAG_NO_STATUS
+            else:
+                custom.append(name)
+        codes.append(code)
+
+        generated_at = record.get('ai_generated_at')
+        if isinstance(generated_at, str):
+            flag |= FLAG_GENERATED_AT
+            generated.append(generated_at)
+        updated_at = record.get('updated_at')
+        if isinstance(updated_at, str):
+            flag |= FLAG_UPDATED_AT
+            updated.append(updated_at)
+        # 알 수 없는 필드와 문자열이 아닌 시각 값(None 등)은 JSON 구역에 그대로 보관
+        if (len(record) > 4 or any(key not in KNOWN_FIELDS for key in record)
+                or ('ai_generated_at' in record and not flag & FLAG_GENERATED_AT)
+                or ('updated_at' in record and not flag & FLAG_UPDATED_AT)):
+            extras[news_id] = {
+                key: value for key, value in record.items()
+                if key not in KNOWN_FIELDS or (key in TIMESTAMP_FIELDS and not isinstance(value, str))
+            }
+            flag |= FLAG_EXTRAS
+        flags.append(flag)
+
+    sections = [
+        _join(ids),
+        bytes(codes),
+        _join(custom),
+        bytes(flags),
+        _join(generated),
+        _join(updated),
+        json.dumps(extras, ensure_ascii=False).encode('utf-8') if extras else b''
+    ]
+    parts = [HEADER.pack(MAGIC, VERSION, 0, len(ids), len(sections))]
+    for section in sections:
+        parts.append(SECTION_LENGTH.pack(len(section)))
+        parts.append(section)
+    return b''.join(parts)
+
+
+def decode_snapshot(buffer):
+    """
+    스냅샷 바이트를 상태 맵으로 변환합니다.
+
+    Args:
+        buffer (bytes | memoryview): 스냅샷 내용
+
+    Returns:
+        dict: {news_id: 상태 레코드}
+    """
+    view = memoryview(buffer)
+    if len(view) < HEADER.size:
+        raise SnapshotError("헤더가 잘렸습니다.")
+    magic, version, _, count, section_count = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise SnapshotError("스냅샷 파일이 아닙니다.")
+    if version != VERSION or section_count != SECTION_COUNT:
+        raise SnapshotError(f"지원하지 않는 스냅샷 버전: {version}")
+
+    sections = []
+    offset = HEADER.size
+    for _ in range(section_count):
+        if offset + SECTION_LENGTH.size > len(view):
+            raise SnapshotError("구역 길이가 잘렸습니다.")
+        length, = SECTION_LENGTH.unpack_from(view, offset)
+        offset += SECTION_LENGTH.size
+        if offset + length > len(view):
+            raise SnapshotError("구역 내용이 잘렸습니다.")
+        sections.append(view[offset:offset + length])
+        offset += length
+    ids_section, codes, custom_section, flags, generated_section, updated_section, extras_section = sections
+
+    if len(codes) != count or len(flags) != count:
+        raise SnapshotError("상태/플래그 구역 길이 불일치")
+    codes = bytes(codes)
+    flags = bytes(flags)
+    ids = _split(ids_section, count)
+    custom = iter(_split(custom_section, sum(
+        1 for code, flag in zip(codes, flags) if code == CUSTOM_STATUS and not flag & FLAG_NO_STATUS)))
+    generated = iter(_split(generated_section, sum(1 for flag in flags if flag & FLAG_GENERATED_AT)))
+    updated = iter(_split(updated_section, sum(1 for flag in flags if flag & FLAG_UPDATED_AT)))
+    extras = json.loads(str(extras_section, 'utf-8')) if len(extras_section) else {}
+
+    names = STATUS_CODES
+    status = {}
+    for news_id, code, flag in zip(ids, codes, flags):
+        if code != CUSTOM_STATUS:
+            record = {'status': names[code]}
+        elif flag & FLAG_NO_STATUS:
+            record = {}
+        else:
+            record = {'status': next(custom)}
+        if not flag & FLAG_NO_HAS_CONTENT:
+            record['has_content'] = bool(flag & FLAG_HAS_CONTENT)
+        if flag & FLAG_GENERATED_AT:
+            record['ai_generated_at'] = next(generated)
+        if flag & FLAG_UPDATED_AT:
+            record['updated_at'] = next(updated)
+        if flag & FLAG_EXTRAS:
+            record.update(extras.get(news_id, {}))
+        status[news_id] = record
+    return status
+
+
+def write_snapshot(path, status):
+    """
+    스냅샷을 원자적으로 저장합니다 (임시 파일에 쓴 뒤 교체).
+
+    Returns:
+        int: 저장한 바이트 수
+    """
+    data = encode_snapshot(status)
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return len(data)
+
+
+def read_snapshot(path):
+    """스냅샷 파일을 읽어 상태 맵으로 변환 (파일이 없으면 None)"""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+    return decode_snapshot(data)
+
+
+class SnapshotWriter:
+    """변경이 있을 때 주기적으로, 그리고 종료 시 스냅샷을 저장하는 백그라운드 작업"""
+
+    def __init__(self, path, get_status, interval=5.0):
+        """
+        Args:
+            path (str): 스냅샷 파일 경로
+            get_status (callable): 저장할 상태 맵을 반환하는 함수
+            interval (float): 변경 확인/저장 주기(초)
+        """
+        self.path = path
+        self.get_status = get_status
+        self.interval = interval
+        self._dirty = threading.Event()
+        self._stop = threading.Event()
+        self._write_lock = threading.Lock()
+        self._thread = None
+
+        # 통계
+        self.writes = 0
+        self.last_write_seconds = None
+        self.last_write_bytes = None
+        self.last_written_at = None
+
+    def mark_dirty(self):
+        """상태가 바뀌었음을 표시 (다음 주기에 저장)"""
+        self._dirty.set()
+
+    def flush(self):
+        """변경이 있으면 즉시 저장"""
+        if not self._dirty.is_set():
+            return False
+        with self._write_lock:
+            self._dirty.clear()
+            started = time.monotonic()
+            # 요청 스레드가 계속 수정하므로 얕은 복사본으로 저장
+            status = dict(self.get_status())
+            try:
+                self.last_write_bytes = write_snapshot(self.path, status)
+            except OSError as e:
+                self._dirty.set()
+                logger.error("상태 스냅샷 저장 실패: %s", e)
+                return False
+            elapsed = time.monotonic() - started
+            status_save_duration.observe(elapsed)
+            self.last_write_seconds = round(elapsed, 4)
+            self.last_written_at = time.time()
+            self.writes += 1
+        return True
+
+    def _run(self):
+        """주기적 저장 루프"""
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def start(self):
+        """주기적 저장 스레드 시작"""
+        self._thread = threading.Thread(target=self._run, name='status-snapshot', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """주기적 저장을 멈추고 남은 변경을 저장"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(self.interval + 1)
+        self.flush()
+
+    def get_stats(self):
+        """스냅샷 저장 통계"""
+        return {
+            'path': self.path,
+            'interval': self.interval,
+            'dirty': self._dirty.is_set(),
+            'writes': self.writes,
+            'last_write_seconds': self.last_write_seconds,
+            'last_write_bytes': self.last_write_bytes,
+            'last_written_at': self.last_written_at
+        }
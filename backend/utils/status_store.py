@@ -0,0 +1,158 @@
+"""
+뉴스 상태 저장소 모듈입니다.
+여러 요청 스레드가 동시에 상태를 읽고 바꿀 수 있도록,
+- 뉴스 ID 해시로 나눈 여러 조각(shard)마다 잠금을 두어 쓰기끼리만 같은 조각에서 순서대로 처리하고 (lock striping)
+- 레코드는 제자리에서 고치지 않고 바뀐 새 dict로 교체하여(copy-on-write) 읽는 쪽은 잠금 없이 항상 완전한 레코드를 봅니다.
+요약/저장처럼 전체를 훑는 작업은 snapshot()으로 한 시점의 복사본을 만들어 사용합니다.
+"""
+
+import threading
+from collections.abc import MutableMapping
+
+
+class StatusStore(MutableMapping):
+    """조각별 잠금과 레코드 교체 방식의 스레드 안전 상태 맵 (dict처럼 사용 가능)"""
+
+    def __init__(self, initial=None, shards=16):
+        """
+        Args:
+            initial (dict): 초기 상태 {news_id: 레코드}
+            shards (int): 조각 수 (동시에 쓰는 스레드 수보다 넉넉하게)
+        """
+        self._shards = [{} for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        if initial:
+            self.replace_all(initial)
+
+    def _index(self, news_id):
+        return hash(news_id) % len(self._shards)
+
+    # 읽기 - 잠금 없음 (dict 단일 조회는 원자적이고, 레코드는 교체만 되므로 항상 완전한 상태)
+
+    def __getitem__(self, news_id):
+        return self._shards[self._index(news_id)][news_id]
+
+    def get(self, news_id, default=None):
+        return self._shards[self._index(news_id)].get(news_id, default)
+
+    def __contains__(self, news_id):
+        return news_id in self._shards[self._index(news_id)]
+
+    def __len__(self):
+        return sum(len(shard) for shard in self._shards)
+
+    def __iter__(self):
+        # 순회 중 다른 스레드가 추가/삭제해도 오류가 나지 않도록 키 목록 복사본으로 순회
+        for index, shard in enumerate(self._shards):
+            with self._locks[index]:
+                keys = list(shard)
+            yield from keys
+
+    # 쓰기 - 해당 조각 잠금
+
+    def __setitem__(self, news_id, record):
+        index = self._index(news_id)
+        with self._locks[index]:
+            self._shards[index][news_id] = record
+
+    def __delitem__(self, news_id):
+        index = self._index(news_id)
+        with self._locks[index]:
+            del self._shards[index][news_id]
+
+    def setdefault(self, news_id, record=None):
+        """없을 때만 추가하고, 저장소에 있는 레코드 반환 (원자적)"""
+        index = self._index(news_id)
+        shard = self._shards[index]
+        existing = shard.get(news_id)
+        if existing is not None:
+            return existing
+        with self._locks[index]:
+            return shard.setdefault(news_id, record)
+
+    def update_record(self, news_id, default=None, **fields):
+        """
+        레코드의 일부 필드를 바꾼 새 레코드로 교체합니다 (원자적).
+
+        Args:
+            default (dict): 레코드가 없을 때 시작 값
+            **fields: 바꿀 필드
+
+        Returns:
+            dict: 교체된 새 레코드
+        """
+        index = self._index(news_id)
+        with self._locks[index]:
+            shard = self._shards[index]
+            record = dict(shard.get(news_id) or default or {})
+            record.update(fields)
+            shard[news_id] = record
+            return record
+
+    def remove_if(self, news_id, record):
+        """저장된 레코드가 주어진 레코드(같은 객체)일 때만 삭제 - 그 사이 바뀌었으면 남겨 둠"""
+        index = self._index(news_id)
+        with self._locks[index]:
+            shard = self._shards[index]
+            if shard.get(news_id) is record:
+                del shard[news_id]
+                return True
+            return False
+
+    def replace_all(self, status):
+        """전체 내용을 교체 (로드 시)"""
+        shards = [{} for _ in self._shards]
+        for news_id, record in status.items():
+            shards[self._index(news_id)][news_id] = record
+        self._acquire_all()
+        try:
+            for index, shard in enumerate(shards):
+                self._shards[index] = shard
+        finally:
+            self._release_all()
+
+    # 전체 조회 - 한 시점의 일관된 복사본
+
+    def _acquire_all(self):
+        # 항상 같은 순서로 잡아 교착을 피함
+        for lock in self._locks:
+            lock.acquire()
+
+    def _release_all(self):
+        for lock in reversed(self._locks):
+            lock.release()
+
+    def snapshot(self):
+        """
+        모든 조각의 쓰기를 잠시 멈춘 한 시점의 얕은 복사본 (요약/저장/내보내기용)
+        레코드는 교체만 되므로 얕은 복사로도 이후 변경의 영향을 받지 않습니다.
+        """
+        self._acquire_all()
+        try:
+            merged = {}
+            for shard in self._shards:
+                merged.update(shard)
+            return merged
+        finally:
+            self._release_all()
+
+    def items(self):
+        """한 시점 복사본의 (뉴스 ID, 레코드) 목록"""
+        return self.snapshot().items()
+
+    def values(self):
+        """한 시점 복사본의 레코드 목록"""
+        return self.snapshot().values()
+
+    def count_by(self, field, default=None):
+        """
+        필드 값별 레코드 수 (쓰기를 멈추지 않음)
+        조각별 값 목록 복사는 GIL을 쥔 채 C 수준에서 한 번에 끝나므로 순회 중 변경 오류가 없고,
+        각 조각 안에서는 한 시점의 값으로 집계됩니다.
+        """
+        counts = {}
+        for shard in self._shards:
+            for record in list(shard.values()):
+                value = record.get(field, default)
+                counts[value] = counts.get(value, 0) + 1
+        return counts
@@ -0,0 +1,211 @@
+"""
+뉴스 캐시 예열 스케줄러 모듈입니다.
+하루의 첫 사용자나 캐시 만료 직후의 사용자가 빅카인즈 전체 조회를 기다리지 않도록,
+백그라운드에서
+- 오늘 날짜 결과를 만료 전에 주기적으로 다시 받아 두고
+- 시작 시 최근 N일 결과를 미리 받아 두며 (지난 날짜도 만료 전에 다시 받음)
+- 지정한 한가한 시간대에는 쉬고
+- 분당 호출 수 제한과 오류 시 점진적 대기(429의 Retry-After 우선)로 빅카인즈 한도를 지키며
+- 종료 시 대기 중이던 작업을 바로 멈춥니다.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+
+from utils.metrics import registry
+from utils.rate_limiter import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+warmup_refreshes = registry.counter(
+    'news_warmup_refreshes_total', '캐시 예열 조회 수', labels=('kind', 'outcome'))
+
+
+def parse_hours(value):
+    """
+    "0-6,23" 형식의 시간대 설정을 시(hour) 집합으로 변환합니다 (자정을 넘는 "22-5"도 가능).
+
+    Returns:
+        frozenset: 0~23 중 해당 시간
+    """
+    hours = set()
+    for item in (value or '').split(','):
+        item = item.strip()
+        if not item:
+            continue
+        start, sep, end = item.partition('-')
+        try:
+            start = int(start) % 24
+            end = int(end) % 24 if sep else start
+        except ValueError:
+            logger.warning("잘못된 시간대 설정 무시: %s", item)
+            continue
+        hour = start
+        while True:
+            hours.add(hour)
+            if hour == end:
+                break
+            hour = (hour + 1) % 24
+    return frozenset(hours)
+
+
+class WarmupScheduler:
+    """오늘/최근 날짜 뉴스 캐시를 미리 채워 두는 백그라운드 스케줄러"""
+
+    def __init__(self, refresh_fn, age_fn, limits=(1000,), today_interval=50.0, past_days=3,
+                 past_interval=3000.0, idle_hours=frozenset(), max_per_minute=6,
+                 max_backoff=600.0, tick=5.0, start_delay=5.0):
+        """
+        Args:
+            refresh_fn (callable): (날짜, limit) -> 빅카인즈에서 다시 받아 캐시에 저장
+            age_fn (callable): (날짜, limit) -> 캐시된 결과의 경과 시간(초), 없으면 None
+            limits (iterable): 예열할 조회 개수 (화면에서 쓰는 limit과 같아야 캐시 키가 일치)
+            today_interval (float): 오늘 결과를 다시 받는 주기(초) - 캐시 유효 시간보다 짧게
+            past_days (int): 함께 예열할 지난 날짜 수
+            past_interval (float): 지난 날짜 결과를 다시 받는 주기(초)
+            idle_hours (frozenset): 예열을 쉬는 시간(0~23시)
+            max_per_minute (int): 분당 최대 빅카인즈 호출 수
+            max_backoff (float): 연속 오류 시 최대 대기 시간(초)
+            tick (float): 예열 대상 확인 주기(초)
+            start_delay (float): 시작 후 첫 예열까지 대기(초) - 시작 직후 응답을 늦추지 않도록
+        """
+        self.refresh_fn = refresh_fn
+        self.age_fn = age_fn
+        self.limits = tuple(limits)
+        self.today_interval = today_interval
+        self.past_days = past_days
+        self.past_interval = past_interval
+        self.idle_hours = idle_hours
+        self.max_backoff = max_backoff
+        self.tick = tick
+        self.start_delay = start_delay
+        self._bucket = TokenBucket(max_per_minute)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._backoff_until = 0.0
+        self._failures = 0
+
+        # 통계
+        self.refreshed = 0
+        self.failed = 0
+        self.idle_skips = 0
+        self.last_refresh = None
+        self.last_error = None
+
+    def is_idle(self, now):
+        """쉬는 시간대인지"""
+        return now.hour in self.idle_hours
+
+    def due(self, now):
+        """
+        지금 다시 받아야 하는 (날짜, limit, 종류) 목록 (오늘 먼저, 이후 최근 날짜 순)
+        캐시에 없거나 주기보다 오래된 결과가 대상입니다.
+        """
+        targets = []
+        for offset in range(self.past_days + 1):
+            date = (now - timedelta(days=offset)).strftime('%Y-%m-%d')
+            kind = 'today' if offset == 0 else 'past'
+            interval = self.today_interval if offset == 0 else self.past_interval
+            for limit in self.limits:
+                age = self.age_fn(date, limit)
+                if age is None or age >= interval:
+                    targets.append((date, limit, kind))
+        return targets
+
+    def run_once(self, now=None):
+        """
+        예열 대상을 한 번 처리합니다 (한도/대기 중이거나 종료 요청 시 남은 대상은 다음 주기로).
+
+        Returns:
+            int: 다시 받은 결과 수
+        """
+        now = now or datetime.now()
+        if self.is_idle(now):
+            self.idle_skips += 1
+            return 0
+
+        refreshed = 0
+        for date, limit, kind in self.due(now):
+            if self._stop.is_set() or time.monotonic() < self._backoff_until:
+                break
+            # 분당 호출 한도 - 토큰이 없으면 이번 주기는 여기까지
+            if self._bucket.wait_time(1, time.monotonic()) > 0:
+                break
+            self._bucket.consume(1)
+
+            started = time.monotonic()
+            try:
+                self.refresh_fn(date, limit)
+            except Exception as e:
+                self._on_failure(e)
+                warmup_refreshes.inc(kind, 'error')
+                logger.warning("캐시 예열 실패 (%s, limit=%d): %s", date, limit, e)
+                break
+            with self._lock:
+                self._failures = 0
+                self.refreshed += 1
+                self.last_refresh = {'date': date, 'limit': limit, 'kind': kind,
+                                     'seconds': round(time.monotonic() - started, 3),
+                                     'at': datetime.now().isoformat(timespec='seconds')}
+            warmup_refreshes.inc(kind, 'ok')
+            refreshed += 1
+        return refreshed
+
+    def _on_failure(self, error):
+        """오류 시 대기 (Retry-After가 있으면 그만큼, 없으면 연속 실패마다 두 배)"""
+        with self._lock:
+            self._failures += 1
+            self.failed += 1
+            self.last_error = str(error)[:200]
+            retry_after = getattr(error, 'retry_after', None)
+            delay = retry_after if retry_after else min(self.tick * 2 ** self._failures, self.max_backoff)
+            self._backoff_until = time.monotonic() + delay
+
+    def _run(self):
+        """백그라운드 예열 루프"""
+        logger.info("뉴스 캐시 예열 시작 (오늘 %ds 주기, 최근 %d일, limit %s)",
+                    self.today_interval, self.past_days, list(self.limits))
+        if self._stop.wait(self.start_delay):
+            return
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("캐시 예열 루프 오류")
+            self._stop.wait(self.tick)
+        logger.info("뉴스 캐시 예열 종료")
+
+    def start(self):
+        """백그라운드 스레드 시작"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='news-warmup', daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=5.0):
+        """백그라운드 스레드 종료 (대기 중이면 바로 깨움)"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def get_stats(self):
+        """스케줄러 상태 및 통계"""
+        with self._lock:
+            return {
+                'running': bool(self._thread and self._thread.is_alive()),
+                'limits': list(self.limits),
+                'today_interval': self.today_interval,
+                'past_days': self.past_days,
+                'idle_hours': sorted(self.idle_hours),
+                'idle_now': self.is_idle(datetime.now()),
+                'refreshed': self.refreshed,
+                'failed': self.failed,
+                'idle_skips': self.idle_skips,
+                'backoff_for': round(max(0.0, self._backoff_until - time.monotonic()), 2),
+                'last_refresh': self.last_refresh,
+                'last_error': self.last_error
+            }
@@ -325,9 +325,9 @@ const TableRowMemo = React.memo(
               status={item.status}
               onClick={() => onInstagramGenerate(item)}
               isLoading={isLoading}
-              hasContent={item.ai_content ? true : false}
+              hasContent={item.has_content ? true : false}
             />
-            {item.ai_content && (
+            {item.has_content && (
               <CopyButton
                 onClick={() => onInstagramCopy(item)}
                 isLoading={isLoading}
@@ -504,7 +504,7 @@ const WorkStatusTable = ({
 
   const handleInstagramCopy = useCallback(
     async (article) => {
-      if (!article.ai_content) {
+      if (!article.has_content) {
         if (onCopySuccess) {
           onCopySuccess("생성된 콘텐츠가 없습니다.");
         }
@@ -517,7 +517,20 @@ const WorkStatusTable = ({
       }
 
       try {
-        await navigator.clipboard.writeText(article.ai_content);
+        // 생성된 콘텐츠는 목록에 포함되지 않으므로 복사 시점에 조회
+        const response = await fetch(
+          `/api/news/${encodeURIComponent(article.news_id)}/content`
+        );
+        const result = await response.json();
+
+        if (!result.success) {
+          if (onCopySuccess) {
+            onCopySuccess("생성된 콘텐츠가 없습니다.");
+          }
+          return;
+        }
+
+        await navigator.clipboard.writeText(result.data.content);
         if (onCopySuccess) {
           onCopySuccess("AI SEO 콘텐츠가 클립보드에 복사되었습니다!");
         }
@@ -0,0 +1,23 @@
+/**
+ * 열 형식(format=columnar) 기사 목록 디코더
+ * 필드별 배열과 사전 인코딩(언론사/카테고리/상태)을 행 형식 기사 객체 목록으로 되돌림
+ */
+
+export const decodeColumnar = (data) => {
+  const { count, fields, columns, dictionaries } = data;
+  const decoded = fields.map((field) => {
+    const values = columns[field];
+    const dictionary = dictionaries[field];
+    return dictionary ? values.map((code) => dictionary[code]) : values;
+  });
+
+  const rows = new Array(count);
+  for (let i = 0; i < count; i++) {
+    const row = {};
+    for (let f = 0; f < fields.length; f++) {
+      row[fields[f]] = decoded[f][i];
+    }
+    rows[i] = row;
+  }
+  return rows;
+};
@@ -6,6 +6,60 @@
 
 import { useState, useEffect, useMemo, useCallback, useRef } from "react";
 import axios from "axios";
+import { decodeColumnar } from "./columnar";
+
+// 스트리밍 중 화면 갱신 최소 간격(ms) - 기사 묶음마다 다시 그리지 않도록
+const STREAM_RENDER_INTERVAL = 150;
+
+// 만료된(stale)/일부(partial) 결과를 받았을 때 서버 갱신 후 다시 불러올 때까지 대기(ms)
+const REVALIDATE_DELAY = 3000;
+
+// 서버가 마감 시간 안에 준비하지 못한 경우(504) 오류
+class NewsPendingError extends Error {
+  constructor(message, retryAfter) {
+    super(message);
+    this.retryAfter = retryAfter;
+  }
+}
+
+/**
+ * /api/news?format=ndjson 응답을 줄 단위로 읽어 기사 묶음마다 onArticles 호출
+ * 첫 줄은 메타 정보, 마지막 줄은 완료 정보 (news_id가 없는 type 줄)
+ */
+const readNewsStream = async (response, onArticles) => {
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = "";
+  let meta = null;
+  let end = null;
+
+  for (;;) {
+    const { value, done } = await reader.read();
+    buffer += decoder.decode(value || new Uint8Array(0), { stream: !done });
+    const lines = buffer.split("\n");
+    buffer = done ? "" : lines.pop();
+
+    const articles = [];
+    for (const line of lines) {
+      if (!line) continue;
+      const item = JSON.parse(line);
+      if (item.news_id === undefined && item.type) {
+        if (item.type === "meta") meta = item;
+        else if (item.type === "end") end = item;
+        else if (item.type === "error") throw new Error(item.message);
+      } else {
+        articles.push(item);
+      }
+    }
+    if (articles.length > 0) onArticles(articles, meta);
+    if (done) break;
+  }
+
+  if (!end) {
+    throw new Error("뉴스 데이터를 끝까지 받지 못했습니다.");
+  }
+  return { meta, end };
+};
 
 export const useNewsData = (searchParams, currentFilter) => {
   const [newsData, setNewsData] = useState([]);
@@ -14,42 +68,137 @@ export const useNewsData = (searchParams, currentFilter) => {
   const [lastActivity, setLastActivity] = useState(Date.now());
   const intervalRef = useRef(null);
   const eventSourceRef = useRef(null);
+  const lastEventIdRef = useRef(null);
+  const searchParamsRef = useRef(searchParams);
+  const fetchControllerRef = useRef(null);
+  const revalidateTimerRef = useRef(null);
+  const fetchNewsRef = useRef(null);
+
+  // 뉴스 데이터 로딩 (스트리밍 - 받는 대로 표에 채움)
+  const fetchNewsStream = useCallback(async (params, signal) => {
+    const query = new URLSearchParams({ ...params, format: "ndjson" });
+    const response = await fetch(`/api/news?${query}`, { signal });
+    if (response.status === 504) {
+      const body = await response.json().catch(() => ({}));
+      throw new NewsPendingError(
+        body.message || "뉴스를 준비하는 중입니다.",
+        Number(response.headers.get("Retry-After")) || 5
+      );
+    }
+    if (!response.ok) {
+      throw new Error(`데이터 로딩 중 오류가 발생했습니다. (${response.status})`);
+    }
+
+    const received = [];
+    let lastRender = 0;
+    const { meta, end } = await readNewsStream(response, (articles) => {
+      for (const article of articles) received.push(article);
+      const now = Date.now();
+      if (lastRender === 0 || now - lastRender >= STREAM_RENDER_INTERVAL) {
+        lastRender = now;
+        setNewsData(received.slice());
+        setLoading(false);
+      }
+    });
+
+    if (!signal.aborted) {
+      setNewsData(received);
+    }
+    return { count: end.actual_count, freshness: meta && meta.freshness };
+  }, []);
+
+  // 뉴스 데이터 로딩 (한 번에 받기 - 백그라운드 새로고침/스트림을 읽을 수 없는 브라우저용)
+  // 필드 이름을 반복하지 않는 열 형식으로 받아 되돌림
+  const fetchNewsJson = useCallback(async (params, signal) => {
+    const response = await axios
+      .get("/api/news", { params: { ...params, format: "columnar" }, signal })
+      .catch((err) => {
+        if (err.response && err.response.status === 504) {
+          throw new NewsPendingError(
+            (err.response.data && err.response.data.message) ||
+              "뉴스를 준비하는 중입니다.",
+            Number(err.response.headers["retry-after"]) || 5
+          );
+        }
+        throw err;
+      });
+
+    if (!response.data.success) {
+      throw new Error(
+        response.data.message || "데이터 로딩 중 오류가 발생했습니다."
+      );
+    }
+    const data =
+      response.data.format === "columnar"
+        ? decodeColumnar(response.data.data)
+        : response.data.data || [];
+    if (!signal.aborted) {
+      setNewsData(data);
+    }
+    return { count: data.length, freshness: response.data.freshness };
+  }, []);
 
   // 뉴스 데이터 로딩
-  const fetchNews = useCallback(async (params, isBackground = false) => {
-    try {
-      if (!isBackground) {
-        setLoading(true);
-        setError(null);
+  const fetchNews = useCallback(
+    async (params, isBackground = false) => {
+      // 백그라운드 새로고침은 진행 중인 요청이 있으면 건너뜀
+      if (isBackground && fetchControllerRef.current) return;
+      // 이전 요청이 아직 진행 중이면 취소 (날짜를 빠르게 바꿀 때 늦게 온 응답이 덮어쓰지 않도록)
+      if (fetchControllerRef.current) {
+        fetchControllerRef.current.abort();
       }
+      const controller = new AbortController();
+      fetchControllerRef.current = controller;
+      clearTimeout(revalidateTimerRef.current);
+
+      try {
+        if (!isBackground) {
+          setLoading(true);
+          setError(null);
+        }
 
-      const response = await axios.get("/api/news", { params });
+        // 화면에 바로 채울 필요가 없는 백그라운드 새로고침은 작은 열 형식 응답 사용
+        const canStream =
+          typeof ReadableStream !== "undefined" && typeof TextDecoder !== "undefined";
+        const { count, freshness } =
+          canStream && !isBackground
+            ? await fetchNewsStream(params, controller.signal)
+            : await fetchNewsJson(params, controller.signal);
 
-      if (response.data.success) {
-        setNewsData(response.data.data || []);
         if (!isBackground) {
-          console.log(
-            "📊 뉴스 데이터 업데이트됨:",
-            response.data.data.length,
-            "개"
+          console.log("📊 뉴스 데이터 업데이트됨:", count, "개", freshness);
+        }
+        // 만료/일부 결과는 서버가 뒤에서 갱신 중이므로 잠시 후 조용히 다시 불러옴
+        if (freshness === "stale" || freshness === "partial") {
+          revalidateTimerRef.current = setTimeout(
+            () => fetchNewsRef.current(searchParamsRef.current, true),
+            REVALIDATE_DELAY
           );
         }
-      } else {
-        throw new Error(
-          response.data.message || "데이터 로딩 중 오류가 발생했습니다."
-        );
-      }
-    } catch (err) {
-      console.error("뉴스 데이터 로딩 실패:", err);
-      if (!isBackground) {
-        setError(err.message || "데이터를 가져오는 중 오류가 발생했습니다.");
-      }
-    } finally {
-      if (!isBackground) {
-        setLoading(false);
+      } catch (err) {
+        if (controller.signal.aborted) return;
+        if (err instanceof NewsPendingError) {
+          // 서버가 조회를 계속하고 있으므로 알려준 시간 뒤 다시 요청
+          revalidateTimerRef.current = setTimeout(
+            () => fetchNewsRef.current(searchParamsRef.current, isBackground),
+            err.retryAfter * 1000
+          );
+        }
+        console.error("뉴스 데이터 로딩 실패:", err);
+        if (!isBackground) {
+          setError(err.message || "데이터를 가져오는 중 오류가 발생했습니다.");
+        }
+      } finally {
+        if (fetchControllerRef.current === controller) {
+          fetchControllerRef.current = null;
+          if (!isBackground) {
+            setLoading(false);
+          }
+        }
       }
-    }
-  }, []);
+    },
+    [fetchNewsStream, fetchNewsJson]
+  );
 
   // 사용자 활동 감지
   const updateActivity = useCallback(() => {
@@ -133,40 +282,75 @@ export const useNewsData = (searchParams, currentFilter) => {
     return newsData;
   }, [newsData, currentFilter]);
 
+  // SSE 재동기화/재검증 시 사용할 최신 검색 조건과 로딩 함수
+  useEffect(() => {
+    searchParamsRef.current = searchParams;
+  }, [searchParams]);
+
+  useEffect(() => {
+    fetchNewsRef.current = fetchNews;
+    return () => clearTimeout(revalidateTimerRef.current);
+  }, [fetchNews]);
+
   // Server-Sent Events 설정
   useEffect(() => {
-    // SSE 연결 설정
+    let reconnectTimer = null;
+
+    // SSE 연결 설정 (재연결 시 마지막으로 받은 이벤트 ID부터 이어받기)
     const connectSSE = () => {
       if (eventSourceRef.current) {
         eventSourceRef.current.close();
       }
 
       console.log("🔗 실시간 업데이트 연결 중...");
-      eventSourceRef.current = new EventSource("/api/events");
+      const url = lastEventIdRef.current
+        ? `/api/events?last_event_id=${lastEventIdRef.current}`
+        : "/api/events";
+      eventSourceRef.current = new EventSource(url);
+
+      // 실시간 이벤트 목록을 뉴스 목록에 한 번에 반영
+      const applyUpdateEvents = (events) => {
+        const changes = {};
+        events.forEach((updateEvent) => {
+          const newsId = updateEvent.data && updateEvent.data.news_id;
+          if (!newsId) return;
+          if (updateEvent.type === "status_change") {
+            // 상태 변경 실시간 반영
+            changes[newsId] = {
+              ...changes[newsId],
+              status: updateEvent.data.status,
+            };
+          } else if (updateEvent.type === "ai_content_generated") {
+            // AI 콘텐츠 생성 실시간 반영 (실제 콘텐츠는 클릭 시 로드)
+            changes[newsId] = { ...changes[newsId], has_content: true };
+          }
+        });
+        if (Object.keys(changes).length === 0) return;
+        setNewsData((prevData) =>
+          prevData.map((item) =>
+            changes[item.news_id] ? { ...item, ...changes[item.news_id] } : item
+          )
+        );
+      };
 
       eventSourceRef.current.onmessage = (event) => {
         try {
           const updateEvent = JSON.parse(event.data);
           console.log("📡 실시간 업데이트 수신:", updateEvent);
+          if (event.lastEventId) {
+            lastEventIdRef.current = event.lastEventId;
+          }
 
-          if (updateEvent.type === "status_change") {
-            // 상태 변경 실시간 반영
-            setNewsData((prevData) =>
-              prevData.map((item) =>
-                item.news_id === updateEvent.data.news_id
-                  ? { ...item, status: updateEvent.data.status }
-                  : item
-              )
-            );
-          } else if (updateEvent.type === "ai_content_generated") {
-            // AI 콘텐츠 생성 실시간 반영
-            setNewsData((prevData) =>
-              prevData.map((item) =>
-                item.news_id === updateEvent.data.news_id
-                  ? { ...item, ai_content: "생성됨" } // 실제 콘텐츠는 클릭 시 로드
-                  : item
-              )
-            );
+          if (updateEvent.type === "resync") {
+            // 놓친 이벤트가 있으면 전체 데이터를 다시 불러옴
+            fetchNews(searchParamsRef.current, true);
+          } else {
+            // 배치 메시지는 포함된 이벤트를 한 번의 상태 갱신으로 반영
+            const events =
+              updateEvent.type === "batch"
+                ? updateEvent.data.events
+                : [updateEvent];
+            applyUpdateEvents(events);
           }
         } catch (error) {
           console.error("SSE 이벤트 파싱 오류:", error);
@@ -176,7 +360,9 @@ export const useNewsData = (searchParams, currentFilter) => {
       eventSourceRef.current.onerror = (error) => {
         console.error("SSE 연결 오류:", error);
         // 5초 후 재연결 시도
-        setTimeout(connectSSE, 5000);
+        eventSourceRef.current.close();
+        clearTimeout(reconnectTimer);
+        reconnectTimer = setTimeout(connectSSE, 5000);
       };
 
       eventSourceRef.current.onopen = () => {
@@ -188,11 +374,12 @@ export const useNewsData = (searchParams, currentFilter) => {
 
     // 컴포넌트 언마운트 시 정리
     return () => {
+      clearTimeout(reconnectTimer);
       if (eventSourceRef.current) {
         eventSourceRef.current.close();
       }
     };
-  }, []);
+  }, [fetchNews]);
 
   // 기존 자동 새로고침도 유지 (백업용)
   useEffect(() => {